@@ -6,38 +6,277 @@ Handles normalization requests and returns normalized text, SSML, and DFA info
 Endpoints:
     POST /api/normalize       — Manual mode (existing)
     POST /api/auto-normalize  — Auto Detect mode (hybrid ML + Rule)
+    POST /api/sessions        — Start an incremental editing session (Auto Detect mode)
+    GET  /api/sessions/<id>   — Full output for the session's current text
+    POST /api/sessions/<id>/edits
+                              — Apply one edit; returns only the changed output
+    DELETE /api/sessions/<id> — End a session
     POST /api/train           — Train ML model for a language
     GET  /api/model-status    — Check trained model availability
-    GET  /api/health          — Health check
+    GET  /api/health          — Health check (503 until warm-up has finished)
+    GET  /metrics             — Prometheus metrics (requests, latency, pipeline stages)
+    GET  /api/debug/hotspots  — Aggregated stage / normalizer timings (if enabled)
+    GET  /api/debug/profiles  — Recent cProfile samples (if enabled)
+    GET  /api/memory          — Memory retained by the cached engines per language
+    GET  /api/resources       — Resource file versions and hot-reload status
+
+Warm-up (at startup, before reporting ready):
+    TN_WARMUP_LANGUAGES   all (default) | comma-separated codes | none
+    TN_WARMUP_BACKGROUND  1 (default: serve while warming) | 0 (block startup)
+
+Long inputs to /api/auto-normalize (unset = always serial):
+    TN_PARALLEL_WORKERS   split inputs into sentence chunks across this many processes
+    TN_PARALLEL_MIN_CHARS only inputs at least this long (default 50000)
+
+Hot reload of resources/*.json (unset or 0 = off):
+    TN_RESOURCE_RELOAD_INTERVAL  poll for changed files every N seconds
+
+Engine cache (per registry; unset = unbounded):
+    TN_MAX_ENGINES        keep at most N languages loaded, evicting the least recently used
+    TN_ENGINE_IDLE_TTL    evict languages unused for this many seconds
+
+Serving:
+    python app.py                                   — development server
+    gunicorn -c gunicorn.conf.py "app:create_app(preload=True)"
+                                                    — pre-fork, shared memory
+    uvicorn asgi:app --workers 4                    — ASGI (see asgi.py)
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request
 from flask_cors import CORS
-from engine import NormalizationEngine
+from engine import NormalizationEngine, EngineRegistry
+from engine.fields import select_fields
+from engine.parallel import ParallelNormalizer, DEFAULT_MIN_CHARS
+from engine.session import SessionStore, DEFAULT_MAX_SESSIONS, DEFAULT_IDLE_TTL
+from normalizers import NumberToWordsConverter
+from ssml import SSML_MODES
+from resource_watcher import ResourceWatcher
+import language_pack
+import memory_report
+import metrics
+import profiling
+import serialization
+import gc
+import json
+import os
+import threading
+import time
 import traceback
 from pathlib import Path
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend communication
 
-# Cache engines per language to avoid reloading resources each request
-_engines = {}
-_hybrid_engines = {}
+# ── Response serialization ────────────────────────────────────────
+# JSON_BACKEND: orjson | ujson | json (default: fastest installed)
+# JSON_ENSURE_ASCII: escape non-ASCII text as \uXXXX (default: off)
+# RESPONSE_COMPRESS_MIN_BYTES: gzip/deflate bodies at least this big (0 = never)
+# An unknown TN_JSON_BACKEND fails here, not on every response
+app.config['JSON_BACKEND'] = serialization.check_backend(
+    os.environ.get('TN_JSON_BACKEND') or serialization.DEFAULT_BACKEND
+)
+app.config['JSON_ENSURE_ASCII'] = os.environ.get('TN_JSON_ENSURE_ASCII', '0') == '1'
+app.config['RESPONSE_COMPRESS_MIN_BYTES'] = int(os.environ.get('TN_COMPRESS_MIN_BYTES', '4096'))
+
+
+def json_response(payload, status=200):
+    """Serialize payload with the configured JSON backend, compressing large bodies."""
+    body = serialization.dumps(
+        payload,
+        backend=app.config['JSON_BACKEND'],
+        ensure_ascii=app.config['JSON_ENSURE_ASCII'],
+    )
+    body, encoding = serialization.compress(
+        body,
+        request.headers.get('Accept-Encoding', ''),
+        min_bytes=app.config['RESPONSE_COMPRESS_MIN_BYTES'],
+    )
+    response = Response(body, status=status, mimetype='application/json')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+        response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+
+def _build_engine(language):
+    return NormalizationEngine(language=language)
+
+
+def _build_hybrid_engine(language):
+    from engine.hybrid_engine import HybridEngine
+    return HybridEngine(language=language)
+
+
+def _env_number(name, cast):
+    value = os.environ.get(name, '').strip()
+    return cast(value) if value else None
+
+
+def _release_language(language, engine):
+    """Drop the shared converter tables once neither registry holds the language."""
+    if language not in _engines and language not in _hybrid_engines:
+        NumberToWordsConverter.release(language)
+
+
+# Cache engines per language to avoid reloading resources each request.
+# Thread-safe: lock-free reads, single-flight construction per language.
+# Bounded by TN_MAX_ENGINES (per registry, LRU) and TN_ENGINE_IDLE_TTL (seconds).
+_engines = EngineRegistry(
+    _build_engine,
+    max_engines=_env_number('TN_MAX_ENGINES', int),
+    idle_ttl=_env_number('TN_ENGINE_IDLE_TTL', float),
+    on_evict=_release_language,
+    on_build=lambda language, engine: _check_memory_budget(),
+)
+_hybrid_engines = EngineRegistry(
+    _build_hybrid_engine,
+    max_engines=_env_number('TN_MAX_ENGINES', int),
+    idle_ttl=_env_number('TN_ENGINE_IDLE_TTL', float),
+    on_evict=_release_language,
+    on_build=lambda language, engine: _check_memory_budget(),
+)
+
+# ── Memory budget ─────────────────────────────────────────────────
+# TN_MEMORY_BUDGET_MB: warn when the cached engines' retained size exceeds it
+MEMORY_BUDGET_MB = _env_number('TN_MEMORY_BUDGET_MB', float)
+_memory_state = {'warning': None}
+
+
+def resident_memory():
+    """Retained bytes of the cached engines, per language."""
+    per_language = {}
+    for language in sorted(set(_engines.languages()) | set(_hybrid_engines.languages())):
+        engines = [
+            engine for engine in (_engines.peek(language), _hybrid_engines.peek(language))
+            if engine is not None
+        ]
+        per_language[language] = memory_report.engine_footprint(engines)
+    return per_language
+
+
+def _check_memory_budget():
+    """Log (once per crossing) when the engines outgrow MEMORY_BUDGET_MB."""
+    if not MEMORY_BUDGET_MB:
+        return
+    warning = memory_report.budget_warning(sum(resident_memory().values()), MEMORY_BUDGET_MB)
+    if warning and not _memory_state['warning']:
+        print(f"WARNING: {warning}")
+    _memory_state['warning'] = warning
+
+
+# ── Intra-request parallelism ─────────────────────────────────────
+# TN_PARALLEL_WORKERS    split long auto-normalize inputs across this many
+#                        processes (unset or < 2: always serial)
+# TN_PARALLEL_MIN_CHARS  only inputs at least this long (default 50000)
+_parallel = None
+if (_env_number('TN_PARALLEL_WORKERS', int) or 0) > 1:
+    _parallel = ParallelNormalizer(
+        workers=_env_number('TN_PARALLEL_WORKERS', int),
+        min_chars=_env_number('TN_PARALLEL_MIN_CHARS', int) or DEFAULT_MIN_CHARS,
+    )
+
+
+# ── Editing sessions ──────────────────────────────────────────────
+# TN_MAX_SESSIONS       keep at most N sessions, dropping the least recently used
+# TN_SESSION_IDLE_TTL   drop sessions unused for this many seconds (default 1800)
+_sessions = SessionStore(
+    max_sessions=_env_number('TN_MAX_SESSIONS', int) or DEFAULT_MAX_SESSIONS,
+    idle_ttl=_env_number('TN_SESSION_IDLE_TTL', float) or DEFAULT_IDLE_TTL,
+)
+
+
+# ── Resource hot reload ───────────────────────────────────────────
+# TN_RESOURCE_RELOAD_INTERVAL  poll resources/*.json every N seconds
+#                              (unset or 0: off; files are read at startup only)
+RESOURCE_RELOAD_INTERVAL = _env_number('TN_RESOURCE_RELOAD_INTERVAL', float)
+
+
+def reload_language(language):
+    """
+    Rebuild a language's engines from its changed resource file.
+
+    The file is validated and its pack rebuilt first; if that fails the
+    running engines stay as they are. New engines are built (with their
+    own converter tables) while requests keep using the old ones, then
+    swapped into both registries. Other languages are untouched, except
+    that the parallel pool restarts so its workers reload too. Open
+    editing sessions keep the engine they started with.
+    """
+    language_pack.refresh(language)
+    NumberToWordsConverter.release(language)
+    fresh = [
+        (registry, build(language))
+        for registry, build in ((_engines, _build_engine), (_hybrid_engines, _build_hybrid_engine))
+        if language in registry
+    ]
+    for registry, engine in fresh:
+        registry.replace(language, engine)
+    if _parallel is not None:
+        _parallel.restart()
+
+
+def model_updated(language):
+    """
+    Make every hybrid engine for `language` load its retrained model: drop
+    the cached one and restart the parallel pool, whose workers keep their own.
+    """
+    _hybrid_engines.discard(language)
+    if _parallel is not None:
+        _parallel.restart()
+
+
+_resource_watcher = ResourceWatcher(reload_language, interval=RESOURCE_RELOAD_INTERVAL or 2.0)
+
+
+@app.before_request
+def _ensure_resource_watcher():
+    """Start polling in this process (also in forked workers: threads don't survive fork)."""
+    if RESOURCE_RELOAD_INTERVAL and not _resource_watcher.running:
+        _resource_watcher.start()
+
+
+def _language_code(language):
+    """Language codes come from JSON bodies; anything but a string is unknown."""
+    if not isinstance(language, str):
+        raise FileNotFoundError(f'No resources for language {language!r}')
+    return language
 
 
 def get_engine(language='hi-IN'):
     """Get or create a NormalizationEngine for the given language."""
-    if language not in _engines:
-        _engines[language] = NormalizationEngine(language=language)
-    return _engines[language]
+    return _engines.get(_language_code(language))
 
 
 def get_hybrid_engine(language='hi-IN'):
     """Get or create a HybridEngine for the given language."""
-    from engine.hybrid_engine import HybridEngine
-    if language not in _hybrid_engines:
-        _hybrid_engines[language] = HybridEngine(language=language)
-    return _hybrid_engines[language]
+    return _hybrid_engines.get(_language_code(language))
+
+
+def invalid_ssml_mode(ssml_mode):
+    """Return a 400 response if the requested SSML mode is unknown, else None."""
+    if ssml_mode in SSML_MODES:
+        return None
+    return json_response({
+        'success': False,
+        'error': f'Invalid ssml mode "{ssml_mode}". Choose from: {list(SSML_MODES)}'
+    }), 400
+
+
+def requested_fields(data, available):
+    """
+    Read the optional "fields" (alias "include") selection from a request.
+
+    Returns:
+        (fields, error_response) — fields is None when everything is wanted
+    """
+    fields = data.get('fields', data.get('include'))
+    if fields is None:
+        return None, None
+    try:
+        select_fields(fields, available)
+    except ValueError as e:
+        return None, (json_response({'success': False, 'error': str(e)}), 400)
+    return fields, None
 
 
 def get_available_languages():
@@ -46,8 +285,229 @@ def get_available_languages():
     return sorted(f.stem for f in resources_dir.glob('*.json'))
 
 
-# Pre-initialize default engine
-get_engine('hi-IN')
+ALL_CATEGORIES = [
+    'currency', 'cardinal', 'unit', 'date',
+    'time', 'ordinal', 'named_entity',
+]
+
+# Synthetic inputs that exercise every DFA / normalizer path
+_WARMUP_TEXTS = [
+    '₹1,250.50 15/08/2024 10:30 PM 14:45:30 5kg 2.5km 21st 12345',
+    '₹5 1/1/99 7:05 AM 100ml 1st 0',
+]
+_WARMUP_SAMPLES_PER_LANGUAGE = 3
+
+_warmup_lock = threading.Lock()
+_warmup_done = threading.Event()
+_warmup_state = {
+    'started': False,
+    'ready': False,
+    'languages': [],
+    'errors': {},
+    'seconds': None,
+}
+
+
+def _warmup_texts(language):
+    """Synthetic inputs plus a few real sentences from the training data."""
+    texts = list(_WARMUP_TEXTS)
+    path = Path(__file__).parent / 'training_data' / f'{language}_training.json'
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            samples = json.load(f).get('samples', [])
+        texts.extend(s['text'] for s in samples[:_WARMUP_SAMPLES_PER_LANGUAGE])
+    return texts
+
+
+def warm_up(languages=None):
+    """
+    Build engines for `languages` (default: all) and run synthetic inputs
+    through the manual and hybrid pipelines, so resource parsing, DFA
+    construction, model loading and first-call costs are paid before any
+    user request. Marks the service ready when done.
+    """
+    started = time.perf_counter()
+    languages = get_available_languages() if languages is None else languages
+    # Synthetic warm-up traffic must not skew token counts, stage latencies
+    # or hotspots; requests served meanwhile on other threads still count
+    with metrics.excluded():
+        for language in languages:
+            try:
+                engine = get_engine(language)
+                hybrid = get_hybrid_engine(language)
+                for text in _warmup_texts(language):
+                    engine.normalize(text, ALL_CATEGORIES)
+                    hybrid.normalize(text)
+                _warmup_state['languages'].append(language)
+            except Exception as e:
+                print(f"Warm-up failed for {language}: {str(e)}")
+                traceback.print_exc()
+                _warmup_state['errors'][language] = str(e)
+    _warmup_state['seconds'] = round(time.perf_counter() - started, 3)
+    _warmup_state['ready'] = True
+    _warmup_done.set()
+
+
+def start_warm_up(background=None):
+    """
+    Start warm-up once, as configured by TN_WARMUP_LANGUAGES and
+    TN_WARMUP_BACKGROUND (unless `background` is given explicitly).
+    """
+    with _warmup_lock:
+        if _warmup_state['started']:
+            return
+        _warmup_state['started'] = True
+
+    setting = os.environ.get('TN_WARMUP_LANGUAGES', 'all').strip()
+    if setting in ('', 'none'):
+        languages = []
+    elif setting == 'all':
+        languages = None
+    else:
+        languages = [lang.strip() for lang in setting.split(',') if lang.strip()]
+
+    if background is None:
+        background = os.environ.get('TN_WARMUP_BACKGROUND', '1') == '1'
+    if background:
+        threading.Thread(
+            target=warm_up, args=(languages,), name='warm-up', daemon=True,
+        ).start()
+    else:
+        warm_up(languages)
+
+
+@app.before_request
+def _ensure_warm_up():
+    """Fallback for servers that load `app` directly instead of create_app()."""
+    if not _warmup_state['started']:
+        start_warm_up()
+
+
+# ── Request metrics ───────────────────────────────────────────────
+# Unknown language codes are reported as "other" to bound label cardinality.
+_KNOWN_LANGUAGES = frozenset(get_available_languages())
+
+
+def _metric_labels():
+    """(endpoint, language) labels for the current request."""
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    data = request.get_json(silent=True) if request.is_json else None
+    if not isinstance(data, dict):
+        return endpoint, ''
+    language = data.get('language', 'hi-IN')
+    known = isinstance(language, str) and language in _KNOWN_LANGUAGES
+    return endpoint, language if known else 'other'
+
+
+@app.before_request
+def _start_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def _record_request(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        endpoint, language = _metric_labels()
+        status = response.status_code
+        metrics.REQUEST_SECONDS.observe(time.perf_counter() - started, endpoint, language)
+        metrics.REQUESTS.inc(endpoint, language, str(status))
+        if status >= 400:
+            kind = 'server' if status >= 500 else 'client'
+            metrics.REQUEST_ERRORS.inc(endpoint, language, kind)
+    return response
+
+
+@metrics.register_collector
+def _engine_cache_metrics():
+    """Engine registry hits, misses, evictions and resident engines."""
+    registries = (('manual', _engines), ('hybrid', _hybrid_engines))
+    yield ('tn_engine_cache_lookups_total', 'counter',
+           'Engine cache lookups, by result.', [
+               sample
+               for name, registry in registries
+               for sample in (({'engine': name, 'result': 'hit'}, registry.hits),
+                              ({'engine': name, 'result': 'miss'}, registry.misses))
+           ])
+    yield ('tn_engine_cache_evictions_total', 'counter',
+           'Engines evicted from the cache.', [
+               ({'engine': name}, registry.evictions) for name, registry in registries
+           ])
+    yield ('tn_engine_cache_resident', 'gauge',
+           'Engines currently loaded.', [
+               ({'engine': name}, len(registry)) for name, registry in registries
+           ])
+
+
+# ── Profiling ─────────────────────────────────────────────────────
+# X-Debug-Timing: 1 adds a per-stage / per-normalizer "timing" breakdown
+# to normalize responses. Optional process-wide sinks:
+#   TN_PROFILE_SAMPLE_RATE  cProfile this fraction of requests (default 0)
+#   TN_PROFILE_DIR          also dump sampled profiles there as .prof files
+#   TN_PROFILE_HOTSPOTS     1 = aggregate time per stage / normalizer
+DEBUG_TIMING_HEADER = 'X-Debug-Timing'
+
+_profile_sampler = None
+if float(os.environ.get('TN_PROFILE_SAMPLE_RATE', '0') or 0) > 0:
+    _profile_sampler = profiling.add_sink(profiling.CProfileSampler(
+        rate=float(os.environ['TN_PROFILE_SAMPLE_RATE']),
+        directory=os.environ.get('TN_PROFILE_DIR') or None,
+    ))
+
+_hotspots = None
+if os.environ.get('TN_PROFILE_HOTSPOTS', '0') == '1':
+    _hotspots = profiling.add_sink(profiling.HotspotReport())
+
+
+@app.before_request
+def _start_profiling():
+    if request.headers.get(DEBUG_TIMING_HEADER, '').lower() in ('1', 'true', 'yes'):
+        g.timing = profiling.TimingBreakdown()
+        g.timing_token = profiling.push_request_sinks(g.timing)
+    endpoint, language = _metric_labels()
+    g.request_span = profiling.tracer('api', language).span('request', endpoint)
+    g.request_span.__enter__()
+
+
+@app.teardown_request
+def _stop_profiling(exc):
+    span = g.pop('request_span', None)
+    if span is not None:
+        span.__exit__(None, None, None)
+    if 'timing_token' in g:
+        profiling.pop_request_sinks(g.pop('timing_token'))
+
+
+def debug_timing():
+    """{'timing': breakdown} when the request asked for it, else {}."""
+    timing = g.get('timing')
+    return {'timing': timing.as_dict()} if timing is not None else {}
+
+
+def create_app(preload=False):
+    """
+    Application factory.
+
+    Args:
+        preload: Build every language pack and model synchronously, then
+                 move the whole heap into the GC's permanent generation
+                 (gc.freeze) so that forked workers share it copy-on-write
+                 instead of each re-parsing resources and unpickling models.
+                 Use with gunicorn's preload_app (see gunicorn.conf.py).
+
+    Returns:
+        The Flask app, with warm-up started (or finished, when preloading)
+    """
+    if preload:
+        start_warm_up(background=False)
+        _warmup_done.wait()  # in case a background warm-up was already running
+        # Collect garbage first so freed objects don't end up in frozen pages,
+        # then freeze so the cyclic GC never writes to the shared objects.
+        gc.collect()
+        gc.freeze()
+    else:
+        start_warm_up()
+    return app
 
 
 @app.route('/api/normalize', methods=['POST'])
@@ -59,47 +519,56 @@ def normalize_text():
     {
         "text": "Text to normalize",
         "categories": ["currency", "cardinal", ...],
-        "language": "hi-IN"   (optional, default: hi-IN)
+        "language": "hi-IN",  (optional, default: hi-IN)
+        "ssml": "full",       (optional: full | compact | none)
+        "fields": ["normalized_text"]
+                              (optional, alias "include"; default: all of
+                               normalized_text, ssml, dfa_info)
     }
+
+    With "ssml": "none" no markup is generated and the field is omitted.
+    Outputs not listed in "fields" are never built.
     """
     try:
         data = request.get_json()
 
         if not data or 'text' not in data:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'Missing required field: text'
             }), 400
 
         input_text = data['text']
-        categories = data.get('categories', [
-            'currency', 'cardinal', 'unit', 'date',
-            'time', 'ordinal', 'named_entity',
-        ])
+        categories = data.get('categories', ALL_CATEGORIES)
         language = data.get('language', 'hi-IN')
+        ssml_mode = data.get('ssml', 'full')
+        error = invalid_ssml_mode(ssml_mode)
+        if error:
+            return error
 
         try:
             engine = get_engine(language)
         except FileNotFoundError:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': f'Language "{language}" is not supported. '
                          f'Available: {get_available_languages()}'
             }), 400
 
-        result = engine.normalize(input_text, categories)
+        fields, error = requested_fields(data, NormalizationEngine.OUTPUT_FIELDS)
+        if error:
+            return error
 
-        return jsonify({
-            'success': True,
-            'normalized_text': result['normalized_text'],
-            'ssml': result['ssml'],
-            'dfa_info': result['dfa_info'],
-        })
+        result = engine.normalize(
+            input_text, categories, ssml_mode=ssml_mode, fields=fields,
+        )
+
+        return json_response({'success': True, **result, **debug_timing()})
 
     except Exception as e:
         print(f"Error during normalization: {str(e)}")
         traceback.print_exc()
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
         }), 500
@@ -116,7 +585,12 @@ def auto_normalize_text():
     Expected JSON payload:
     {
         "text": "Text to normalize",
-        "language": "hi-IN"   (optional, default: hi-IN)
+        "language": "hi-IN",  (optional, default: hi-IN)
+        "ssml": "full",       (optional: full | compact | none)
+        "fields": ["normalized_text"]
+                              (optional, alias "include"; default: all of
+                               normalized_text, ssml, token_details,
+                               pipeline_summary)
     }
 
     Returns:
@@ -127,47 +601,202 @@ def auto_normalize_text():
         "token_details": [...],
         "pipeline_summary": {...}
     }
+    (only the selected fields are present)
     """
     try:
         data = request.get_json()
 
         if not data or 'text' not in data:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'Missing required field: text'
             }), 400
 
         input_text = data['text']
         language = data.get('language', 'hi-IN')
+        ssml_mode = data.get('ssml', 'full')
+        error = invalid_ssml_mode(ssml_mode)
+        if error:
+            return error
 
         try:
             engine = get_hybrid_engine(language)
         except FileNotFoundError:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': f'Language "{language}" is not supported. '
                          f'Available: {get_available_languages()}'
             }), 400
 
-        result = engine.normalize(input_text)
+        fields, error = requested_fields(data, engine.OUTPUT_FIELDS)
+        if error:
+            return error
 
-        return jsonify({
-            'success': True,
-            'normalized_text': result['normalized_text'],
-            'ssml': result['ssml'],
-            'token_details': result['token_details'],
-            'pipeline_summary': result['pipeline_summary'],
-        })
+        if _parallel is not None and _parallel.applies(input_text):
+            result = _parallel.normalize(engine, input_text, ssml_mode=ssml_mode, fields=fields)
+        else:
+            result = engine.normalize(input_text, ssml_mode=ssml_mode, fields=fields)
+
+        return json_response({'success': True, **result, **debug_timing()})
 
     except Exception as e:
         print(f"Error during auto-normalization: {str(e)}")
         traceback.print_exc()
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
         }), 500
 
 
+@app.route('/api/sessions', methods=['POST'])
+def create_session():
+    """
+    Start an incremental editing session for a document (Auto Detect mode).
+
+    Expected JSON payload: same as /api/auto-normalize.
+
+    Returns the /api/auto-normalize response plus "session_id" and
+    "revision" (0). Send edits to /api/sessions/<session_id>/edits.
+    """
+    try:
+        data = request.get_json()
+
+        if not data or 'text' not in data:
+            return json_response({
+                'success': False,
+                'error': 'Missing required field: text'
+            }), 400
+
+        language = data.get('language', 'hi-IN')
+        ssml_mode = data.get('ssml', 'full')
+        error = invalid_ssml_mode(ssml_mode)
+        if error:
+            return error
+
+        try:
+            engine = get_hybrid_engine(language)
+        except FileNotFoundError:
+            return json_response({
+                'success': False,
+                'error': f'Language "{language}" is not supported. '
+                         f'Available: {get_available_languages()}'
+            }), 400
+
+        fields, error = requested_fields(data, engine.OUTPUT_FIELDS)
+        if error:
+            return error
+
+        session_id, session = _sessions.create(engine, data['text'])
+        with session.lock:
+            result = session.output(ssml_mode, fields)
+            return json_response({
+                'success': True, 'session_id': session_id, **result, **debug_timing(),
+            })
+
+    except Exception as e:
+        print(f"Error creating session: {str(e)}")
+        traceback.print_exc()
+        return json_response({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+def _unknown_session(session_id):
+    return json_response({
+        'success': False,
+        'error': f'Unknown or expired session "{session_id}"'
+    }), 404
+
+
+@app.route('/api/sessions/<session_id>', methods=['GET'])
+def session_output(session_id):
+    """
+    Full output for the session's current text.
+
+    Query params:
+        ssml (optional):   full | compact | none
+        fields (optional): comma-separated subset of the output fields
+    """
+    session = _sessions.get(session_id)
+    if session is None:
+        return _unknown_session(session_id)
+    ssml_mode = request.args.get('ssml', 'full')
+    error = invalid_ssml_mode(ssml_mode)
+    if error:
+        return error
+    fields, error = requested_fields(request.args, session.engine.OUTPUT_FIELDS)
+    if error:
+        return error
+    with session.lock:
+        return json_response({
+            'success': True, 'session_id': session_id, **session.output(ssml_mode, fields),
+        })
+
+
+@app.route('/api/sessions/<session_id>/edits', methods=['POST'])
+def edit_session(session_id):
+    """
+    Apply one edit to a session's text and re-detect only what it affects.
+
+    Expected JSON payload:
+    {
+        "start": 120,          (character offset into the current text)
+        "end": 124,            (end of the replaced span; start == end inserts)
+        "text": "₹500",        (replacement, "" deletes)
+        "revision": 3          (optional: reject with 409 unless current)
+    }
+
+    Returns:
+    {
+        "success": true,
+        "revision": 4,
+        "tokens":  {"start": i, "end": j, "details": [...]},
+                   (token_details[i:j] of the previous revision → details)
+        "segment": {"start": a, "end": b, "text": "..."},
+                   (normalized_text[a:b] of the previous revision → text)
+        "reanalyzed": 7
+    }
+    """
+    session = _sessions.get(session_id)
+    if session is None:
+        return _unknown_session(session_id)
+
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not isinstance(data.get('text'), str) \
+            or not isinstance(data.get('start'), int) or not isinstance(data.get('end'), int):
+        return json_response({
+            'success': False,
+            'error': 'Expected JSON with integer "start", "end" and string "text"'
+        }), 400
+
+    with session.lock:
+        revision = data.get('revision')
+        if revision is not None and revision != session.revision:
+            return json_response({
+                'success': False,
+                'error': f'Edit is against revision {revision}, '
+                         f'session is at revision {session.revision}',
+                'revision': session.revision,
+            }), 409
+        try:
+            result = session.edit(data['start'], data['end'], data['text'])
+        except ValueError as e:
+            return json_response({'success': False, 'error': str(e)}), 400
+        # Serialize before releasing the lock: later edits shift offsets in place
+        return json_response({
+            'success': True, 'session_id': session_id, **result, **debug_timing(),
+        })
+
+
+@app.route('/api/sessions/<session_id>', methods=['DELETE'])
+def delete_session(session_id):
+    """End a session and free its state."""
+    if not _sessions.discard(session_id):
+        return _unknown_session(session_id)
+    return json_response({'success': True, 'session_id': session_id})
+
+
 @app.route('/api/train', methods=['POST'])
 def train_model():
     """
@@ -188,11 +817,9 @@ def train_model():
         trainer = ModelTrainer(language=language, model_type=model_type)
         results = trainer.run()
 
-        # Clear cached hybrid engine so it reloads the new model
-        if language in _hybrid_engines:
-            del _hybrid_engines[language]
+        model_updated(language)
 
-        return jsonify({
+        return json_response({
             'success': True,
             'accuracy': results['accuracy'],
             'n_train': results['n_train'],
@@ -200,13 +827,13 @@ def train_model():
             'n_features': results['n_features'],
             'model_path': results['model_path'],
             'feature_importance': [
-                {'feature': name, 'importance': round(score, 4)}
+                {'feature': name, 'importance': round(float(score), 4)}
                 for name, score in results.get('feature_importance', [])
             ],
         })
 
     except FileNotFoundError as e:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
         }), 404
@@ -214,7 +841,7 @@ def train_model():
     except Exception as e:
         print(f"Error during training: {str(e)}")
         traceback.print_exc()
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
         }), 500
@@ -244,7 +871,7 @@ def model_status():
                 'available_models': available,
             }
 
-        return jsonify({
+        return json_response({
             'success': True,
             'model_status': status,
         })
@@ -252,24 +879,104 @@ def model_status():
     except Exception as e:
         print(f"Error checking model status: {str(e)}")
         traceback.print_exc()
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
         }), 500
 
 
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Prometheus text-format metrics for this worker process."""
+    return Response(metrics.render(), mimetype=None, content_type=metrics.CONTENT_TYPE)
+
+
+@app.route('/api/debug/hotspots', methods=['GET'])
+def hotspots():
+    """Aggregated time per pipeline stage and normalizer (TN_PROFILE_HOTSPOTS=1)."""
+    if _hotspots is None:
+        return json_response({
+            'success': False,
+            'error': 'Hotspot profiling is disabled (set TN_PROFILE_HOTSPOTS=1)'
+        }), 404
+    top = request.args.get('top', 20, type=int)
+    return json_response({'success': True, 'hotspots': _hotspots.report(top)})
+
+
+@app.route('/api/debug/profiles', methods=['GET'])
+def sampled_profiles():
+    """cProfile summaries of recently sampled requests (TN_PROFILE_SAMPLE_RATE)."""
+    if _profile_sampler is None:
+        return json_response({
+            'success': False,
+            'error': 'Request sampling is disabled (set TN_PROFILE_SAMPLE_RATE)'
+        }), 404
+    return json_response({'success': True, 'profiles': _profile_sampler.recent()})
+
+
+@app.route('/api/memory', methods=['GET'])
+def memory_usage():
+    """
+    Retained memory of the cached engines per language (manual + hybrid,
+    shared converter counted once), with the TN_MEMORY_BUDGET_MB check.
+    Use `python -m memory_report` for the per-piece breakdown.
+    """
+    per_language = resident_memory()
+    total = sum(per_language.values())
+    warning = memory_report.budget_warning(total, MEMORY_BUDGET_MB)
+    return json_response({
+        'success': True,
+        'languages': {
+            language: round(size / memory_report.MB, 3)
+            for language, size in per_language.items()
+        },
+        'total_mb': round(total / memory_report.MB, 3),
+        'budget_mb': MEMORY_BUDGET_MB,
+        'warning': warning,
+    })
+
+
+@app.route('/api/resources', methods=['GET'])
+def resource_status():
+    """Version of each language's resource file and the hot-reload status."""
+    return json_response({
+        'success': True,
+        'hot_reload': bool(RESOURCE_RELOAD_INTERVAL),
+        'interval_seconds': RESOURCE_RELOAD_INTERVAL,
+        'languages': _resource_watcher.status(),
+    })
+
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
-    """Health check endpoint."""
-    return jsonify({
-        'status': 'healthy',
+    """
+    Health check endpoint.
+
+    Returns 503 with status "warming_up" until the startup warm-up has
+    finished, so load balancers only route traffic to warm workers.
+    """
+    ready = _warmup_state['ready']
+    return json_response({
+        'status': 'healthy' if ready else 'warming_up',
+        'ready': ready,
+        'warmup': {
+            'languages': list(_warmup_state['languages']),
+            'errors': dict(_warmup_state['errors']),
+            'seconds': _warmup_state['seconds'],
+        },
+        'engines': {
+            'manual': _engines.stats(),
+            'hybrid': _hybrid_engines.stats(),
+        },
+        'sessions': len(_sessions),
+        'resources': {
+            language: {'version': entry['version'], 'status': entry['status']}
+            for language, entry in _resource_watcher.status().items()
+        },
         'available_languages': get_available_languages(),
-        'available_categories': [
-            'currency', 'cardinal', 'unit', 'date',
-            'time', 'ordinal', 'named_entity',
-        ],
+        'available_categories': ALL_CATEGORIES,
         'modes': ['manual', 'auto_detect'],
-    })
+    }, 200 if ready else 503)
 
 
 if __name__ == '__main__':
@@ -278,4 +985,4 @@ if __name__ == '__main__':
     print(f"Available languages: {', '.join(langs)}")
     print(f"Modes: Manual | Auto Detect (Hybrid ML + Rules)")
     print(f"Available at: http://localhost:5000")
-    app.run(debug=True, host='0.0.0.0', port=5003)
+    create_app().run(debug=True, host='0.0.0.0', port=5003)
@@ -0,0 +1,320 @@
+"""
+ASGI Entry Point
+
+Serves the Flask app (same routes, hooks and responses) from an ASGI
+server, so connections are held by the event loop instead of by worker
+threads. Request bodies are read asynchronously; only the normalization
+itself runs on a bounded thread pool.
+
+    Slow clients / uploads    buffered on the event loop (up to TN_MAX_BODY_BYTES)
+    Normalization             TN_ASGI_THREADS pool threads run the Flask app
+    Backpressure              503 + Retry-After once TN_ASGI_MAX_PENDING requests
+                              are queued or running
+    Timeouts                  504 after TN_REQUEST_TIMEOUT seconds
+    Cancellation              a client disconnect or timeout drops a request that
+                              is still queued; one already running finishes in its
+                              thread and its result is discarded (it keeps its
+                              pending slot until then)
+
+Normalization is CPU-bound Python, so a pool larger than a few threads only
+adds queueing; scale CPU with worker processes.
+
+Usage (from backend/):
+    uvicorn asgi:app --port 5003 --workers 4
+    gunicorn -c gunicorn.conf.py -k uvicorn.workers.UvicornWorker \\
+        "asgi:create_app(preload=True)"
+
+Env:
+    TN_ASGI_THREADS       pool threads (default 4)
+    TN_ASGI_MAX_PENDING   queued + running requests before 503 (default 16 × threads)
+    TN_REQUEST_TIMEOUT    seconds, 0 = no timeout (default 30)
+    TN_MAX_BODY_BYTES     larger bodies get 413 (default 1 MiB)
+"""
+
+import asyncio
+import io
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import metrics
+from app import app as flask_app, create_app as create_flask_app, start_warm_up
+
+DEFAULT_THREADS = 4
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_BODY_BYTES = 1024 * 1024
+
+REJECTED = metrics.counter(
+    'tn_asgi_rejected_total',
+    'Requests the ASGI adapter answered itself, by reason '
+    '(overloaded, timeout, too_large) or dropped (disconnected).',
+    ('reason',),
+)
+
+
+class WSGIAdapter:
+    """
+    ASGI application running a WSGI app on a bounded thread pool.
+
+    Args:
+        wsgi_app:       The WSGI callable (the Flask app)
+        threads:        Pool size
+        max_pending:    Requests queued or running before answering 503
+        timeout:        Seconds before answering 504 (None: wait forever)
+        max_body_bytes: Request bodies above this get 413
+        on_startup:     Optional callable run on the pool at lifespan startup
+    """
+
+    def __init__(self, wsgi_app, threads=DEFAULT_THREADS, max_pending=None,
+                 timeout=DEFAULT_TIMEOUT, max_body_bytes=DEFAULT_MAX_BODY_BYTES,
+                 on_startup=None):
+        self.wsgi_app = wsgi_app
+        self.threads = threads
+        self.max_pending = max_pending or threads * 16
+        self.timeout = timeout or None
+        self.max_body_bytes = max_body_bytes
+        self.on_startup = on_startup
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='asgi')
+        # A slot is held from submission until the pool is done with the
+        # request, so abandoned-but-running work still counts as load.
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    @property
+    def pending(self):
+        """Requests currently queued or running on the pool."""
+        return self._pending
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._http(scope, receive, send)
+        else:
+            raise RuntimeError(f"Unsupported ASGI scope type: {scope['type']!r}")
+
+    # ── HTTP ──────────────────────────────────────────────────────
+
+    async def _http(self, scope, receive, send):
+        try:
+            body = await self._read_body(scope, receive)
+        except _Disconnected:
+            REJECTED.inc('disconnected')
+            return
+        if body is None:
+            REJECTED.inc('too_large')
+            await _send_error(send, 413, 'Request body too large')
+            return
+
+        if not self._slots.acquire(blocking=False):
+            REJECTED.inc('overloaded')
+            await _send_error(send, 503, 'Server overloaded, retry shortly',
+                              [(b'retry-after', b'1')])
+            return
+        with self._pending_lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(self._run_wsgi, _environ(scope, body))
+        except RuntimeError:  # pool shut down
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+
+        response = asyncio.wrap_future(future)
+        disconnect = asyncio.ensure_future(_wait_for_disconnect(receive))
+        try:
+            done, _ = await asyncio.wait(
+                {response, disconnect}, timeout=self.timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            disconnect.cancel()
+
+        if response in done:
+            status, headers, chunks = response.result()
+            await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+            await send({'type': 'http.response.body', 'body': b''.join(chunks)})
+            return
+
+        future.cancel()
+        if disconnect in done:
+            REJECTED.inc('disconnected')
+            return
+        REJECTED.inc('timeout')
+        await _send_error(send, 504, f'Request timed out after {self.timeout:g}s')
+
+    def _release(self):
+        with self._pending_lock:
+            self._pending -= 1
+        self._slots.release()
+
+    async def _read_body(self, scope, receive):
+        """The whole request body, or None once it exceeds max_body_bytes."""
+        for name, value in scope.get('headers', ()):
+            if name == b'content-length' and value.isdigit() \
+                    and int(value) > self.max_body_bytes:
+                return None
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                raise _Disconnected
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if size > self.max_body_bytes:
+                return None
+            chunks.append(chunk)
+            if not message.get('more_body', False):
+                break
+        return b''.join(chunks)
+
+    def _run_wsgi(self, environ):
+        """Call the WSGI app on a pool thread; returns (status, headers, chunks)."""
+        started = {}
+
+        def start_response(status, headers, exc_info=None):
+            started['status'] = int(status.split(' ', 1)[0])
+            started['headers'] = [
+                (name.lower().encode('latin-1'), value.encode('latin-1'))
+                for name, value in headers
+            ]
+
+        result = self.wsgi_app(environ, start_response)
+        try:
+            chunks = [chunk for chunk in result if chunk]
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+        return started['status'], started['headers'], chunks
+
+    # ── Lifespan ──────────────────────────────────────────────────
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    if self.on_startup is not None:
+                        await asyncio.get_running_loop().run_in_executor(
+                            self._executor, self.on_startup,
+                        )
+                except Exception as e:
+                    await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+                    return
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+class _Disconnected(Exception):
+    """The client went away before sending the whole body."""
+
+
+async def _wait_for_disconnect(receive):
+    while (await receive())['type'] != 'http.disconnect':
+        pass
+
+
+async def _send_error(send, status, message, headers=()):
+    body = json.dumps({'success': False, 'error': message}).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(body)).encode('latin-1')),
+            *headers,
+        ],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+def _environ(scope, body):
+    """PEP 3333 environ for an ASGI HTTP scope."""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': str(server[0]),
+        'SERVER_PORT': str(server[1] if server[1] is not None else 80),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': str(client[0]),
+        'REMOTE_PORT': str(client[1]),
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope.get('headers', ()):
+        name = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if name == 'CONTENT_TYPE':
+            environ['CONTENT_TYPE'] = value
+            continue
+        if name == 'CONTENT_LENGTH':
+            continue
+        key = f'HTTP_{name}'
+        environ[key] = f'{environ[key]},{value}' if key in environ else value
+    return environ
+
+
+def _env_number(name, cast, default):
+    value = os.environ.get(name, '').strip()
+    return cast(value) if value else default
+
+
+_adapters = []
+
+
+def create_app(preload=False):
+    """
+    ASGI application factory; see app.create_app() for `preload`.
+
+    Without preloading, warm-up starts at lifespan startup (as configured
+    by TN_WARMUP_LANGUAGES / TN_WARMUP_BACKGROUND).
+    """
+    if preload:
+        create_flask_app(preload=True)
+    threads = _env_number('TN_ASGI_THREADS', int, DEFAULT_THREADS)
+    adapter = WSGIAdapter(
+        flask_app,
+        threads=threads,
+        max_pending=_env_number('TN_ASGI_MAX_PENDING', int, None),
+        timeout=_env_number('TN_REQUEST_TIMEOUT', float, DEFAULT_TIMEOUT),
+        max_body_bytes=_env_number('TN_MAX_BODY_BYTES', int, DEFAULT_MAX_BODY_BYTES),
+        on_startup=start_warm_up,
+    )
+    _adapters.append(adapter)
+    return adapter
+
+
+@metrics.register_collector
+def _asgi_metrics():
+    yield ('tn_asgi_pending_requests', 'gauge',
+           'Requests queued or running on the ASGI thread pool.',
+           [({}, sum(adapter.pending for adapter in _adapters))])
+
+
+def __getattr__(name):
+    """
+    `asgi:app` is built on first access, so servers using the create_app()
+    factory don't also get an unused module-level adapter and thread pool.
+    """
+    global app
+    if name == 'app':
+        app = create_app()
+        return app
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,7 @@
+"""
+Benchmarks Package — reproducible throughput and latency measurements.
+
+Usage (from backend/):
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --baseline bench.json --threshold 0.10
+"""
@@ -0,0 +1,84 @@
+"""
+Benchmark Corpora
+
+Deterministic inputs for the benchmark suite, per language:
+
+    synthetic  seeded sentences from CorpusBuilder (training templates
+               refilled with generated currencies, dates, units, ...)
+    training   the training sentences themselves, alone and joined
+
+Each corpus comes in short / medium / long variants (tokens per request).
+"""
+
+import json
+from pathlib import Path
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+TRAINING_DIR = _BACKEND_DIR / 'training_data'
+RESOURCES_DIR = _BACKEND_DIR / 'resources'
+
+# Tokens per request for the synthetic corpus
+SIZES = {'short': 10, 'medium': 100, 'long': 1000}
+
+# Inputs per corpus variant (requests cycle through them)
+INPUTS_PER_CORPUS = 8
+
+
+def available_languages():
+    return sorted(path.stem for path in RESOURCES_DIR.glob('*.json'))
+
+
+def load_samples(language):
+    """Training samples for `language` ([] when there is no training file)."""
+    path = TRAINING_DIR / f'{language}_training.json'
+    if not path.exists():
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('samples', [])
+
+
+def token_pools(language):
+    """Distinct training tokens grouped by labelled category."""
+    pools = {}
+    for sample in load_samples(language):
+        for token in sample.get('tokens', []):
+            pool = pools.setdefault(token['category'], [])
+            if token['token'] not in pool:
+                pool.append(token['token'])
+    return pools
+
+
+def synthetic(language, size, count=INPUTS_PER_CORPUS, seed=0):
+    """`count` inputs of SIZES[size] tokens, identical for a given seed."""
+    from benchmarks.corpus_builder import CorpusBuilder
+    builder = CorpusBuilder(language, seed=f'{seed}:{size}')
+    return [builder.text_of_length(SIZES[size]) for _ in range(count)]
+
+
+def training(language, size, count=INPUTS_PER_CORPUS):
+    """
+    Training sentences: one per input (short), ten joined (medium) or the
+    whole file joined (long).
+    """
+    texts = [sample['text'] for sample in load_samples(language)]
+    if not texts:
+        return []
+    per_input = {'short': 1, 'medium': 10, 'long': len(texts)}[size]
+    inputs = []
+    for i in range(count):
+        start = (i * per_input) % len(texts)
+        chunk = (texts[start:] + texts[:start])[:per_input]
+        inputs.append(' '.join(chunk))
+    return inputs
+
+
+def corpora(language, seed=0):
+    """{'synthetic-short': [...], ..., 'training-long': [...]} for one language."""
+    result = {}
+    for size in SIZES:
+        result[f'synthetic-{size}'] = synthetic(language, size, seed=seed)
+    for size in SIZES:
+        inputs = training(language, size)
+        if inputs:
+            result[f'training-{size}'] = inputs
+    return result
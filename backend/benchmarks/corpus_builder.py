@@ -0,0 +1,332 @@
+"""
+Synthetic Corpus Builder
+
+Generates arbitrarily large, labelled, deterministic corpora per language
+for benchmarks and soak tests.
+
+Detectable tokens are generated from the language resource: currency
+symbols, unit keys, named-entity abbreviations, ordinal suffixes (from the
+ordinal pattern's examples in the training data), dates and times. Each
+generated form is checked against the language's own DFA, so every token
+carries a correct label. Plain words come from the training sentences and
+the month names.
+
+Two modes:
+    templates (default)  training sentences with every labelled slot
+                         refilled, so the structure stays realistic
+    mix                  every token drawn from a category distribution,
+                         e.g. {'text': 0.6, 'currency': 0.2, 'date': 0.2}
+
+Usage (from backend/):
+    python -m benchmarks.corpus_builder --language hi-IN --tokens 1000000 > hi.txt
+    python -m benchmarks.corpus_builder --language all --tokens 50000 \\
+        --mix text=0.5,currency=0.25,time=0.25 --labels --output soak.jsonl
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(_BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(_BACKEND_DIR))
+
+import language_pack
+from dfa import (
+    CurrencyDFA, CardinalDFA, UnitDFA, DateDFA, TimeDFA, OrdinalDFA, NamedEntityDFA,
+)
+from benchmarks import corpora
+
+CATEGORIES = ('currency', 'cardinal', 'unit', 'date', 'time', 'ordinal', 'named_entity')
+
+_ENGLISH_SUFFIXES = ('st', 'nd', 'rd', 'th')
+_DATE_SEPARATORS = ('/', '-', '.')
+
+
+def parse_mix(text):
+    """'text=0.6,currency=0.2' → {'text': 0.6, 'currency': 0.2}"""
+    mix = {}
+    for part in text.split(','):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name != 'text' and name not in CATEGORIES:
+            raise ValueError(f"Unknown category '{name}'. Choose from: text, {', '.join(CATEGORIES)}")
+        mix[name] = float(weight)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("mix needs at least one positive weight")
+    return mix
+
+
+class CorpusBuilder:
+    """
+    Deterministic labelled sentence generator for one language.
+
+    Args:
+        language: Language code (resources/<language>.json)
+        seed:     Same language + seed → same output
+        mix:      Optional {category or 'text': weight}; None uses templates
+    """
+
+    def __init__(self, language, seed=0, mix=None):
+        self.language = language
+        self.mix = mix
+        self._rng = random.Random(f'{seed}:{language}')
+
+        self.resources = language_pack.load(language)
+        patterns = self.resources.get('patterns', {})
+        self.dfas = {
+            'currency': CurrencyDFA(patterns={
+                'currency_symbol': patterns.get('currency_symbol'),
+                'currency_strip': patterns.get('currency_strip'),
+            }),
+            'cardinal': CardinalDFA(pattern=patterns.get('cardinal')),
+            'unit': UnitDFA(pattern=patterns.get('unit')),
+            'date': DateDFA(pattern=patterns.get('date')),
+            'time': TimeDFA(pattern=patterns.get('time')),
+            'ordinal': OrdinalDFA(pattern=patterns.get('ordinal')),
+        }
+
+        samples = corpora.load_samples(language)
+        self._words = self._plain_words(samples)
+        self._templates = [
+            [token['category'] if token['category'] in CATEGORIES else token['token']
+             for token in sample.get('tokens', [])]
+            for sample in samples if sample.get('tokens')
+        ]
+
+        self._symbols = self._accepted(
+            self._currency_symbols(), lambda symbol: f'{symbol}500', 'currency',
+        )
+        self._units = self._accepted(
+            list(self.resources.get('units', {})), lambda unit: f'5{unit}', 'unit',
+        )
+        self._suffixes = self._accepted(
+            self._ordinal_suffixes(samples), lambda suffix: f'4{suffix}', 'ordinal',
+        )
+        abbreviations = list(
+            self.resources.get('named_entities', {}).get('abbreviations', {})
+        )
+        entity_dfa = NamedEntityDFA(known_entities=abbreviations)
+        self._entities = [a for a in abbreviations if entity_dfa.match(a)['matched']]
+
+        self._generators = {
+            'currency': self._currency,
+            'cardinal': self._cardinal,
+            'unit': self._unit,
+            'date': self._date,
+            'time': self._time,
+            'ordinal': self._ordinal,
+            'named_entity': self._named_entity,
+        }
+        # Categories this language can actually produce
+        self.categories = tuple(
+            category for category, pool in (
+                ('currency', self._symbols), ('cardinal', True), ('unit', self._units),
+                ('date', True), ('time', True), ('ordinal', self._suffixes),
+                ('named_entity', self._entities),
+            ) if pool
+        )
+
+    # ── Public API ────────────────────────────────────────────────
+
+    def sentence(self):
+        """One sentence as a list of (token, category) pairs."""
+        if self.mix is None and self._templates:
+            return self._from_template(self._rng.choice(self._templates))
+        return self._from_mix(self._rng.randint(6, 16))
+
+    def iter_sentences(self):
+        """Endless stream of (text, labels) for soak tests."""
+        while True:
+            labelled = self.sentence()
+            yield ' '.join(token for token, _ in labelled), labelled
+
+    def build(self, tokens):
+        """Sentences (text only) totalling at least `tokens` tokens."""
+        sentences = []
+        count = 0
+        for text, labelled in self.iter_sentences():
+            if count >= tokens:
+                break
+            sentences.append(text)
+            count += len(labelled)
+        return sentences
+
+    def text_of_length(self, tokens):
+        """A single input of exactly `tokens` whitespace-separated tokens."""
+        words = []
+        while len(words) < tokens:
+            words.extend(token for token, _ in self.sentence())
+        return ' '.join(words[:tokens])
+
+    def token(self, category):
+        """Generate one detectable expression as (token, category) pairs."""
+        if category == 'text':
+            return [(self._rng.choice(self._words), 'text')]
+        return [(word, category) for word in self._generators[category]()]
+
+    # ── Sentence construction ─────────────────────────────────────
+
+    def _from_template(self, template):
+        labelled = []
+        for slot in template:
+            if slot in CATEGORIES:
+                category = slot if slot in self.categories else 'cardinal'
+                labelled.extend(self.token(category))
+            else:
+                labelled.append((slot, 'text'))
+        return labelled
+
+    def _from_mix(self, length):
+        names = [name for name in self.mix if name == 'text' or name in self.categories]
+        weights = [self.mix[name] for name in names]
+        labelled = []
+        while len(labelled) < length:
+            labelled.extend(self.token(self._rng.choices(names, weights)[0]))
+        return labelled
+
+    # ── Token generators ──────────────────────────────────────────
+
+    def _amount(self):
+        digits = self._rng.choice((2, 3, 3, 4, 5, 6))
+        value = self._rng.randint(10 ** (digits - 1), 10 ** digits - 1)
+        return value
+
+    def _currency(self):
+        amount = self._amount()
+        text = f'{amount:,}' if amount >= 1000 and self._rng.random() < 0.5 else str(amount)
+        if self._rng.random() < 0.2:
+            text += f'.{self._rng.randint(0, 99):02d}'
+        return [self._rng.choice(self._symbols) + text]
+
+    def _cardinal(self):
+        return [str(self._amount())]
+
+    def _unit(self):
+        number = str(self._rng.randint(1, 999))
+        if self._rng.random() < 0.2:
+            number += f'.{self._rng.randint(1, 9)}'
+        return [number + self._rng.choice(self._units)]
+
+    def _date(self):
+        separator = self._rng.choice(_DATE_SEPARATORS)
+        day = self._rng.randint(1, 28)
+        month = self._rng.randint(1, 12)
+        padded = self._rng.random() < 0.7
+        day_text = f'{day:02d}' if padded else str(day)
+        month_text = f'{month:02d}' if padded else str(month)
+        year = self._rng.randint(1950, 2049)
+        year_text = str(year) if self._rng.random() < 0.85 else f'{year % 100:02d}'
+        return [separator.join((day_text, month_text, year_text))]
+
+    def _time(self):
+        if self._rng.random() < 0.3:
+            hour = self._rng.randint(1, 12)
+            period = self._rng.choice(('AM', 'PM'))
+            return [f'{hour}:{self._rng.randint(0, 59):02d}', period]
+        text = f'{self._rng.randint(0, 23):02d}:{self._rng.randint(0, 59):02d}'
+        if self._rng.random() < 0.1:
+            text += f':{self._rng.randint(0, 59):02d}'
+        return [text]
+
+    def _ordinal(self):
+        suffix = self._rng.choice(self._suffixes)
+        number = self._rng.randint(1, 100)
+        if suffix in _ENGLISH_SUFFIXES:
+            if number % 100 in (11, 12, 13):
+                suffix = 'th'
+            else:
+                suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(number % 10, 'th')
+        return [f'{number}{suffix}']
+
+    def _named_entity(self):
+        return [self._rng.choice(self._entities)]
+
+    # ── Resource helpers ──────────────────────────────────────────
+
+    def _plain_words(self, samples):
+        words = []
+        for sample in samples:
+            for token in sample.get('tokens', []):
+                if token['category'] == 'text' and token['token'] not in words:
+                    words.append(token['token'])
+        for month in self.resources.get('dates', {}).get('months', {}).values():
+            if month not in words:
+                words.append(month)
+        return words or ['text']
+
+    def _currency_symbols(self):
+        currency = self.resources.get('currency', {})
+        symbols = list(currency.get('symbols', []))
+        for key in ('symbol', 'code'):
+            if currency.get(key):
+                symbols.append(currency[key])
+        return [symbol for symbol in symbols if not any(c.isspace() for c in symbol)]
+
+    @staticmethod
+    def _ordinal_suffixes(samples):
+        suffixes = list(_ENGLISH_SUFFIXES)
+        for sample in samples:
+            for token in sample.get('tokens', []):
+                if token['category'] == 'ordinal':
+                    suffix = token['token'].lstrip('0123456789')
+                    if suffix and suffix not in suffixes:
+                        suffixes.append(suffix)
+        return suffixes
+
+    def _accepted(self, candidates, example, category):
+        """Keep the candidates whose example token the language's DFA accepts."""
+        dfa = self.dfas[category]
+        return [c for c in candidates if dfa.match(example(c))['matched']]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate a synthetic normalization corpus.')
+    parser.add_argument('--language', default='all',
+                        help='Language code, comma-separated codes, or "all"')
+    parser.add_argument('--tokens', type=int, default=10000, help='Tokens per language')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--mix', help='Category weights, e.g. text=0.6,currency=0.2,date=0.2')
+    parser.add_argument('--labels', action='store_true',
+                        help='Write JSON lines with per-token labels instead of plain text')
+    parser.add_argument('--output', help='Output file (default: stdout)')
+    args = parser.parse_args(argv)
+
+    if args.language == 'all':
+        languages = corpora.available_languages()
+    else:
+        languages = [code.strip() for code in args.language.split(',') if code.strip()]
+    try:
+        mix = parse_mix(args.mix) if args.mix else None
+    except ValueError as e:
+        parser.error(str(e))
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for language in languages:
+            builder = CorpusBuilder(language, seed=args.seed, mix=mix)
+            count = 0
+            for text, labelled in builder.iter_sentences():
+                if count >= args.tokens:
+                    break
+                count += len(labelled)
+                if args.labels:
+                    out.write(json.dumps({
+                        'language': language,
+                        'text': text,
+                        'tokens': [{'token': t, 'category': c} for t, c in labelled],
+                    }, ensure_ascii=False) + '\n')
+                else:
+                    out.write(text + '\n')
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,317 @@
+"""
+Throughput / latency benchmark suite.
+
+Scenarios (each run for every language in resources/):
+    manual          NormalizationEngine, all categories
+    hybrid_ml       HybridEngine with its trained model
+    hybrid_rules    HybridEngine with ML disabled (rule detection only)
+    normalizer      each normalizer called in isolation on training tokens
+    ssml            SSMLGenerator full and compact rendering
+
+Engine scenarios run over the synthetic and training corpora (see
+corpora.py) at short / medium / long lengths. Every case reports tokens/sec
+and per-request p50 / p95 / p99 latency.
+
+Usage (from backend/):
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --baseline bench.json --threshold 0.10
+
+With --baseline the run exits with status 1 when any case's tokens/sec
+drops, or its p95 grows, by more than the threshold.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(_BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(_BACKEND_DIR))
+
+import profiling
+from engine import NormalizationEngine
+from engine.tokenizer import tokenize
+from benchmarks import corpora
+
+ALL_CATEGORIES = [
+    'currency', 'cardinal', 'unit', 'date',
+    'time', 'ordinal', 'named_entity',
+]
+
+SCENARIOS = ('manual', 'hybrid_ml', 'hybrid_rules', 'normalizer', 'ssml')
+
+DEFAULT_REQUESTS = 40
+QUICK_REQUESTS = 8
+DEFAULT_WARMUP = 3
+DEFAULT_THRESHOLD = 0.10
+
+# DFA match fields passed to each normalizer, as the engines do
+_NORMALIZER_ARGS = {
+    'date': {'day': 'day', 'month': 'month', 'year': 'year'},
+    'time': {'hour': 'hour', 'minute': 'minute', 'second': 'second', 'period': 'period'},
+    'unit': {'number_str': 'number', 'unit_str': 'unit'},
+    'ordinal': {'number_str': 'number'},
+}
+
+
+# ── Measurement ───────────────────────────────────────────────────
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an ascending list (q in 0–100)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def measure(call, inputs, tokens, requests, warmup=DEFAULT_WARMUP):
+    """
+    Time `requests` calls cycling through `inputs`.
+
+    Args:
+        call:     callable(input)
+        inputs:   List of inputs
+        tokens:   Token count per input (same order)
+        requests: Number of timed calls
+        warmup:   Untimed calls first
+
+    Returns:
+        dict with requests, tokens, tokens_per_sec, mean/p50/p95/p99 (ms)
+    """
+    count = len(inputs)
+    for i in range(warmup):
+        call(inputs[i % count])
+    gc.collect()
+
+    clock = time.perf_counter
+    durations = []
+    total_tokens = 0
+    for i in range(requests):
+        item = inputs[i % count]
+        started = clock()
+        call(item)
+        durations.append(clock() - started)
+        total_tokens += tokens[i % count]
+
+    elapsed = sum(durations)
+    durations.sort()
+    return {
+        'requests': requests,
+        'tokens': total_tokens,
+        'tokens_per_sec': round(total_tokens / elapsed, 1) if elapsed else 0.0,
+        'mean_ms': round(elapsed * 1000 / requests, 4),
+        'p50_ms': round(percentile(durations, 50) * 1000, 4),
+        'p95_ms': round(percentile(durations, 95) * 1000, 4),
+        'p99_ms': round(percentile(durations, 99) * 1000, 4),
+    }
+
+
+# ── Scenarios ─────────────────────────────────────────────────────
+
+def _engine_cases(name, normalize, language, inputs_by_corpus, requests):
+    for corpus, inputs in inputs_by_corpus.items():
+        tokens = [len(tokenize(text)[0]) for text in inputs]
+        yield f'{name}/{language}/{corpus}', measure(normalize, inputs, tokens, requests)
+
+
+def _normalizer_cases(engine, language, requests):
+    """One case per category with labelled training tokens the DFA accepts."""
+    pools = corpora.token_pools(language)
+    for category in ALL_CATEGORIES:
+        dfa = getattr(engine, f'{category}_dfa')
+        normalizer = getattr(engine, f'{category}_normalizer')
+        calls = []
+        for token in pools.get(category, []):
+            match = dfa.match(token)
+            if not match['matched']:
+                continue
+            kwargs = {
+                arg: match.get(field)
+                for arg, field in _NORMALIZER_ARGS.get(category, {}).items()
+            }
+            calls.append((token, kwargs))
+        if not calls:
+            continue
+        yield f'normalizer:{category}/{language}/training', measure(
+            lambda call: normalizer.normalize(call[0], **call[1]),
+            calls, [1] * len(calls), requests,
+        )
+
+
+def _ssml_cases(engine, language, inputs_by_corpus, requests):
+    trace = profiling.tracer('bench', language)
+    for corpus in ('synthetic-medium', 'synthetic-long'):
+        inputs = inputs_by_corpus.get(corpus)
+        if not inputs:
+            continue
+        token_lists = [engine._detect(*tokenize(text), ALL_CATEGORIES, trace) for text in inputs]
+        counts = [len(tokens) for tokens in token_lists]
+        for mode in ('full', 'compact'):
+            yield f'ssml:{mode}/{language}/{corpus}', measure(
+                lambda tokens: engine.ssml_generator.render(tokens, mode),
+                token_lists, counts, requests,
+            )
+
+
+def run_suite(languages=None, scenarios=SCENARIOS, requests=DEFAULT_REQUESTS,
+              seed=0, log=print):
+    """
+    Run the selected scenarios.
+
+    Returns:
+        {case key: measurement} — keys are 'scenario/language/corpus'
+    """
+    from engine.hybrid_engine import HybridEngine
+
+    languages = languages or corpora.available_languages()
+    results = {}
+
+    def record(cases):
+        for key, measurement in cases:
+            results[key] = measurement
+            log(f"  {key:<48} {measurement['tokens_per_sec']:>12,.0f} tok/s"
+                f"   p50 {measurement['p50_ms']:>9.3f} ms   p95 {measurement['p95_ms']:>9.3f} ms")
+
+    for language in languages:
+        log(f"\n{language}")
+        inputs_by_corpus = corpora.corpora(language, seed=seed)
+        manual = NormalizationEngine(language=language)
+
+        if 'manual' in scenarios:
+            record(_engine_cases(
+                'manual', lambda text: manual.normalize(text, ALL_CATEGORIES),
+                language, inputs_by_corpus, requests,
+            ))
+
+        if 'hybrid_ml' in scenarios or 'hybrid_rules' in scenarios:
+            with warnings.catch_warnings():
+                # sklearn version-mismatch warnings from the bundled pickles
+                warnings.simplefilter('ignore')
+                hybrid = HybridEngine(language=language)
+            if 'hybrid_ml' in scenarios and hybrid.ml_available:
+                record(_engine_cases(
+                    'hybrid_ml', hybrid.normalize, language, inputs_by_corpus, requests,
+                ))
+            if 'hybrid_rules' in scenarios:
+                hybrid.ml_available = False
+                record(_engine_cases(
+                    'hybrid_rules', hybrid.normalize, language, inputs_by_corpus, requests,
+                ))
+
+        if 'normalizer' in scenarios:
+            record(_normalizer_cases(manual, language, requests * 10))
+
+        if 'ssml' in scenarios:
+            record(_ssml_cases(manual, language, inputs_by_corpus, requests))
+
+    return results
+
+
+# ── Results files ─────────────────────────────────────────────────
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=_BACKEND_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two result sets case by case.
+
+    Returns:
+        List of regressions: {'case', 'metric', 'baseline', 'current', 'change'}
+        where change is the relative difference (positive = worse)
+    """
+    regressions = []
+    for key, current in sorted(results.items()):
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        if previous['tokens_per_sec']:
+            change = 1 - current['tokens_per_sec'] / previous['tokens_per_sec']
+            if change > threshold:
+                regressions.append({
+                    'case': key, 'metric': 'tokens_per_sec',
+                    'baseline': previous['tokens_per_sec'],
+                    'current': current['tokens_per_sec'], 'change': round(change, 4),
+                })
+        if previous['p95_ms']:
+            change = current['p95_ms'] / previous['p95_ms'] - 1
+            if change > threshold:
+                regressions.append({
+                    'case': key, 'metric': 'p95_ms',
+                    'baseline': previous['p95_ms'],
+                    'current': current['p95_ms'], 'change': round(change, 4),
+                })
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--languages', help='Comma-separated codes (default: all)')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS),
+                        help=f'Comma-separated subset of {",".join(SCENARIOS)}')
+    parser.add_argument('--requests', type=int, default=DEFAULT_REQUESTS,
+                        help='Timed requests per case')
+    parser.add_argument('--quick', action='store_true',
+                        help=f'Shorthand for --requests {QUICK_REQUESTS}')
+    parser.add_argument('--seed', type=int, default=0, help='Synthetic corpus seed')
+    parser.add_argument('--output', help='Write results JSON here')
+    parser.add_argument('--baseline', help='Results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed relative regression (default: 0.10)')
+    args = parser.parse_args(argv)
+
+    languages = args.languages.split(',') if args.languages else None
+    scenarios = tuple(s.strip() for s in args.scenarios.split(',') if s.strip())
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {sorted(unknown)}")
+    requests = QUICK_REQUESTS if args.quick else args.requests
+
+    results = run_suite(languages, scenarios, requests, args.seed)
+
+    document = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'requests': requests,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for r in regressions:
+                print(f"  {r['case']:<48} {r['metric']:<15} "
+                      f"{r['baseline']} → {r['current']} ({r['change']:+.1%})")
+            return 1
+        print(f"\nNo regressions over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,5 +3,6 @@ Engine Package — core normalization orchestrator.
 """
 
 from .normalization_engine import NormalizationEngine
+from .registry import EngineRegistry
 
-__all__ = ['NormalizationEngine']
+__all__ = ['NormalizationEngine', 'EngineRegistry']
@@ -0,0 +1,42 @@
+"""
+Output Field Selection
+
+Callers can ask the engines for a subset of their outputs (e.g. only
+``normalized_text`` for bulk jobs). Outputs that are not selected are
+never built, not just dropped before serialization.
+"""
+
+
+def select_fields(fields, available, ssml_mode='full'):
+    """
+    Resolve a field request against the outputs an engine can produce.
+
+    Args:
+        fields:    None (everything), a list of names, or a comma-separated string
+        available: Output names the engine supports
+        ssml_mode: 'none' removes 'ssml' from the selection
+
+    Returns:
+        set of selected field names
+
+    Raises:
+        ValueError: if an unknown (or non-string) field is requested
+    """
+    if fields is None:
+        selected = set(available)
+    else:
+        if isinstance(fields, str):
+            fields = fields.split(',')
+        elif not isinstance(fields, (list, tuple, set, frozenset)):
+            raise ValueError("fields must be a list or a comma-separated string")
+        if not all(isinstance(name, str) for name in fields):
+            raise ValueError("fields must be a list of strings or a comma-separated string")
+        selected = {name.strip() for name in fields if name.strip()}
+        unknown = selected.difference(available)
+        if unknown:
+            raise ValueError(
+                f"Unknown field(s) {sorted(unknown)}. Choose from: {list(available)}"
+            )
+    if ssml_mode == 'none':
+        selected.discard('ssml')
+    return selected
@@ -13,23 +13,24 @@ build a hybrid architecture where ML performs category identification
 and the existing rule engine performs normalization and SSML generation.
 """
 
-import json
-import os
-from pathlib import Path
+from collections import Counter, deque
+
+import language_pack
+import metrics
+import profiling
 
 from rule_engine.detector import RuleBasedDetector
 from ml_classifier.feature_extractor import FeatureExtractor
 from ml_classifier.model import CategoryClassifier
 from normalizers import (
-    CurrencyNormalizer, CardinalNormalizer,
+    NumberToWordsConverter, CurrencyNormalizer, CardinalNormalizer,
     UnitNormalizer, DateNormalizer, TimeNormalizer,
     OrdinalNormalizer, NamedEntityNormalizer,
 )
 from ssml import SSMLGenerator
-
-
-# Root of the backend package
-_BACKEND_DIR = Path(__file__).resolve().parent.parent
+from .tokenizer import tokenize, rebuild, iter_sentences
+from .fields import select_fields
+from .parallel import CONTEXT_TOKENS
 
 
 class HybridEngine:
@@ -43,6 +44,9 @@ class HybridEngine:
         - normalized text
     """
 
+    # Outputs of normalize(), selectable via its `fields` argument
+    OUTPUT_FIELDS = ('normalized_text', 'ssml', 'token_details', 'pipeline_summary')
+
     def __init__(self, language='hi-IN', model_type='logistic_regression'):
         self.language = language
         self.resources = self._load_resources()
@@ -56,14 +60,15 @@ class HybridEngine:
         self.ml_available = False
         self._load_ml_model(model_type)
 
-        # ── Normalizers (reuse existing) ──────────────────────────
+        # ── Normalizers (reuse existing, one shared converter) ────
+        converter = NumberToWordsConverter.shared(self.resources)
         self.normalizers = {
-            'currency': CurrencyNormalizer(self.resources),
-            'cardinal': CardinalNormalizer(self.resources),
-            'unit': UnitNormalizer(self.resources),
-            'date': DateNormalizer(self.resources),
-            'time': TimeNormalizer(self.resources),
-            'ordinal': OrdinalNormalizer(self.resources),
+            'currency': CurrencyNormalizer(self.resources, converter),
+            'cardinal': CardinalNormalizer(self.resources, converter),
+            'unit': UnitNormalizer(self.resources, converter),
+            'date': DateNormalizer(self.resources, converter),
+            'time': TimeNormalizer(self.resources, converter),
+            'ordinal': OrdinalNormalizer(self.resources, converter),
             'named_entity': NamedEntityNormalizer(self.resources),
         }
 
@@ -74,10 +79,8 @@ class HybridEngine:
         self.ssml_generator = SSMLGenerator(language=language)
 
     def _load_resources(self):
-        """Load language-specific resources."""
-        path = _BACKEND_DIR / 'resources' / f'{self.language}.json'
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        """Load language-specific resources (binary pack, or the JSON file)."""
+        return language_pack.load_resources(self.language)
 
     def _load_ml_model(self, model_type):
         """Try to load a pre-trained ML model."""
@@ -119,111 +122,226 @@ class HybridEngine:
     #  Main hybrid pipeline
     # ──────────────────────────────────────────────────────────────
 
-    def normalize(self, text):
+    def normalize(self, text, ssml_mode='full', fields=None):
         """
         Run the full 5-step hybrid normalization pipeline.
 
         Args:
-            text: Input text string
+            text:      Input text string
+            ssml_mode: 'full' (pretty-printed), 'compact', or 'none' to skip SSML
+            fields:    Subset of OUTPUT_FIELDS to build (default: all)
 
         Returns:
-            dict with:
+            dict with the selected of:
                 normalized_text: Full normalized string
-                ssml:            SSML output
-                token_details:   Per-token breakdown (rule/ML/final categories)
+                ssml:            SSML output (left out when ssml_mode is 'none')
+                token_details:   Per-token breakdown (rule/ML/final categories,
+                                 plus 'start'/'end' offsets into text)
                 pipeline_summary: Stats about the detection
         """
+        selected = select_fields(fields, self.OUTPUT_FIELDS, ssml_mode)
+        want_details = 'token_details' in selected
+        trace = profiling.tracer('hybrid', self.language)
+
         # ── Step 1: Tokenize ──────────────────────────────────────
-        words = text.split()
+        with trace.stage('tokenize'):
+            words, spans = tokenize(text)
         if not words:
-            return {
-                'normalized_text': '',
-                'ssml': '',
-                'token_details': [],
-                'pipeline_summary': {'total_tokens': 0, 'detected_tokens': 0, 'categories_found': []},
-            }
+            return self._build_output(text, [], selected, ssml_mode, trace)
+
+        token_details = self._analyze(words, spans, want_details, trace)
+        return self._finish(text, token_details, selected, ssml_mode, trace)
+
+    def _analyze(self, words, spans, want_details, trace, start=0, end=None):
+        """
+        Steps 2–5 for words[start:end]: per-token details with the final
+        category and normalized form. Tokens outside the range only serve
+        as ML context, so a window with two tokens of context either side
+        gives the same details as the whole text (see engine.parallel).
+        """
+        end = len(words) if end is None else end
 
         # ── Step 2: Rule-based detection ──────────────────────────
-        rule_results = []
-        for word in words:
-            rule_result = self.rule_detector.detect(word)
-            rule_results.append(rule_result)
+        with trace.stage('rule_detection'):
+            rule_results = []
+            for word in words[start:end]:
+                rule_result = self.rule_detector.detect(word)
+                rule_results.append(rule_result)
 
         # ── Step 3: ML-based classification ───────────────────────
         ml_results = []
         if self.ml_available and self.ml_classifier:
-            feature_dicts = self.feature_extractor.extract_batch(words)
-            ml_predictions = self.ml_classifier.predict(feature_dicts)
+            with trace.stage('feature_extraction'):
+                feature_dicts = self.feature_extractor.extract_batch(words, start, end)
+            with trace.stage('ml_predict'):
+                ml_predictions = self.ml_classifier.predict(feature_dicts)
             ml_results = ml_predictions
         else:
             # No ML model available — fill with empty predictions
             ml_results = [
                 {'category': 'text', 'confidence': 0.0, 'all_scores': {}}
-                for _ in words
+                for _ in range(start, end)
             ]
 
         # ── Step 4: Combine predictions ───────────────────────────
-        token_details = []
-        for i, word in enumerate(words):
-            rule = rule_results[i]
-            ml = ml_results[i]
-
-            final_category, final_confidence = self._combine_predictions(
-                rule_category=rule['category'],
-                rule_confidence=rule['confidence'],
-                ml_category=ml['category'],
-                ml_confidence=ml['confidence'],
-            )
-
-            token_details.append({
-                'token': word,
-                'rule_category': rule['category'],
-                'rule_confidence': round(rule['confidence'], 4),
-                'ml_category': ml['category'],
-                'ml_confidence': round(ml['confidence'], 4),
-                'final_category': final_category,
-                'final_confidence': round(final_confidence, 4),
-                'dfa_states': rule.get('dfa_states', []),
-            })
+        with trace.stage('combine'):
+            token_details = []
+            for i, word in enumerate(words[start:end]):
+                rule = rule_results[i]
+                ml = ml_results[i]
+                token_start, token_end = spans[start + i]
+
+                final_category, final_confidence = self._combine_predictions(
+                    rule_category=rule['category'],
+                    rule_confidence=rule['confidence'],
+                    ml_category=ml['category'],
+                    ml_confidence=ml['confidence'],
+                )
+
+                if not want_details:
+                    # Only what normalization and the other outputs need
+                    token_details.append({
+                        'token': word,
+                        'final_category': final_category,
+                        'start': token_start,
+                        'end': token_end,
+                    })
+                    continue
+
+                token_details.append({
+                    'token': word,
+                    'rule_category': rule['category'],
+                    'rule_confidence': round(rule['confidence'], 4),
+                    'ml_category': ml['category'],
+                    'ml_confidence': round(ml['confidence'], 4),
+                    'final_category': final_category,
+                    'final_confidence': round(final_confidence, 4),
+                    'dfa_states': rule.get('dfa_states', []),
+                    'start': token_start,
+                    'end': token_end,
+                })
 
         # ── Step 5: Normalize using existing normalizers ──────────
-        normalized_tokens = []
-        for detail in token_details:
-            word = detail['token']
-            category = detail['final_category']
-
-            normalized = self._normalize_token(word, category, words)
-            detail['normalized'] = normalized
-
-            normalized_tokens.append({
-                'original': word,
-                'normalized': normalized,
-                'category': category,
-                'dfa_states': detail['dfa_states'],
-            })
-
-        # Build final output
-        normalized_text = ' '.join(d['normalized'] for d in token_details)
-        ssml = self.ssml_generator.generate(normalized_tokens)
-
-        categories_found = sorted(set(
-            d['final_category'] for d in token_details
-            if d['final_category'] != 'text'
-        ))
+        with trace.stage('normalize'):
+            for detail in token_details:
+                with trace.normalizer(detail['final_category']):
+                    detail['normalized'] = self._normalize_token(
+                        detail['token'], detail['final_category'], words,
+                    )
+
+        return token_details
+
+    def _finish(self, text, token_details, selected, ssml_mode, trace):
+        """Count tokens per category and build the selected outputs."""
+        for category, count in Counter(d['final_category'] for d in token_details).items():
+            metrics.TOKENS.inc('hybrid', self.language, category, amount=count)
+
+        return self._build_output(text, token_details, selected, ssml_mode, trace)
+
+    def _build_output(self, text, token_details, selected, ssml_mode, trace=None):
+        """Assemble only the selected outputs from the per-token details."""
+        trace = trace or profiling.tracer('hybrid', self.language)
+        result = {}
+
+        if 'normalized_text' in selected:
+            # Splice changed tokens into the source text
+            result['normalized_text'] = rebuild(text, (
+                (d['start'], d['end'], d['normalized'])
+                for d in token_details if d['normalized'] != d['token']
+            ))
+
+        if 'ssml' in selected:
+            with trace.stage('ssml'):
+                result['ssml'] = self.ssml_generator.render((
+                    {
+                        'original': d['token'],
+                        'normalized': d['normalized'],
+                        'category': d['final_category'],
+                    }
+                    for d in token_details
+                ), ssml_mode) if token_details else ''
+
+        if 'token_details' in selected:
+            result['token_details'] = token_details
+
+        if 'pipeline_summary' in selected:
+            if not token_details:
+                result['pipeline_summary'] = {
+                    'total_tokens': 0, 'detected_tokens': 0, 'categories_found': [],
+                }
+            else:
+                categories_found = sorted(set(
+                    d['final_category'] for d in token_details
+                    if d['final_category'] != 'text'
+                ))
+                result['pipeline_summary'] = {
+                    'total_tokens': len(token_details),
+                    'detected_tokens': sum(
+                        1 for d in token_details if d['final_category'] != 'text'
+                    ),
+                    'categories_found': categories_found,
+                    'ml_model_used': self.ml_available,
+                }
+
+        return result
+
+    def normalize_iter(self, text_or_iterable, ssml_mode='full', fields=None):
+        """
+        Incremental hybrid normalization, one sentence at a time.
 
-        return {
-            'normalized_text': normalized_text,
-            'ssml': ssml,
-            'token_details': token_details,
-            'pipeline_summary': {
-                'total_tokens': len(words),
-                'detected_tokens': sum(
-                    1 for d in token_details if d['final_category'] != 'text'
-                ),
-                'categories_found': categories_found,
-                'ml_model_used': self.ml_available,
-            },
-        }
+        Lets streaming consumers (e.g. a TTS front-end) start on the first
+        sentence while later ones are still being read or normalized.
+        A sentence is analyzed once the two tokens after it are known
+        (the ML classifier's context), so the results are identical to
+        normalize() on the whole input.
+
+        Args:
+            text_or_iterable: Input string, or any iterable of lines
+            ssml_mode:        Passed through to normalize()
+            fields:           Passed through to normalize()
+
+        Yields:
+            The normalize() result for each sentence (see iter_sentences),
+            plus 'sentence' (index), 'line' (index of its line) and 'offset'
+            (start of the sentence in the whole stream). token_details
+            offsets are shifted to be stream-global.
+        """
+        selected = select_fields(fields, self.OUTPUT_FIELDS, ssml_mode)
+        want_details = 'token_details' in selected
+        before = []      # last CONTEXT_TOKENS words before the first pending sentence
+        pending = deque()  # (index, line, offset, sentence, words, spans)
+        offset = 0
+
+        def emit():
+            nonlocal before
+            index, line_no, start, sentence, words, spans = pending.popleft()
+            after = [word for entry in pending for word in entry[4]][:CONTEXT_TOKENS]
+            trace = profiling.tracer('hybrid', self.language)
+            details = []
+            if words:
+                details = self._analyze(
+                    before + words + after,
+                    [(0, 0)] * len(before) + spans + [(0, 0)] * len(after),
+                    want_details, trace, len(before), len(before) + len(words),
+                )
+            result = self._finish(sentence, details, selected, ssml_mode, trace)
+            for detail in result.get('token_details', ()):
+                detail['start'] += start
+                detail['end'] += start
+            result['sentence'] = index
+            result['line'] = line_no
+            result['offset'] = start
+            before = (before + words)[-CONTEXT_TOKENS:]
+            return result
+
+        for index, (line_no, sentence) in enumerate(iter_sentences(text_or_iterable)):
+            words, spans = tokenize(sentence)
+            pending.append((index, line_no, offset, sentence, words, spans))
+            offset += len(sentence)
+            while sum(len(entry[4]) for entry in list(pending)[1:]) >= CONTEXT_TOKENS:
+                yield emit()
+        while pending:
+            yield emit()
 
     def _combine_predictions(self, rule_category, rule_confidence,
                               ml_category, ml_confidence):
@@ -9,19 +9,24 @@ This ordering ensures multi-character patterns like dates (15/08/2024) aren't
 mistakenly consumed by simpler DFAs like cardinal.
 """
 
-import json
-from pathlib import Path
+from collections import Counter
+
+import language_pack
+import metrics
+import profiling
 
 from dfa import (
     CurrencyDFA, CardinalDFA,
     UnitDFA, DateDFA, TimeDFA, OrdinalDFA, NamedEntityDFA,
 )
 from normalizers import (
-    CurrencyNormalizer, CardinalNormalizer,
+    NumberToWordsConverter, CurrencyNormalizer, CardinalNormalizer,
     UnitNormalizer, DateNormalizer, TimeNormalizer,
     OrdinalNormalizer, NamedEntityNormalizer,
 )
 from ssml import SSMLGenerator
+from .tokenizer import tokenize, rebuild, iter_sentences
+from .fields import select_fields
 
 
 class NormalizationEngine:
@@ -32,8 +37,8 @@ class NormalizationEngine:
     3. SSML generation
     """
 
-    # Root directory of the backend package (parent of engine/)
-    _BACKEND_DIR = Path(__file__).resolve().parent.parent
+    # Outputs of normalize(), selectable via its `fields` argument
+    OUTPUT_FIELDS = ('normalized_text', 'ssml', 'dfa_info')
 
     def __init__(self, language='hi-IN'):
         self.language = language
@@ -56,28 +61,27 @@ class NormalizationEngine:
         )
         self.named_entity_dfa = NamedEntityDFA(known_entities=ne_keys)
 
-        # ── Normalizers ───────────────────────────────────────────
-        self.currency_normalizer = CurrencyNormalizer(self.resources)
-        self.cardinal_normalizer = CardinalNormalizer(self.resources)
-        self.unit_normalizer = UnitNormalizer(self.resources)
-        self.date_normalizer = DateNormalizer(self.resources)
-        self.time_normalizer = TimeNormalizer(self.resources)
-        self.ordinal_normalizer = OrdinalNormalizer(self.resources)
+        # ── Normalizers (one shared converter per language) ───────
+        converter = NumberToWordsConverter.shared(self.resources)
+        self.currency_normalizer = CurrencyNormalizer(self.resources, converter)
+        self.cardinal_normalizer = CardinalNormalizer(self.resources, converter)
+        self.unit_normalizer = UnitNormalizer(self.resources, converter)
+        self.date_normalizer = DateNormalizer(self.resources, converter)
+        self.time_normalizer = TimeNormalizer(self.resources, converter)
+        self.ordinal_normalizer = OrdinalNormalizer(self.resources, converter)
         self.named_entity_normalizer = NamedEntityNormalizer(self.resources)
 
         # ── SSML generator ────────────────────────────────────────
         self.ssml_generator = SSMLGenerator(language=self.language)
 
     def _load_language_resources(self):
-        """Load language-specific resources from JSON file."""
-        resource_path = self._BACKEND_DIR / 'resources' / f'{self.language}.json'
-        with open(resource_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        """Load language-specific resources (binary pack, or the JSON file)."""
+        return language_pack.load_resources(self.language)
 
     # ──────────────────────────────────────────────────────────────
     #  Main normalisation pipeline
     # ──────────────────────────────────────────────────────────────
-    def normalize(self, text, categories):
+    def normalize(self, text, categories, ssml_mode='full', fields=None):
         """
         Main normalization pipeline.
 
@@ -85,36 +89,70 @@ class NormalizationEngine:
             text:       Input text
             categories: List of categories to apply
                         (e.g. ['currency', 'cardinal', 'date', ...])
+            ssml_mode:  'full' (pretty-printed), 'compact', or 'none' to skip SSML
+            fields:     Subset of OUTPUT_FIELDS to build (default: all)
 
         Returns:
-            dict with normalized_text, ssml, dfa_info
+            dict with the selected of normalized_text, ssml, dfa_info
+            (ssml is left out when ssml_mode is 'none'; each dfa_info entry
+            carries 'start'/'end' offsets into text)
         """
+        selected = select_fields(fields, self.OUTPUT_FIELDS, ssml_mode)
+        trace = profiling.tracer('manual', self.language)
+        with trace.stage('tokenize'):
+            words, spans = tokenize(text)
+        with trace.stage('detect'):
+            tokens = self._detect(words, spans, categories, trace)
+
+        for category, count in Counter(t['category'] for t in tokens).items():
+            metrics.TOKENS.inc('manual', self.language, category, amount=count)
+
+        result = {}
+        if 'normalized_text' in selected:
+            # Splice only changed tokens back into the source, keeping its spacing
+            result['normalized_text'] = rebuild(text, (
+                (t['start'], t['end'], t['normalized'])
+                for t in tokens if t['normalized'] != t['original']
+            ))
+        if 'ssml' in selected:
+            with trace.stage('ssml'):
+                result['ssml'] = self.ssml_generator.render(tokens, ssml_mode)
+        if 'dfa_info' in selected:
+            result['dfa_info'] = [
+                {
+                    'category': t['category'], 'original': t['original'],
+                    'states': t['dfa_states'],
+                    'start': t['start'], 'end': t['end'],
+                }
+                for t in tokens if t['category'] != 'text'
+            ]
+        return result
+
+    def _detect(self, words, spans, categories, trace):
+        """Run each word through the DFAs in priority order and normalize it."""
         tokens = []
-        dfa_info = []
-        words = text.split()
         i = 0
 
         while i < len(words):
             word = words[i]
+            start, end = spans[i]
             matched = False
 
             # ── Priority 1: Date ──────────────────────────────────
             if not matched and 'date' in categories:
                 result = self.date_dfa.match(word)
                 if result['matched']:
-                    normalized = self.date_normalizer.normalize(
-                        word,
-                        day=result.get('day'),
-                        month=result.get('month'),
-                        year=result.get('year'),
-                    )
+                    with trace.normalizer('date'):
+                        normalized = self.date_normalizer.normalize(
+                            word,
+                            day=result.get('day'),
+                            month=result.get('month'),
+                            year=result.get('year'),
+                        )
                     tokens.append({
                         'original': word, 'normalized': normalized,
                         'category': 'date', 'dfa_states': result['states'],
-                    })
-                    dfa_info.append({
-                        'category': 'date', 'original': word,
-                        'states': result['states'],
+                        'start': start, 'end': end,
                     })
                     matched = True
 
@@ -128,20 +166,19 @@ class NormalizationEngine:
                         if nxt in ('AM', 'PM'):
                             period = nxt
                             i += 1
-                    normalized = self.time_normalizer.normalize(
-                        word,
-                        hour=result.get('hour'),
-                        minute=result.get('minute'),
-                        second=result.get('second'),
-                        period=period,
-                    )
+                            end = spans[i][1]
+                    with trace.normalizer('time'):
+                        normalized = self.time_normalizer.normalize(
+                            word,
+                            hour=result.get('hour'),
+                            minute=result.get('minute'),
+                            second=result.get('second'),
+                            period=period,
+                        )
                     tokens.append({
                         'original': word, 'normalized': normalized,
                         'category': 'time', 'dfa_states': result['states'],
-                    })
-                    dfa_info.append({
-                        'category': 'time', 'original': word,
-                        'states': result['states'],
+                        'start': start, 'end': end,
                     })
                     matched = True
 
@@ -149,14 +186,12 @@ class NormalizationEngine:
             if not matched and 'currency' in categories:
                 result = self.currency_dfa.match(word)
                 if result['matched']:
-                    normalized = self.currency_normalizer.normalize(word)
+                    with trace.normalizer('currency'):
+                        normalized = self.currency_normalizer.normalize(word)
                     tokens.append({
                         'original': word, 'normalized': normalized,
                         'category': 'currency', 'dfa_states': result['states'],
-                    })
-                    dfa_info.append({
-                        'category': 'currency', 'original': word,
-                        'states': result['states'],
+                        'start': start, 'end': end,
                     })
                     matched = True
 
@@ -164,18 +199,16 @@ class NormalizationEngine:
             if not matched and 'unit' in categories:
                 result = self.unit_dfa.match(word)
                 if result['matched']:
-                    normalized = self.unit_normalizer.normalize(
-                        word,
-                        number_str=result.get('number'),
-                        unit_str=result.get('unit'),
-                    )
+                    with trace.normalizer('unit'):
+                        normalized = self.unit_normalizer.normalize(
+                            word,
+                            number_str=result.get('number'),
+                            unit_str=result.get('unit'),
+                        )
                     tokens.append({
                         'original': word, 'normalized': normalized,
                         'category': 'unit', 'dfa_states': result['states'],
-                    })
-                    dfa_info.append({
-                        'category': 'unit', 'original': word,
-                        'states': result['states'],
+                        'start': start, 'end': end,
                     })
                     matched = True
 
@@ -183,16 +216,14 @@ class NormalizationEngine:
             if not matched and 'ordinal' in categories:
                 result = self.ordinal_dfa.match(word)
                 if result['matched']:
-                    normalized = self.ordinal_normalizer.normalize(
-                        word, number_str=result.get('number'),
-                    )
+                    with trace.normalizer('ordinal'):
+                        normalized = self.ordinal_normalizer.normalize(
+                            word, number_str=result.get('number'),
+                        )
                     tokens.append({
                         'original': word, 'normalized': normalized,
                         'category': 'ordinal', 'dfa_states': result['states'],
-                    })
-                    dfa_info.append({
-                        'category': 'ordinal', 'original': word,
-                        'states': result['states'],
+                        'start': start, 'end': end,
                     })
                     matched = True
 
@@ -200,14 +231,12 @@ class NormalizationEngine:
             if not matched and 'named_entity' in categories:
                 result = self.named_entity_dfa.match(word)
                 if result['matched']:
-                    normalized = self.named_entity_normalizer.normalize(word)
+                    with trace.normalizer('named_entity'):
+                        normalized = self.named_entity_normalizer.normalize(word)
                     tokens.append({
                         'original': word, 'normalized': normalized,
                         'category': 'named_entity', 'dfa_states': result['states'],
-                    })
-                    dfa_info.append({
-                        'category': 'named_entity', 'original': word,
-                        'states': result['states'],
+                        'start': start, 'end': end,
                     })
                     matched = True
 
@@ -215,14 +244,12 @@ class NormalizationEngine:
             if not matched and 'cardinal' in categories:
                 result = self.cardinal_dfa.match(word)
                 if result['matched']:
-                    normalized = self.cardinal_normalizer.normalize(word)
+                    with trace.normalizer('cardinal'):
+                        normalized = self.cardinal_normalizer.normalize(word)
                     tokens.append({
                         'original': word, 'normalized': normalized,
                         'category': 'cardinal', 'dfa_states': result['states'],
-                    })
-                    dfa_info.append({
-                        'category': 'cardinal', 'original': word,
-                        'states': result['states'],
+                        'start': start, 'end': end,
                     })
                     matched = True
 
@@ -231,15 +258,41 @@ class NormalizationEngine:
                 tokens.append({
                     'original': word, 'normalized': word,
                     'category': 'text', 'dfa_states': [],
+                    'start': start, 'end': end,
                 })
 
             i += 1
 
-        normalized_text = ' '.join(t['normalized'] for t in tokens)
-        ssml = self.ssml_generator.generate(tokens)
+        return tokens
+
+    def normalize_iter(self, text_or_iterable, categories, ssml_mode='full',
+                       fields=None):
+        """
+        Incremental normalization, one sentence at a time.
+
+        Args:
+            text_or_iterable: Input string, or any iterable of lines
+                              (file object, generator, ...)
+            categories:       List of categories to apply
+            ssml_mode:        Passed through to normalize()
+            fields:           Passed through to normalize()
 
-        return {
-            'normalized_text': normalized_text,
-            'ssml': ssml,
-            'dfa_info': dfa_info,
-        }
+        Yields:
+            The normalize() result for each sentence (see iter_sentences),
+            plus 'sentence' (index), 'line' (index of its line) and 'offset'
+            (start of the sentence in the whole stream). dfa_info offsets
+            are shifted to be stream-global, and joining every
+            'normalized_text' reproduces the full normalized output.
+            Lookahead (AM/PM after a time) does not cross sentence ends.
+        """
+        offset = 0
+        for index, (line_no, sentence) in enumerate(iter_sentences(text_or_iterable)):
+            result = self.normalize(sentence, categories, ssml_mode, fields)
+            for info in result.get('dfa_info', ()):
+                info['start'] += offset
+                info['end'] += offset
+            result['sentence'] = index
+            result['line'] = line_no
+            result['offset'] = offset
+            yield result
+            offset += len(sentence)
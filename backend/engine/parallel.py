@@ -0,0 +1,152 @@
+"""
+Intra-request Parallelism
+
+Splits an oversized hybrid input into chunks at sentence boundaries and
+runs pipeline steps 2–5 (rule detection, ML classification, combine,
+normalize) for each chunk on a process pool. Every step is per-token
+except feature extraction, which reads up to two words either side of a
+token, so each chunk is sent with two tokens of context on both sides
+and the stitched result is identical to serial mode. Tokenization,
+SSML and the other outputs are built once, in the calling process.
+
+Normalization is pure Python, so threads would serialize on the GIL;
+each pool process builds (or inherits, when forked) its own HybridEngine
+per language.
+"""
+
+import math
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import profiling
+from .fields import select_fields
+from .tokenizer import tokenize
+
+# Inputs shorter than this (in characters) are normalized serially
+DEFAULT_MIN_CHARS = 50_000
+# Chunks are at least this many tokens, so pickling stays a small share
+MIN_CHUNK_TOKENS = 500
+# FeatureExtractor uses prev2/prev/next/next2 words
+CONTEXT_TOKENS = 2
+
+_SENTENCE_ENDS = ('।', '॥', '.', '?', '!')
+
+
+def split_chunks(words, target):
+    """
+    Split token indices into (start, end) ranges of about `target` tokens.
+
+    A chunk ends at the first sentence-final token once it has `target`
+    tokens, or is cut at 2 × target when no sentence ends before that.
+    """
+    chunks = []
+    start = 0
+    count = len(words)
+    while start < count:
+        end = min(start + target, count)
+        limit = min(start + 2 * target, count)
+        while end < limit and not words[end - 1].endswith(_SENTENCE_ENDS):
+            end += 1
+        chunks.append((start, end))
+        start = end
+    return chunks
+
+
+# ── Worker side ───────────────────────────────────────────────────
+
+_worker_engines = {}
+
+
+def _analyze_chunk(language, model_type, words, spans, start, end, want_details):
+    """Steps 2–5 for words[start:end] of a context window, in a pool process."""
+    key = (language, model_type)
+    engine = _worker_engines.get(key)
+    if engine is None:
+        from .hybrid_engine import HybridEngine
+        engine = _worker_engines[key] = HybridEngine(language=language, model_type=model_type)
+    trace = profiling.tracer('hybrid', language)
+    return engine._analyze(words, spans, want_details, trace, start, end)
+
+
+# ── Caller side ───────────────────────────────────────────────────
+
+class ParallelNormalizer:
+    """
+    Normalizes long inputs for a HybridEngine across a process pool.
+
+    Args:
+        workers:      Pool processes (created on first use)
+        min_chars:    Only inputs at least this long are split
+        chunk_tokens: Tokens per chunk (default: input split into about
+                      four chunks per worker, at least MIN_CHUNK_TOKENS)
+    """
+
+    def __init__(self, workers, min_chars=DEFAULT_MIN_CHARS, chunk_tokens=None):
+        self.workers = workers
+        self.min_chars = min_chars
+        self.chunk_tokens = chunk_tokens
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def applies(self, text):
+        """Whether `text` is long enough to be split."""
+        return self.workers > 1 and len(text) >= self.min_chars
+
+    def normalize(self, engine, text, ssml_mode='full', fields=None):
+        """Same result as engine.normalize(text, ssml_mode, fields)."""
+        selected = select_fields(fields, engine.OUTPUT_FIELDS, ssml_mode)
+        trace = profiling.tracer('hybrid', engine.language)
+
+        with trace.stage('tokenize'):
+            words, spans = tokenize(text)
+        target = self.chunk_tokens or max(
+            MIN_CHUNK_TOKENS, math.ceil(len(words) / (self.workers * 4)),
+        )
+        chunks = split_chunks(words, target)
+        if len(chunks) < 2:
+            return engine.normalize(text, ssml_mode, fields)
+
+        model_type = engine.ml_classifier.model_type if engine.ml_classifier else 'logistic_regression'
+        want_details = 'token_details' in selected
+        try:
+            with trace.stage('parallel_chunks'):
+                futures = []
+                for start, end in chunks:
+                    lo = max(0, start - CONTEXT_TOKENS)
+                    hi = min(len(words), end + CONTEXT_TOKENS)
+                    futures.append(self._pool().submit(
+                        _analyze_chunk, engine.language, model_type,
+                        words[lo:hi], spans[lo:hi], start - lo, end - lo, want_details,
+                    ))
+                token_details = []
+                for future in futures:
+                    token_details.extend(future.result())
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); start a fresh pool next time
+            self.shutdown()
+            return engine.normalize(text, ssml_mode, fields)
+
+        return engine._finish(text, token_details, selected, ssml_mode, trace)
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def restart(self):
+        """
+        Start a fresh pool on next use (e.g. after resources were reloaded,
+        so no worker keeps a stale engine). Chunks already submitted finish.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,224 @@
+"""
+Engine Registry
+
+Concurrency-safe per-language cache of engine instances.
+
+Reads after warm-up are a plain dict lookup with no locking. On a miss,
+construction is single-flight per language: concurrent first requests for
+the same language wait on that language's lock while one of them builds
+the engine (loading resources and the model only once), and requests for
+other languages are not blocked.
+
+The registry can be bounded: with `max_engines` the least recently used
+engine is evicted when a new one is built, and with `idle_ttl` engines not
+used for that many seconds are evicted. Eviction only drops the registry's
+reference; requests already holding the engine finish normally.
+"""
+
+import threading
+import time
+
+
+class EngineRegistry:
+    """
+    Lazily builds and caches one engine per language.
+
+    Args:
+        factory:     callable(language) -> engine; may raise (e.g.
+                     FileNotFoundError for an unknown language), in which
+                     case nothing is cached
+        max_engines: Keep at most this many engines (None: unbounded)
+        idle_ttl:    Evict engines idle for this many seconds (None: never)
+        on_evict:    callable(language, engine), called after an eviction
+        on_build:    callable(language, engine), called after a new engine
+                     has been cached
+        clock:       Monotonic time source (overridable for tests)
+    """
+
+    def __init__(self, factory, max_engines=None, idle_ttl=None, on_evict=None,
+                 on_build=None, clock=time.monotonic):
+        if max_engines is not None and max_engines < 1:
+            raise ValueError("max_engines must be at least 1")
+        self._factory = factory
+        self._engines = {}
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+        self.max_engines = max_engines
+        self.idle_ttl = idle_ttl
+        self._on_evict = on_evict
+        self._on_build = on_build
+        self._clock = clock
+        self._last_used = {}
+        self._evict_lock = threading.Lock()
+        self._next_sweep = clock() + idle_ttl if idle_ttl else None
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, language):
+        """Return the engine for `language`, building it on first use."""
+        now = self._clock()
+        if self._next_sweep is not None and now >= self._next_sweep:
+            self.evict_idle(now)
+
+        engine = self._engines.get(language)
+        if engine is not None:
+            self._last_used[language] = now
+            self.hits += 1
+            return engine
+
+        self.misses += 1
+        built = False
+        lock = self._lock_for(language)
+        with lock:
+            engine = self._engines.get(language)
+            if engine is None:
+                try:
+                    engine = self._factory(language)
+                except Exception:
+                    # Don't keep a lock around for languages that failed to load
+                    with self._locks_guard:
+                        if self._locks.get(language) is lock:
+                            del self._locks[language]
+                    raise
+                self._last_used[language] = self._clock()
+                self._engines[language] = engine
+                built = True
+            else:
+                self._last_used[language] = now
+
+        if self.max_engines is not None and len(self._engines) > self.max_engines:
+            self._evict_lru(keep=language)
+        if built and self._on_build is not None:
+            self._on_build(language, engine)
+        return engine
+
+    def discard(self, language):
+        """
+        Drop the cached engine for `language` (e.g. after retraining).
+
+        Waits for an in-flight construction of that language to finish, so a
+        stale engine can't be published after the discard.
+        """
+        with self._lock_for(language):
+            self._engines.pop(language, None)
+            self._last_used.pop(language, None)
+
+    def replace(self, language, engine):
+        """
+        Swap in a new engine for `language` (e.g. after its resources
+        changed), if one is cached. Requests already holding the old
+        engine finish with it.
+
+        Returns:
+            True if an engine was replaced
+        """
+        with self._lock_for(language):
+            if language not in self._engines:
+                return False
+            self._engines[language] = engine
+            self._last_used[language] = self._clock()
+        if self._on_build is not None:
+            self._on_build(language, engine)
+        return True
+
+    def evict_idle(self, now=None):
+        """
+        Evict engines idle for longer than idle_ttl.
+
+        Called automatically from get() at most once per idle_ttl; call it
+        from a timer to also reclaim memory while no requests arrive.
+
+        Returns:
+            List of evicted languages
+        """
+        if not self.idle_ttl:
+            return []
+        now = self._clock() if now is None else now
+        self._next_sweep = now + self.idle_ttl
+        idle = [
+            language for language, used in list(self._last_used.items())
+            if now - used > self.idle_ttl
+        ]
+        return [language for language in idle if self._evict(language, idle_since=now - self.idle_ttl)]
+
+    def resident(self):
+        """
+        Report the resident set, most recently used first.
+
+        Returns:
+            List of {'language', 'idle_seconds'} dicts
+        """
+        now = self._clock()
+        entries = [
+            (language, self._last_used.get(language, now))
+            for language in list(self._engines)
+        ]
+        entries.sort(key=lambda entry: entry[1], reverse=True)
+        return [
+            {'language': language, 'idle_seconds': round(now - used, 3)}
+            for language, used in entries
+        ]
+
+    def stats(self):
+        """Limits, cache counters and resident set, for health reporting."""
+        return {
+            'max_engines': self.max_engines,
+            'idle_ttl': self.idle_ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'resident': self.resident(),
+        }
+
+    def peek(self, language):
+        """The cached engine for `language`, or None (never builds)."""
+        return self._engines.get(language)
+
+    def languages(self):
+        """Languages with a constructed engine."""
+        return sorted(self._engines)
+
+    def __contains__(self, language):
+        return language in self._engines
+
+    def __len__(self):
+        return len(self._engines)
+
+    # ── Eviction ──────────────────────────────────────────────────
+
+    def _evict_lru(self, keep):
+        """Evict least recently used engines until within max_engines."""
+        while len(self._engines) > self.max_engines:
+            candidates = [
+                (self._last_used.get(language, 0), language)
+                for language in list(self._engines) if language != keep
+            ]
+            if not candidates:
+                return
+            _, victim = min(candidates)
+            self._evict(victim)
+
+    def _evict(self, language, idle_since=None):
+        """
+        Remove one engine. With `idle_since`, only if it is still unused
+        since then (a request may have touched it after the idle scan).
+        """
+        with self._evict_lock:
+            if idle_since is not None and self._last_used.get(language, 0) >= idle_since:
+                return False
+            engine = self._engines.pop(language, None)
+            self._last_used.pop(language, None)
+            if engine is None:
+                return False
+            self.evictions += 1
+        if self._on_evict is not None:
+            self._on_evict(language, engine)
+        return True
+
+    def _lock_for(self, language):
+        lock = self._locks.get(language)
+        if lock is None:
+            with self._locks_guard:
+                lock = self._locks.setdefault(language, threading.Lock())
+        return lock
@@ -0,0 +1,233 @@
+"""
+Incremental Editing Sessions
+
+Keeps the hybrid pipeline's per-token results for a document that is
+being edited, so that an edit (a replaced character span plus its new
+text) only re-runs detection for:
+
+    - the tokens the edit touches, re-tokenized from the new text, and
+    - the two tokens either side of them, whose ML context features
+      (prev/prev2/next/next2 word) may have changed
+
+Every other token keeps its details, shifted by the edit's length
+change. The result of an edit is what changed: a splice of the token
+list and a splice of the normalized text, both against the previous
+revision. After any sequence of edits the session's state equals a
+fresh normalize() of the current text.
+"""
+
+import secrets
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict
+
+import metrics
+import profiling
+from .fields import select_fields
+from .parallel import CONTEXT_TOKENS
+from .tokenizer import tokenize, rebuild
+
+DEFAULT_MAX_SESSIONS = 1000
+DEFAULT_IDLE_TTL = 30 * 60
+
+
+def _normalized(text, details, lo, hi):
+    """Normalized form of text[lo:hi] (a whitespace-aligned region), given its tokens."""
+    return rebuild(text[lo:hi], (
+        (d['start'] - lo, d['end'] - lo, d['normalized'])
+        for d in details if d['normalized'] != d['token']
+    ))
+
+
+def _same(a, b):
+    """Token details equal apart from their offsets."""
+    return all(a[key] == b.get(key) for key in a if key not in ('start', 'end'))
+
+
+class EditSession:
+    """
+    Hybrid normalization state of one document.
+
+    Args:
+        engine: HybridEngine for the document's language
+        text:   Initial text
+    """
+
+    def __init__(self, engine, text):
+        self.engine = engine
+        self.text = text
+        self.revision = 0
+        self.lock = threading.Lock()
+        self.details = []
+
+        trace = profiling.tracer('hybrid', engine.language)
+        with trace.stage('tokenize'):
+            self.words, self.spans = tokenize(text)
+        if self.words:
+            self.details = engine._analyze(self.words, self.spans, True, trace)
+        self._count(self.details)
+        self.normalized_text = _normalized(text, self.details, 0, len(text))
+
+    def output(self, ssml_mode='full', fields=None):
+        """The engine's normalize() output for the current text."""
+        selected = select_fields(fields, self.engine.OUTPUT_FIELDS, ssml_mode)
+        result = self.engine._build_output(
+            self.text, [dict(d) for d in self.details], selected, ssml_mode,
+        )
+        result['revision'] = self.revision
+        return result
+
+    def edit(self, start, end, new_text):
+        """
+        Replace text[start:end] with new_text and re-detect what it affects.
+
+        Returns:
+            dict with
+                revision:   the new revision number
+                tokens:     {'start', 'end', 'details'}: token_details[start:end]
+                            of the previous revision is replaced by details
+                segment:    {'start', 'end', 'text'}: normalized_text[start:end]
+                            of the previous revision is replaced by text
+                reanalyzed: number of tokens that went through the pipeline
+
+        Raises:
+            ValueError: if the span is outside the text
+        """
+        if not 0 <= start <= end <= len(self.text):
+            raise ValueError(
+                f"Edit span [{start}, {end}) is outside the text (length {len(self.text)})"
+            )
+        old_text, old_words, old_spans, old_details = (
+            self.text, self.words, self.spans, self.details,
+        )
+        delta = len(new_text) - (end - start)
+        text = old_text[:start] + new_text + old_text[end:]
+
+        # Old tokens touching the edit (adjacent ones too: they may merge
+        # with the new text) are re-tokenized from the new text.
+        first = bisect_left([e for _, e in old_spans], start)
+        stop = bisect_right([s for s, _ in old_spans], end)
+        lo = min(start, old_spans[first][0]) if first < stop else start
+        hi = max(end, old_spans[stop - 1][1]) if first < stop else end
+        region_words, region_spans = tokenize(text[lo:hi + delta])
+        region_spans = [(s + lo, e + lo) for s, e in region_spans]
+
+        tail = [(s + delta, e + delta) for s, e in old_spans[stop:]]
+        words = old_words[:first] + region_words + old_words[stop:]
+        spans = old_spans[:first] + region_spans + tail
+
+        # Re-run the pipeline for the new tokens plus their context
+        a = max(0, first - CONTEXT_TOKENS)
+        b_old = min(len(old_words), stop + CONTEXT_TOKENS)
+        b = b_old + len(region_words) - (stop - first)
+        trace = profiling.tracer('hybrid', self.engine.language)
+        analyzed = self.engine._analyze(words, spans, True, trace, a, b) if a < b else []
+        self._count(analyzed)
+
+        # Keep only what actually changed
+        old_window = old_details[a:b_old]
+        head = 0
+        while (head < len(analyzed) and head < len(old_window)
+               and head < first - a and _same(analyzed[head], old_window[head])):
+            head += 1
+        tail_same = 0
+        while (tail_same < len(analyzed) - head and tail_same < len(old_window) - head
+               and tail_same < b_old - stop
+               and _same(analyzed[-1 - tail_same], old_window[-1 - tail_same])):
+            tail_same += 1
+        changed = analyzed[head:len(analyzed) - tail_same]
+        token_start, token_end = a + head, b_old - tail_same
+
+        # Normalized-text splice covering the edit and the changed tokens
+        seg_lo = min([lo] + [old_details[i]['start'] for i in range(token_start, token_end)])
+        seg_hi = max([hi] + [old_details[i]['end'] for i in range(token_start, token_end)])
+        before = sum(len(d['normalized']) - len(d['token']) for d in old_details[:token_start])
+        old_segment = _normalized(old_text, old_details[token_start:token_end], seg_lo, seg_hi)
+        for detail in old_details[b_old:]:
+            detail['start'] += delta
+            detail['end'] += delta
+        details = old_details[:a] + analyzed + old_details[b_old:]
+        new_segment = _normalized(
+            text, details[token_start:token_start + len(changed)], seg_lo, seg_hi + delta,
+        )
+        segment_start = seg_lo + before
+
+        self.text, self.words, self.spans, self.details = text, words, spans, details
+        self.normalized_text = (
+            self.normalized_text[:segment_start] + new_segment
+            + self.normalized_text[segment_start + len(old_segment):]
+        )
+        self.revision += 1
+        return {
+            'revision': self.revision,
+            'tokens': {'start': token_start, 'end': token_end, 'details': changed},
+            'segment': {
+                'start': segment_start,
+                'end': segment_start + len(old_segment),
+                'text': new_segment,
+            },
+            'reanalyzed': len(analyzed),
+        }
+
+    def _count(self, details):
+        for category, count in Counter(d['final_category'] for d in details).items():
+            metrics.TOKENS.inc('hybrid', self.engine.language, category, amount=count)
+
+
+class SessionStore:
+    """
+    Bounded, thread-safe map of session id → EditSession.
+
+    Args:
+        max_sessions: Drop the least recently used session beyond this
+        idle_ttl:     Drop sessions unused for this many seconds
+        clock:        Time source (tests pass a fake)
+    """
+
+    def __init__(self, max_sessions=DEFAULT_MAX_SESSIONS, idle_ttl=DEFAULT_IDLE_TTL,
+                 clock=time.monotonic):
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self._clock = clock
+        self._sessions = OrderedDict()  # id → (session, last used)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def create(self, engine, text):
+        """Analyze `text` and store a new session; returns (id, session)."""
+        session = EditSession(engine, text)
+        session_id = secrets.token_urlsafe(12)
+        with self._lock:
+            self._sweep()
+            self._sessions[session_id] = (session, self._clock())
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session_id, session
+
+    def get(self, session_id):
+        """The session, or None when unknown or expired."""
+        with self._lock:
+            self._sweep()
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            self._sessions[session_id] = (entry[0], self._clock())
+            self._sessions.move_to_end(session_id)
+            return entry[0]
+
+    def discard(self, session_id):
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def _sweep(self):
+        if not self.idle_ttl:
+            return
+        deadline = self._clock() - self.idle_ttl
+        while self._sessions:
+            session_id, (_, last_used) = next(iter(self._sessions.items()))
+            if last_used > deadline:
+                break
+            del self._sessions[session_id]
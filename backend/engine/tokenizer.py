@@ -0,0 +1,102 @@
+"""
+Offset-preserving Tokenizer
+
+Splits text on whitespace exactly like ``str.split()`` but yields
+``(start, end)`` character spans into the original string instead of
+copied substrings. Spans let callers align normalized output with the
+source text (and audio timestamps), and let ``rebuild`` splice
+replacements back in while keeping the original spacing verbatim.
+"""
+
+import io
+import re
+
+# Same token boundaries as str.split(): maximal runs of non-whitespace
+_TOKEN_RE = re.compile(r'\S+')
+
+# A sentence ends at a danda, full stop, ? or ! followed by whitespace
+_SENTENCE_END_RE = re.compile(r'[।॥.?!]\s+')
+
+
+def iter_spans(text):
+    """
+    Yield the (start, end) span of every whitespace-delimited token.
+
+    No substrings are created; slice ``text[start:end]`` only for the
+    tokens that actually need inspecting.
+    """
+    for m in _TOKEN_RE.finditer(text):
+        yield m.span()
+
+
+def tokenize(text):
+    """
+    Tokenize text into parallel lists of words and spans.
+
+    Returns:
+        (words, spans) — ``words[i] == text[spans[i][0]:spans[i][1]]``
+    """
+    spans = [m.span() for m in _TOKEN_RE.finditer(text)]
+    words = [text[start:end] for start, end in spans]
+    return words, spans
+
+
+def rebuild(text, replacements):
+    """
+    Rebuild text by splicing replacements into the original string.
+
+    Unchanged regions (including all whitespace and untouched tokens)
+    are copied verbatim as single slices, so only the replaced spans
+    cost anything beyond one final join.
+
+    Args:
+        text:         Original input string
+        replacements: Iterable of (start, end, new_text), sorted by start
+                      and non-overlapping
+
+    Returns:
+        The rebuilt string
+    """
+    parts = []
+    cursor = 0
+    for start, end, new_text in replacements:
+        if start > cursor:
+            parts.append(text[cursor:start])
+        parts.append(new_text)
+        cursor = end
+    if not parts:
+        return text
+    parts.append(text[cursor:])
+    return ''.join(parts)
+
+
+def iter_lines(text_or_iterable):
+    """
+    Yield lines (with their line endings) from a string or an iterable.
+
+    Strings are split lazily on universal newlines; any other iterable
+    (file object, generator of lines, ...) is passed through unchanged,
+    so ``''.join(iter_lines(x))`` reproduces the input.
+    """
+    if isinstance(text_or_iterable, str):
+        text_or_iterable = io.StringIO(text_or_iterable, newline='')
+    for line in text_or_iterable:
+        yield line
+
+
+def iter_sentences(text_or_iterable):
+    """
+    Yield (line index, sentence) pairs from a string or an iterable of lines.
+
+    Each line is cut after every sentence end (danda, full stop, ? or !
+    followed by whitespace); the whitespace stays with the sentence before
+    it, so sentences never split a token and joining them reproduces the
+    input. A line without a sentence end is yielded whole.
+    """
+    for line_no, line in enumerate(iter_lines(text_or_iterable)):
+        cursor = 0
+        for m in _SENTENCE_END_RE.finditer(line):
+            yield line_no, line[cursor:m.end()]
+            cursor = m.end()
+        if cursor < len(line):
+            yield line_no, line[cursor:]
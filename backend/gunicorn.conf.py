@@ -0,0 +1,26 @@
+"""
+Gunicorn configuration for pre-fork deployments.
+
+Usage (from backend/):
+    gunicorn -c gunicorn.conf.py "app:create_app(preload=True)"
+
+With preload_app the master imports the app and create_app(preload=True)
+builds every language's engines (resources, DFAs, normalizer tables and
+ML models) once, then freezes the heap before forking. Workers inherit
+those pages copy-on-write instead of each loading their own copy.
+"""
+
+import gc
+import os
+
+bind = os.environ.get('TN_BIND', '0.0.0.0:5003')
+workers = int(os.environ.get('WEB_CONCURRENCY', '4'))
+threads = int(os.environ.get('TN_THREADS', '4'))
+preload_app = True
+
+
+def pre_fork(server, worker):
+    # Objects allocated in the master after create_app() (e.g. by gunicorn
+    # itself) are frozen too, so the first collection in a worker doesn't
+    # touch them.
+    gc.freeze()
@@ -0,0 +1,319 @@
+"""
+Language Packs
+
+Precompiled binary form of resources/<language>.json. A pack is a pickle
+holding the validated resources together with the tables the normalizers
+would otherwise build at startup (the converter's 'date' and 'time'
+tables: every spoken day, month, year and HH:MM form). Each table is
+pickled on its own inside the pack and only unpickled when a normalizer
+first asks the shared converter for it, so the detectors and every
+engine after the first pay just for the resources.
+
+Every engine loads its resources through load() / load_resources(). The
+JSON source is read only to hash it; resources/packs/<language>.pack is
+used when the pack's format version, source hash and normalizer code
+hash all match. Otherwise the JSON is parsed and the pack rewritten, so
+editing a resource file or a normalizer never serves stale tables.
+
+The DFAs are compiled regular expressions. Those pickle as their source
+and would recompile on load, so packs only check that every pattern
+compiles.
+
+Usage (from backend/):
+    python -m language_pack build                  # validate + build every pack
+    python -m language_pack build --languages hi-IN
+    python -m language_pack check                  # exit 1 if any pack is stale
+    python -m language_pack measure                # cold start: JSON vs pack
+
+Env:
+    TN_LANGUAGE_PACKS   1 (default) | 0 = always parse JSON, never write packs
+"""
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+import pickle
+import re
+import stat
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+_BACKEND_DIR = Path(__file__).resolve().parent
+if str(_BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(_BACKEND_DIR))
+
+from normalizers import NumberToWordsConverter, DateNormalizer, TimeNormalizer
+
+PACK_VERSION = 2
+RESOURCES_DIR = _BACKEND_DIR / 'resources'
+PACKS_DIR = RESOURCES_DIR / 'packs'
+
+# Changing how tables are built invalidates existing packs
+_TABLE_SOURCES = ('number_converter.py', 'date.py', 'time.py')
+
+_REQUIRED = {
+    'numbers': ('ones', 'tens', 'scales'),
+}
+
+_code_hash = None
+
+
+def enabled():
+    return os.environ.get('TN_LANGUAGE_PACKS', '1') != '0'
+
+
+def source_path(language):
+    return RESOURCES_DIR / f'{language}.json'
+
+
+def pack_path(language):
+    return PACKS_DIR / f'{language}.pack'
+
+
+def _table_code_hash():
+    global _code_hash
+    if _code_hash is None:
+        digest = hashlib.sha256()
+        for name in _TABLE_SOURCES:
+            digest.update((_BACKEND_DIR / 'normalizers' / name).read_bytes())
+        _code_hash = digest.hexdigest()
+    return _code_hash
+
+
+def validate(resources, language):
+    """
+    Check a parsed resource file.
+
+    Raises:
+        ValueError: naming the file and the missing / invalid entry
+    """
+    where = f'resources/{language}.json'
+    if not isinstance(resources, dict):
+        raise ValueError(f'{where}: top level must be an object')
+    if resources.get('language') != language:
+        raise ValueError(
+            f'{where}: "language" is {resources.get("language")!r}, expected {language!r}'
+        )
+    for section, keys in _REQUIRED.items():
+        if not isinstance(resources.get(section), dict):
+            raise ValueError(f'{where}: missing "{section}" object')
+        for key in keys:
+            if not isinstance(resources[section].get(key), dict):
+                raise ValueError(f'{where}: missing "{section}.{key}" object')
+    for digit in map(str, range(10)):
+        if digit not in resources['numbers']['ones']:
+            raise ValueError(f'{where}: "numbers.ones" has no entry for {digit}')
+    for name, pattern in resources.get('patterns', {}).items():
+        if not isinstance(pattern, str):
+            continue
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f'{where}: pattern "{name}" does not compile: {e}') from None
+
+
+def build_tables(resources):
+    """The converter tables the normalizers precompute, keyed by table name."""
+    converter = NumberToWordsConverter(resources)
+    DateNormalizer(resources, converter)
+    TimeNormalizer(resources, converter)
+    return dict(converter._tables)
+
+
+def build(language, source=None):
+    """
+    Validate resources/<language>.json and write its pack.
+
+    Returns:
+        the resources
+    """
+    source = source_path(language).read_bytes() if source is None else source
+    return _build(language, source)['resources']
+
+
+def _build(language, source):
+    resources = json.loads(source)
+    validate(resources, language)
+    pack = {
+        'version': PACK_VERSION,
+        'language': language,
+        'source_sha256': hashlib.sha256(source).hexdigest(),
+        'code_sha256': _table_code_hash(),
+        'resources': resources,
+        'tables': {
+            name: pickle.dumps(table, protocol=pickle.HIGHEST_PROTOCOL)
+            for name, table in build_tables(resources).items()
+        },
+    }
+    _write(language, pack)
+    return pack
+
+
+def _file_mode(path):
+    """Mode for a file replacing `path`: the old file's, else what open() would use."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _write(language, pack):
+    """Write atomically; a read-only deployment just keeps using JSON."""
+    try:
+        PACKS_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=PACKS_DIR, prefix=f'.{language}.', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(pack, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # mkstemp creates the file 0600
+        os.chmod(tmp, _file_mode(pack_path(language)))
+        os.replace(tmp, pack_path(language))
+    except OSError as e:
+        print(f"Could not write language pack for {language}: {e}")
+
+
+def _read(language, source_sha256):
+    """The pack's contents if it is current, else None."""
+    try:
+        with open(pack_path(language), 'rb') as f:
+            pack = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if (not isinstance(pack, dict)
+            or pack.get('version') != PACK_VERSION
+            or pack.get('source_sha256') != source_sha256
+            or pack.get('code_sha256') != _table_code_hash()):
+        return None
+    return pack
+
+
+def _load(language):
+    """(resources, {table name: pickled table}); no tables when packs are off."""
+    source = source_path(language).read_bytes()
+    if not enabled():
+        return json.loads(source), {}
+    pack = _read(language, hashlib.sha256(source).hexdigest())
+    if pack is None:
+        pack = _build(language, source)
+    return pack['resources'], pack['tables']
+
+
+def load(language):
+    """
+    Load a language's resources.
+
+    Raises:
+        FileNotFoundError: unknown language (no resources/<language>.json)
+        ValueError:        the resource file failed validation
+    """
+    return _load(language)[0]
+
+
+def load_resources(language):
+    """
+    Resources for `language`, with the pack's tables registered on the
+    shared converter so the normalizers load them instead of building them.
+    """
+    resources, tables = _load(language)
+    if tables:
+        NumberToWordsConverter.shared(resources).preload({
+            name: functools.partial(pickle.loads, data) for name, data in tables.items()
+        })
+    return resources
+
+
+def refresh(language):
+    """
+    Validate a changed resource file and, with packs enabled, rebuild its
+    pack (for hot reload; see resource_watcher.py).
+
+    Raises:
+        ValueError: the file is not valid JSON or failed validation
+    """
+    source = source_path(language).read_bytes()
+    if enabled():
+        _build(language, source)
+    else:
+        validate(json.loads(source), language)
+
+
+def available_languages():
+    return sorted(p.stem for p in RESOURCES_DIR.glob('*.json'))
+
+
+def is_current(language):
+    source = source_path(language).read_bytes()
+    return _read(language, hashlib.sha256(source).hexdigest()) is not None
+
+
+# ── Cold-start measurement ────────────────────────────────────────
+
+_COLD_START = '''
+import sys, time, warnings
+sys.path.insert(0, {backend!r})
+warnings.simplefilter('ignore')
+from engine import NormalizationEngine
+from engine.hybrid_engine import HybridEngine
+started = time.perf_counter()
+NormalizationEngine(language={language!r})
+HybridEngine(language={language!r})
+print(time.perf_counter() - started)
+'''
+
+
+def measure(language, use_packs, runs=5):
+    """Median seconds to build a language's manual + hybrid engines in a fresh process."""
+    env = dict(os.environ, TN_LANGUAGE_PACKS='1' if use_packs else '0')
+    code = _COLD_START.format(backend=str(_BACKEND_DIR), language=language)
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, '-c', code], env=env,
+            capture_output=True, text=True, check=True,
+        ).stdout
+        samples.append(float(out.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build and check binary language packs.')
+    parser.add_argument('command', choices=('build', 'check', 'measure'))
+    parser.add_argument('--languages', help='Comma-separated codes (default: all)')
+    parser.add_argument('--runs', type=int, default=5, help='measure: runs per setup')
+    args = parser.parse_args(argv)
+    languages = args.languages.split(',') if args.languages else available_languages()
+
+    if args.command == 'build':
+        for language in languages:
+            try:
+                build(language)
+            except ValueError as e:
+                print(f"✗ {e}")
+                return 1
+            print(f"✓ {language}: {pack_path(language).stat().st_size / 1024:.0f} KB")
+        return 0
+
+    if args.command == 'check':
+        stale = [language for language in languages if not is_current(language)]
+        for language in stale:
+            print(f"stale: {language}")
+        return 1 if stale else 0
+
+    for language in languages:
+        build(language)
+    print(f"{'language':<18}{'JSON (ms)':>12}{'pack (ms)':>12}")
+    for language in languages:
+        json_ms = measure(language, False, args.runs) * 1000
+        pack_ms = measure(language, True, args.runs) * 1000
+        print(f"{language:<18}{json_ms:>12.1f}{pack_ms:>12.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,335 @@
+"""
+Memory Footprint Report
+
+How much memory one loaded language costs, piece by piece:
+
+    resources          resources/<language>.json (from its language pack)
+    dfas               the seven DFA objects
+    normalizers        normalizers, converter and their precomputed tables
+    rule_detector      RuleBasedDetector (own resources copy + DFAs)
+    feature_extractor  FeatureExtractor (own RuleBasedDetector)
+    ml_model           loaded CategoryClassifier (model + vectorizer; the
+                       model's memory-mapped arrays are reported separately
+                       as mapped_bytes, shared through the page cache)
+
+Each piece is loaded on its own under tracemalloc (allocation delta) and
+measured with a recursive sizeof (retained size). The deployed cost is
+then measured by building the manual and hybrid engines the app caches.
+
+Usage (from backend/):
+    python -m memory_report                          # all languages
+    python -m memory_report --languages hi-IN,ta-IN --json
+    python -m memory_report --budget-mb 256          # exit 1 when over budget
+
+The server reports the resident engines' footprint at /api/memory and
+warns when it passes TN_MEMORY_BUDGET_MB.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+import types
+import warnings
+from pathlib import Path
+
+_BACKEND_DIR = Path(__file__).resolve().parent
+if str(_BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(_BACKEND_DIR))
+
+import language_pack
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MB = 1024 * 1024
+
+# Shared, process-wide objects that don't belong to any one language
+_SKIP_TYPES = (
+    type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+    types.MethodType, types.CodeType,
+)
+
+
+def deep_sizeof(obj, seen=None):
+    """
+    Retained size of `obj` and everything reachable from it, in bytes.
+
+    Follows containers, instance __dict__ / __slots__ and numpy array
+    buffers; skips classes, modules and functions. Pass the same `seen`
+    set to count objects shared between several roots only once.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SKIP_TYPES):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif np is not None and isinstance(current, np.ndarray):
+            # getsizeof covers an owned buffer; views point at their base
+            if current.base is not None:
+                stack.append(current.base)
+            continue
+        elif isinstance(current, (str, bytes, bytearray, int, float, complex, bool)):
+            continue
+
+        if hasattr(current, '__dict__'):
+            stack.append(vars(current))
+        for cls in type(current).__mro__:
+            for slot in cls.__dict__.get('__slots__', ()):
+                value = getattr(current, slot, None)
+                if value is not None:
+                    stack.append(value)
+    return total
+
+
+def _traced():
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+class _Step:
+    """Context manager recording the traced allocation delta of a block."""
+
+    def __enter__(self):
+        self.before = _traced()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.bytes = _traced() - self.before
+        return False
+
+
+def _build_dfas(resources):
+    from dfa import (
+        CurrencyDFA, CardinalDFA, UnitDFA, DateDFA, TimeDFA, OrdinalDFA, NamedEntityDFA,
+    )
+    patterns = resources.get('patterns', {})
+    return {
+        'currency': CurrencyDFA(patterns={
+            'currency_symbol': patterns.get('currency_symbol'),
+            'currency_strip': patterns.get('currency_strip'),
+        }),
+        'cardinal': CardinalDFA(pattern=patterns.get('cardinal')),
+        'unit': UnitDFA(pattern=patterns.get('unit')),
+        'date': DateDFA(pattern=patterns.get('date')),
+        'time': TimeDFA(pattern=patterns.get('time')),
+        'ordinal': OrdinalDFA(pattern=patterns.get('ordinal')),
+        'named_entity': NamedEntityDFA(known_entities=list(
+            resources.get('named_entities', {}).get('abbreviations', {})
+        )),
+    }
+
+
+def _build_normalizers(resources):
+    from normalizers import (
+        NumberToWordsConverter, CurrencyNormalizer, CardinalNormalizer,
+        UnitNormalizer, DateNormalizer, TimeNormalizer,
+        OrdinalNormalizer, NamedEntityNormalizer,
+    )
+    converter = NumberToWordsConverter(resources)
+    normalizers = {
+        'currency': CurrencyNormalizer(resources, converter),
+        'cardinal': CardinalNormalizer(resources, converter),
+        'unit': UnitNormalizer(resources, converter),
+        'date': DateNormalizer(resources, converter),
+        'time': TimeNormalizer(resources, converter),
+        'ordinal': OrdinalNormalizer(resources, converter),
+        'named_entity': NamedEntityNormalizer(resources),
+    }
+    return converter, normalizers
+
+
+def measure_language(language, model_type='logistic_regression'):
+    """
+    Load each piece of one language in isolation and measure it.
+
+    Returns:
+        dict with 'pieces' ({name: {traced_bytes, retained_bytes}}),
+        'caches', 'ml' and 'engines' (deployed manual / hybrid cost)
+    """
+    from engine import NormalizationEngine
+    from engine.hybrid_engine import HybridEngine
+    from ml_classifier.feature_extractor import FeatureExtractor
+    from ml_classifier.model import CategoryClassifier
+    from normalizers import NumberToWordsConverter
+    from rule_engine.detector import RuleBasedDetector
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        NumberToWordsConverter.release(language)
+        pieces = {}
+
+        def piece(name, step, obj, seen=None):
+            pieces[name] = {
+                'traced_bytes': step.bytes,
+                'retained_bytes': deep_sizeof(obj, seen),
+            }
+
+        with _Step() as step:
+            resources = language_pack.load(language)
+        piece('resources', step, resources)
+
+        with _Step() as step:
+            dfas = _build_dfas(resources)
+        piece('dfas', step, dfas)
+
+        # Resources are accounted above; don't count them again
+        with _Step() as step:
+            converter, normalizers = _build_normalizers(resources)
+        piece('normalizers', step, normalizers, seen=_ids_of(resources))
+        caches = {'converter_tables_bytes': deep_sizeof(converter._tables)}
+
+        with _Step() as step:
+            detector = RuleBasedDetector(language=language)
+        piece('rule_detector', step, detector)
+
+        with _Step() as step:
+            extractor = FeatureExtractor(language=language)
+        piece('feature_extractor', step, extractor)
+
+        ml = {'model_type': model_type, 'available': False}
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                with _Step() as step:
+                    classifier = CategoryClassifier(model_type=model_type)
+                    classifier.load(language=language)
+            piece('ml_model', step, classifier)
+            ml.update({
+                'available': True,
+                'model_bytes': deep_sizeof(classifier.model),
+                # Memory-mapped arrays: page cache, shared between workers
+                'mapped_bytes': sum(
+                    value.nbytes for value in vars(classifier.model).values()
+                    if np is not None and isinstance(value, np.memmap)
+                ),
+                'vectorizer_bytes': deep_sizeof(classifier.vectorizer),
+            })
+        except (FileNotFoundError, ImportError):
+            classifier = None
+
+        del resources, dfas, converter, normalizers, detector, extractor, classifier
+        NumberToWordsConverter.release(language)
+
+        # Deployed cost: what the app's registries keep per language
+        with _Step() as manual_step:
+            manual = NormalizationEngine(language=language)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            with _Step() as hybrid_step:
+                hybrid = HybridEngine(language=language, model_type=model_type)
+        engines = {
+            'manual_traced_bytes': manual_step.bytes,
+            'hybrid_traced_bytes': hybrid_step.bytes,
+            'total_traced_bytes': manual_step.bytes + hybrid_step.bytes,
+            'retained_bytes': engine_footprint([manual, hybrid]),
+        }
+        del manual, hybrid
+        NumberToWordsConverter.release(language)
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    return {
+        'language': language,
+        'pieces': pieces,
+        'caches': caches,
+        'ml': ml,
+        'engines': engines,
+    }
+
+
+def _ids_of(obj):
+    seen = set()
+    deep_sizeof(obj, seen)
+    return seen
+
+
+def engine_footprint(engines):
+    """Retained bytes of engines, counting shared objects (converter) once."""
+    seen = set()
+    return sum(deep_sizeof(engine, seen) for engine in engines)
+
+
+def budget_warning(total_bytes, budget_mb):
+    """Warning message when `total_bytes` exceeds `budget_mb`, else None."""
+    if not budget_mb or total_bytes <= budget_mb * MB:
+        return None
+    return (
+        f"Language packs use {total_bytes / MB:.1f} MB, "
+        f"over the {budget_mb:g} MB budget"
+    )
+
+
+def report(languages=None, model_type='logistic_regression', budget_mb=None):
+    """Measure every language; adds totals and an optional budget warning."""
+    if languages is None:
+        languages = sorted(p.stem for p in (_BACKEND_DIR / 'resources').glob('*.json'))
+    results = [measure_language(language, model_type) for language in languages]
+    total = sum(r['engines']['total_traced_bytes'] for r in results)
+    return {
+        'languages': results,
+        'total_traced_bytes': total,
+        'budget_mb': budget_mb,
+        'warning': budget_warning(total, budget_mb),
+    }
+
+
+def _format(data):
+    pieces = ('resources', 'dfas', 'normalizers', 'rule_detector',
+              'feature_extractor', 'ml_model')
+    header = f"{'language':<18}" + ''.join(f'{name:>18}' for name in pieces) + f"{'engines':>12}"
+    lines = [
+        'Traced allocation per piece / retained size (KB); engines = manual + hybrid (MB)',
+        header,
+        '-' * len(header),
+    ]
+    for result in data['languages']:
+        cells = []
+        for name in pieces:
+            entry = result['pieces'].get(name)
+            cells.append(
+                f"{entry['traced_bytes'] / 1024:>9.0f}/{entry['retained_bytes'] / 1024:<7.0f}"
+                if entry else f"{'-':>18}"
+            )
+        lines.append(
+            f"{result['language']:<18}" + ' '.join(cells)
+            + f"{result['engines']['total_traced_bytes'] / MB:>12.2f}"
+        )
+    lines.append(f"\nTotal for all languages: {data['total_traced_bytes'] / MB:.2f} MB")
+    if data['warning']:
+        lines.append(f"WARNING: {data['warning']}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Report memory used per language pack.')
+    parser.add_argument('--languages', help='Comma-separated codes (default: all)')
+    parser.add_argument('--model-type', default='logistic_regression')
+    parser.add_argument('--budget-mb', type=float, help='Exit 1 when the total exceeds this')
+    parser.add_argument('--json', action='store_true', help='Print JSON instead of a table')
+    args = parser.parse_args(argv)
+
+    languages = args.languages.split(',') if args.languages else None
+    data = report(languages, args.model_type, args.budget_mb)
+    print(json.dumps(data, indent=2) if args.json else _format(data))
+    return 1 if data['warning'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+Metrics for the Text Normalization API
+
+Minimal, dependency-free counters and histograms rendered in the
+Prometheus text exposition format (served at /metrics by app.py).
+
+Metrics are process-local: behind a pre-fork server each worker reports
+its own series, so scrape every worker or aggregate in the collector.
+Values that live elsewhere (e.g. engine cache hits) are exported at
+scrape time through collectors registered with register_collector().
+Pipeline stage latencies arrive as profiling spans (see profiling.py).
+Work done inside excluded() (e.g. the startup warm-up) is not recorded.
+"""
+
+import math
+import threading
+from contextlib import contextmanager
+
+import profiling
+
+# Latency buckets in seconds, from sub-millisecond stages to slow requests
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+_local = threading.local()
+
+
+@contextmanager
+def excluded():
+    """
+    Record nothing from the current thread while active: no counter or
+    histogram updates, and no profiling spans (so hotspots and samples
+    skip it too). Other threads keep recording.
+    """
+    previous = getattr(_local, 'excluded', False)
+    _local.excluded = True
+    try:
+        with profiling.muted():
+            yield
+    finally:
+        _local.excluded = previous
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonically increasing count, one series per label combination."""
+
+    type = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues, amount=1):
+        if getattr(_local, 'excluded', False):
+            return
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def value(self, *labelvalues):
+        return self._values.get(labelvalues, 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for labelvalues, value in items:
+            yield self.name, _format_labels(self.labelnames, labelvalues), value
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram:
+    """Observations counted into cumulative `le` buckets, plus sum and count."""
+
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series = {}  # labelvalues → [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labelvalues):
+        if getattr(_local, 'excluded', False):
+            return
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, *labelvalues):
+        series = self._series.get(labelvalues)
+        return series[-1] if series else 0
+
+    def samples(self):
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._series.items())
+        for labelvalues, series in items:
+            cumulative = 0
+            for bound, hits in zip(self.buckets, series):
+                cumulative += hits
+                yield (
+                    self.name + '_bucket',
+                    _format_labels(self.labelnames, labelvalues, [('le', _format_value(bound))]),
+                    cumulative,
+                )
+            labels = _format_labels(self.labelnames, labelvalues)
+            yield self.name + '_sum', labels, series[-2]
+            yield self.name + '_count', labels, series[-1]
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+
+class _CollectedMetric:
+    """A metric whose samples are produced by a collector at scrape time."""
+
+    def __init__(self, name, type, documentation, samples):
+        self.name = name
+        self.type = type
+        self.documentation = documentation
+        self._samples = samples
+
+    def samples(self):
+        return self._samples
+
+
+# ── Registry ──────────────────────────────────────────────────────
+
+_METRICS = []
+_COLLECTORS = []
+
+
+def counter(name, documentation, labelnames=()):
+    """Create and register a Counter."""
+    metric = Counter(name, documentation, labelnames)
+    _METRICS.append(metric)
+    return metric
+
+
+def histogram(name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+    """Create and register a Histogram."""
+    metric = Histogram(name, documentation, labelnames, buckets)
+    _METRICS.append(metric)
+    return metric
+
+
+def register_collector(collect):
+    """
+    Register a scrape-time collector.
+
+    `collect()` yields (name, type, documentation, samples) where samples is
+    a list of ({label: value}, number) pairs.
+    """
+    _COLLECTORS.append(collect)
+    return collect
+
+
+def render():
+    """Render every registered metric in the Prometheus text format."""
+    metrics = list(_METRICS)
+    for collect in _COLLECTORS:
+        for name, type_, documentation, samples in collect():
+            metrics.append(_CollectedMetric(name, type_, documentation, [
+                (name, _format_labels(labels.keys(), labels.values()), value)
+                for labels, value in samples
+            ]))
+
+    lines = []
+    for metric in metrics:
+        lines.append(f'# HELP {metric.name} {metric.documentation}')
+        lines.append(f'# TYPE {metric.name} {metric.type}')
+        for sample_name, labels, value in metric.samples():
+            lines.append(f'{sample_name}{labels} {_format_value(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+def reset():
+    """Clear all recorded values (collectors are kept)."""
+    for metric in _METRICS:
+        metric.reset()
+
+
+# ── Metrics recorded by the API and engines ───────────────────────
+
+REQUESTS = counter(
+    'tn_requests_total', 'HTTP requests handled.',
+    ('endpoint', 'language', 'status'),
+)
+REQUEST_ERRORS = counter(
+    'tn_request_errors_total', 'HTTP requests answered with a 4xx/5xx status.',
+    ('endpoint', 'language', 'kind'),
+)
+REQUEST_SECONDS = histogram(
+    'tn_request_duration_seconds', 'HTTP request latency.',
+    ('endpoint', 'language'),
+)
+STAGE_SECONDS = histogram(
+    'tn_pipeline_stage_duration_seconds', 'Latency of each normalization pipeline stage.',
+    ('engine', 'language', 'stage'),
+)
+TOKENS = counter(
+    'tn_tokens_total', 'Tokens normalized, by final category.',
+    ('engine', 'language', 'category'),
+)
+
+
+class _StageSink(profiling.Sink):
+    """Feeds pipeline stage spans into STAGE_SECONDS."""
+
+    kinds = ('stage',)
+
+    def finish(self, span):
+        STAGE_SECONDS.observe(span.seconds, span.engine, span.language, span.name)
+
+
+profiling.add_sink(_StageSink())
@@ -4,11 +4,12 @@ Provides machine-learning-based token category classification for hybrid TN.
 """
 
 from .feature_extractor import FeatureExtractor
-from .model import CategoryClassifier
+from .model import CategoryClassifier, Prediction
 from .trainer import ModelTrainer
 
 __all__ = [
     'FeatureExtractor',
     'CategoryClassifier',
+    'Prediction',
     'ModelTrainer',
 ]
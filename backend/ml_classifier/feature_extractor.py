@@ -207,18 +207,23 @@ class FeatureExtractor:
 
         return features
 
-    def extract_batch(self, tokens):
+    def extract_batch(self, tokens, start=0, end=None):
         """
         Extract features for a list of tokens with context.
 
         Args:
             tokens: List of token strings (from text.split())
+            start:  First token to extract (earlier tokens are context only)
+            end:    Stop before this token (default: all; later tokens are
+                    context only)
 
         Returns:
-            List of feature dicts, one per token
+            List of feature dicts, one per token in tokens[start:end]
         """
         results = []
-        for i, token in enumerate(tokens):
+        end = len(tokens) if end is None else end
+        for i in range(start, end):
+            token = tokens[i]
             prev_word = tokens[i - 1] if i > 0 else ''
             prev2_word = tokens[i - 2] if i > 1 else ''
             next_word = tokens[i + 1] if i < len(tokens) - 1 else ''
@@ -6,7 +6,10 @@ Designed for easy swap to IndicBERT/XLM-R transformer models later.
 """
 
 import os
+import stat
+import tempfile
 import numpy as np
+from collections.abc import Mapping
 from pathlib import Path
 
 try:
@@ -35,6 +38,61 @@ except ImportError:
 # Where trained models are stored
 MODELS_DIR = Path(__file__).resolve().parent / 'models'
 
+# Model files are uncompressed joblib pickles, so their numpy arrays can be
+# memory-mapped on load: workers on one host then share the pages through
+# the page cache instead of each holding a copy. Copy-on-write ('c') rather
+# than read-only ('r'), because libsvm (SVC) refuses read-only buffers;
+# nothing writes to the arrays, so the pages stay shared.
+MMAP_MODE = 'c'
+
+
+def _file_mode(path):
+    """Mode for a file replacing `path`: the old file's, else what open() would use."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+class Prediction(Mapping):
+    """
+    One token's prediction, read like a dict:
+    {'category': str, 'confidence': float, 'all_scores': {class: probability}}.
+
+    all_scores is built from the batch's probability row only when it is
+    read; the hybrid pipeline uses just category and confidence.
+    """
+
+    __slots__ = ('category', 'confidence', '_scores', '_classes')
+
+    _KEYS = ('category', 'confidence', 'all_scores')
+
+    def __init__(self, category, confidence, scores, classes):
+        self.category = category
+        self.confidence = confidence
+        self._scores = scores
+        self._classes = classes
+
+    @property
+    def all_scores(self):
+        return dict(zip(self._classes, self._scores.tolist()))
+
+    def __getitem__(self, key):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+    def __repr__(self):
+        return f"Prediction(category={self.category!r}, confidence={self.confidence:.4f})"
+
 
 class CategoryClassifier:
     """
@@ -163,7 +221,7 @@ class CategoryClassifier:
             X: Feature matrix (np.ndarray or list of dicts)
 
         Returns:
-            List of dicts: [{'category': str, 'confidence': float, 'all_scores': dict}]
+            List of Prediction: [{'category': str, 'confidence': float, 'all_scores': dict}]
         """
         if not self.is_trained:
             raise RuntimeError("Model has not been trained yet. Call train() first.")
@@ -175,23 +233,17 @@ class CategoryClassifier:
                 feature_names = self.feature_names or sorted(X[0].keys())
                 X = np.array([[fd.get(name, 0.0) for name in feature_names] for fd in X])
 
-        predictions = self.model.predict(X)
+        # One inference pass: the label is the most probable class
         probabilities = self.model.predict_proba(X)
-        classes = self.model.classes_
-
-        results = []
-        for i, pred in enumerate(predictions):
-            prob_dict = {
-                cls: float(probabilities[i][j])
-                for j, cls in enumerate(classes)
-            }
-            results.append({
-                'category': str(pred),
-                'confidence': float(max(probabilities[i])),
-                'all_scores': prob_dict,
-            })
-
-        return results
+        best = probabilities.argmax(axis=1)
+        categories = self.model.classes_[best].tolist()
+        confidences = probabilities[np.arange(len(best)), best].tolist()
+        classes = self.model.classes_.tolist()
+
+        return [
+            Prediction(category, confidence, scores, classes)
+            for category, confidence, scores in zip(categories, confidences, probabilities)
+        ]
 
     def predict_single(self, features_dict, feature_names=None):
         """
@@ -202,7 +254,7 @@ class CategoryClassifier:
             feature_names: Ordered list of feature names (uses self.feature_names if None)
 
         Returns:
-            dict: {'category': str, 'confidence': float, 'all_scores': dict}
+            Prediction: {'category': str, 'confidence': float, 'all_scores': dict}
         """
         if self.vectorizer:
             return self.predict([features_dict])[0]
@@ -236,16 +288,30 @@ class CategoryClassifier:
             'categories': self.CATEGORIES,
             'vectorizer': self.vectorizer,
         }
-        joblib.dump(data, filepath)
+        # Uncompressed (mappable), and written to a new file that replaces the
+        # old one: truncating a file other processes have mapped would crash them
+        directory = os.path.dirname(os.path.abspath(filepath))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        os.close(fd)
+        try:
+            joblib.dump(data, tmp)
+            # mkstemp creates the file 0600
+            os.chmod(tmp, _file_mode(filepath))
+            os.replace(tmp, filepath)
+        except BaseException:
+            os.unlink(tmp)
+            raise
         return str(filepath)
 
-    def load(self, filepath=None, language='hi-IN'):
+    def load(self, filepath=None, language='hi-IN', mmap_mode=MMAP_MODE):
         """
         Load trained model from disk.
 
         Args:
             filepath: Explicit path, or auto-detected from language
             language: Language code for auto-detection
+            mmap_mode: Memory-map the model's arrays (see MMAP_MODE);
+                       None reads them into private memory
         """
         if not joblib:
             raise ImportError("joblib is required to load models.")
@@ -259,7 +325,7 @@ class CategoryClassifier:
                 f"Train one with: python -m ml_classifier.trainer --language {language}"
             )
 
-        data = joblib.load(filepath)
+        data = joblib.load(filepath, mmap_mode=mmap_mode)
         self.model = data['model']
         self.model_type = data['model_type']
         self.feature_names = data['feature_names']
@@ -8,8 +8,8 @@ from .number_converter import NumberToWordsConverter
 
 class CardinalNormalizer:
 
-    def __init__(self, resources):
-        self.converter = NumberToWordsConverter(resources)
+    def __init__(self, resources, converter=None):
+        self.converter = converter or NumberToWordsConverter.shared(resources)
 
     def normalize(self, text):
         """123 → एक सौ तेईस"""
@@ -9,8 +9,8 @@ from .number_converter import NumberToWordsConverter
 
 class CurrencyNormalizer:
 
-    def __init__(self, resources):
-        self.converter = NumberToWordsConverter(resources)
+    def __init__(self, resources, converter=None):
+        self.converter = converter or NumberToWordsConverter.shared(resources)
         self.currency_units = resources['currency']
         self.patterns = resources.get('patterns', {})
 
@@ -1,6 +1,12 @@
 """
 Date Normalizer
 Converts date expressions (15/08/2024) to spoken form.
+
+Spoken days (1–31), month names and years within a configurable window
+(rules.date.year_window, default 1900–2100) are precomputed per language
+and keyed by their digit strings, so a date whose groups were already
+extracted by DateDFA becomes three dict lookups and one join.
+The tables are stored on the shared per-language converter.
 """
 
 import re
@@ -9,10 +15,51 @@ from .number_converter import NumberToWordsConverter
 
 class DateNormalizer:
 
-    def __init__(self, resources):
-        self.converter = NumberToWordsConverter(resources)
+    DEFAULT_YEAR_WINDOW = (1900, 2100)
+
+    def __init__(self, resources, converter=None):
+        self.reload(resources, converter)
+
+    def reload(self, resources, converter=None):
+        """
+        (Re)load language resources and the precomputed tables.
+
+        Tables are cached on the converter, so pass a fresh converter (or
+        release the shared one first) when the resources have changed.
+        """
+        self.converter = converter or NumberToWordsConverter.shared(resources)
         self.months = resources.get('dates', {}).get('months', {})
         self.patterns = resources.get('patterns', {})
+        self.rules = resources.get('rules', {})
+        self._days, self._months, self._years = self.converter.table(
+            'date', self._build_tables,
+        )
+
+    def _build_tables(self):
+        """Precompute spoken days, months and years keyed by digit string."""
+        days = {}
+        for day in range(1, 32):
+            words = self.converter.convert(day)
+            days[str(day)] = words
+            days[f'{day:02d}'] = words
+
+        months = {}
+        for month in range(1, 13):
+            name = self.months.get(str(month))
+            if name is not None:
+                months[str(month)] = name
+                months[f'{month:02d}'] = name
+
+        first, last = self.rules.get('date', {}).get('year_window', self.DEFAULT_YEAR_WINDOW)
+        years = {
+            str(year): self.converter.convert(year)
+            for year in range(first, last + 1)
+        }
+        # Two-digit years are read as 20YY
+        for year in range(100):
+            years[f'{year:02d}'] = self.converter.convert(2000 + year)
+
+        return days, months, years
 
     def normalize(self, text, day=None, month=None, year=None):
         """15/08/2024 → पंद्रह अगस्त दो हज़ार चौबीस"""
@@ -21,7 +68,7 @@ class DateNormalizer:
             m = re.match(pat, text)
             if not m:
                 return text
-            
+
             # Extract groups. If the pattern has 4+ groups, it likely captures the separator.
             # standard: (day, month, year)
             # with separator: (day, separator, month, year)
@@ -30,6 +77,16 @@ class DateNormalizer:
             else:
                 day, month, year = m.group(1), m.group(2), m.group(3)
 
+        day_words = self._days.get(day)
+        month_name = self._months.get(month)
+        year_words = self._years.get(year)
+        if day_words is not None and month_name is not None and year_words is not None:
+            return f"{day_words} {month_name} {year_words}"
+
+        return self._compose(day, month, year)
+
+    def _compose(self, day, month, year):
+        """Convert each part from scratch (values outside the tables)."""
         day_words = self.converter.convert(int(day))
 
         month_int = str(int(month))
@@ -2,6 +2,10 @@
 Number-to-Words Converter
 Core utility for converting integers to Hindi/Nepali spoken-form words
 using the Indian numbering system (ones, tens, hundreds, thousands, lakhs, crores).
+
+One converter is shared per language (see NumberToWordsConverter.shared);
+normalizers take it by injection and hang their precomputed tables off it,
+so memory and warm-up cost scale with languages, not normalizers × engines.
 """
 
 
@@ -11,12 +15,57 @@ class NumberToWordsConverter:
     The word mappings come from the language resource file.
     """
 
+    # language code → shared converter instance
+    _shared = {}
+
     def __init__(self, resources):
         self.ones = resources['numbers']['ones']
         self.tens = resources['numbers']['tens']
         self.scales = resources['numbers']['scales']
         self.rules = resources.get('rules', {}).get('number', {})
         self.minus_word = self.rules.get('minus_word', 'माइनस')
+        self._tables = {}
+        self._prebuilt = {}
+
+    @classmethod
+    def shared(cls, resources):
+        """Return the per-language converter, creating it on first use."""
+        language = resources.get('language')
+        converter = cls._shared.get(language)
+        if converter is None:
+            converter = cls._shared.setdefault(language, cls(resources))
+        return converter
+
+    @classmethod
+    def release(cls, language=None):
+        """Drop the shared converter (and its tables) for one or all languages."""
+        if language is None:
+            cls._shared.clear()
+        else:
+            cls._shared.pop(language, None)
+
+    def table(self, name, build):
+        """
+        Return the precomputed table `name`, building it with `build()` once.
+
+        Tables live as long as this converter, so every normalizer sharing
+        the converter also shares (and only once pays for) its tables.
+        """
+        table = self._tables.get(name)
+        if table is None:
+            build = self._prebuilt.pop(name, build)
+            table = self._tables.setdefault(name, build())
+        return table
+
+    def preload(self, builders):
+        """
+        Load tables with these {name: build()} callables instead of the
+        normalizers' own builds (see language_pack.py). Tables this
+        converter already has are kept.
+        """
+        for name, build in builders.items():
+            if name not in self._tables:
+                self._prebuilt.setdefault(name, build)
 
     def convert(self, number):
         """Convert an integer to its spoken-word representation."""
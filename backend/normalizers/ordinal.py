@@ -9,8 +9,8 @@ from .number_converter import NumberToWordsConverter
 
 class OrdinalNormalizer:
 
-    def __init__(self, resources):
-        self.converter = NumberToWordsConverter(resources)
+    def __init__(self, resources, converter=None):
+        self.converter = converter or NumberToWordsConverter.shared(resources)
         ordinals_res = resources.get('ordinals', {})
         self.mapping = ordinals_res.get('mapping', {})
         self.generic_suffix = ordinals_res.get('generic_suffix', 'वाँ')
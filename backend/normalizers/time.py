@@ -1,6 +1,11 @@
 """
 Time Normalizer
 Converts time expressions (10:30, 14:45, 10:30 AM) to spoken form.
+
+Every HH:MM form (24 hours × 60 minutes × no period / AM / PM) is
+precomputed per language at load time, so the common case is a single
+dict lookup; seconds are composed on top of the precomputed parts.
+The tables are stored on the shared per-language converter.
 """
 
 import re
@@ -9,11 +14,34 @@ from .number_converter import NumberToWordsConverter
 
 class TimeNormalizer:
 
-    def __init__(self, resources):
-        self.converter = NumberToWordsConverter(resources)
+    PERIODS = (None, 'AM', 'PM')
+
+    def __init__(self, resources, converter=None):
+        self.reload(resources, converter)
+
+    def reload(self, resources, converter=None):
+        """
+        (Re)load language resources and the precomputed tables.
+
+        Tables are cached on the converter, so pass a fresh converter (or
+        release the shared one first) when the resources have changed.
+        """
+        self.converter = converter or NumberToWordsConverter.shared(resources)
         self.time_res = resources.get('time', {})
         self.patterns = resources.get('patterns', {})
         self.rules = resources.get('rules', {})
+        self._numbers, self._table = self.converter.table('time', self._build_tables)
+
+    def _build_tables(self):
+        """Precompute spoken forms keyed by (hour, minute, period)."""
+        self._numbers = [self.converter.convert(n) for n in range(60)]
+        table = {
+            (hour, minute, period): self._compose(hour, minute, None, period)
+            for hour in range(24)
+            for minute in range(60)
+            for period in self.PERIODS
+        }
+        return self._numbers, table
 
     def normalize(self, text, hour=None, minute=None, second=None, period=None):
         """10:30 → दस बजकर तीस मिनट"""
@@ -34,34 +62,54 @@ class TimeNormalizer:
         hour_int = int(hour)
         minute_int = int(minute)
         second_int = int(second) if second else None
+        period_key = self._period_key(period)
+
+        if second_int is None:
+            cached = self._table.get((hour_int, minute_int, period_key))
+            if cached is not None:
+                return cached
+
+        return self._compose(hour_int, minute_int, second_int, period_key)
+
+    @staticmethod
+    def _period_key(period):
+        """Collapse AM/PM spellings (am, A.M., ...) to None / 'AM' / 'PM'."""
+        if not period:
+            return None
+        return 'AM' if period.upper().replace('.', '') == 'AM' else 'PM'
+
+    def _words(self, number):
+        if 0 <= number < 60:
+            return self._numbers[number]
+        return self.converter.convert(number)
 
+    def _compose(self, hour_int, minute_int, second_int, period):
+        """Build the spoken form from its parts (table builder and slow path)."""
         # Period prefix: सुबह / दोपहर / शाम / रात
         period_prefix = ''
-        if period:
-            p = period.upper().replace('.', '')
-            if p == 'AM':
-                period_prefix = self.time_res.get('periods', {}).get('AM', 'सुबह')
+        if period == 'AM':
+            period_prefix = self.time_res.get('periods', {}).get('AM', 'सुबह')
+        elif period:
+            thresholds = self.rules.get('time', {}).get('period_thresholds', {'afternoon': 4, 'evening': 7, 'night': 12})
+            if hour_int < thresholds.get('afternoon', 4) or hour_int == 12:
+                period_prefix = self.time_res.get('periods', {}).get('PM_afternoon', 'दोपहर')
+            elif hour_int < thresholds.get('evening', 7):
+                period_prefix = self.time_res.get('periods', {}).get('PM_evening', 'शाम')
             else:
-                thresholds = self.rules.get('time', {}).get('period_thresholds', {'afternoon': 4, 'evening': 7, 'night': 12})
-                if hour_int < thresholds.get('afternoon', 4) or hour_int == 12:
-                    period_prefix = self.time_res.get('periods', {}).get('PM_afternoon', 'दोपहर')
-                elif hour_int < thresholds.get('evening', 7):
-                    period_prefix = self.time_res.get('periods', {}).get('PM_evening', 'शाम')
-                else:
-                    period_prefix = self.time_res.get('periods', {}).get('PM_night', 'रात')
+                period_prefix = self.time_res.get('periods', {}).get('PM_night', 'रात')
 
-        hour_words = self.converter.convert(hour_int)
+        hour_words = self._words(hour_int)
 
         if minute_int == 0 and second_int is None:
             result = f"{hour_words} {self.time_res.get('hour_marker', 'बजे')}"
         else:
-            minute_words = self.converter.convert(minute_int)
+            minute_words = self._words(minute_int)
             connector = self.time_res.get('hour_minute_connector', 'बजकर')
             minute_unit = self.time_res.get('minute_word', 'मिनट')
             result = f"{hour_words} {connector} {minute_words} {minute_unit}"
 
         if second_int is not None and second_int > 0:
-            second_words = self.converter.convert(second_int)
+            second_words = self._words(second_int)
             second_unit = self.time_res.get('second_word', 'सेकंड')
             result += f" {second_words} {second_unit}"
 
@@ -9,8 +9,8 @@ from .number_converter import NumberToWordsConverter
 
 class UnitNormalizer:
 
-    def __init__(self, resources):
-        self.converter = NumberToWordsConverter(resources)
+    def __init__(self, resources, converter=None):
+        self.converter = converter or NumberToWordsConverter.shared(resources)
         self.unit_map = resources.get('units', {})
         self.patterns = resources.get('patterns', {})
         self.rules = resources.get('rules', {})
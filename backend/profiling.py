@@ -0,0 +1,311 @@
+"""
+Profiling Hooks
+
+A small span API the engines use to wrap each pipeline stage and each
+normalizer call. Spans are dispatched to sinks; when no sink is interested
+in a span kind, opening a span returns a shared no-op context manager.
+
+Span kinds:
+    request     one API request (opened by app.py)
+    stage       a pipeline stage (tokenize, rule_detection, ..., ssml)
+    normalizer  one normalizer call (name = category)
+
+Sinks are registered globally (add_sink) for the whole process, or per
+request/thread (request_sinks), in which case they receive every kind.
+muted() silences every sink for work on the current thread (e.g. warm-up).
+Built-in sinks:
+    TimingBreakdown  per-request list of spans and per-stage totals
+    CProfileSampler  cProfile capture of a random sample of requests
+    HotspotReport    aggregated count / total / max time per span
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+KINDS = ('request', 'stage', 'normalizer')
+
+_NOOP = nullcontext()
+
+# kind → tuple of globally registered sinks interested in it
+_global = {kind: () for kind in KINDS}
+_global_sinks = []
+_global_lock = threading.Lock()
+_local = threading.local()
+
+
+class Span:
+    """A timed region; `seconds` is set when it closes."""
+
+    __slots__ = ('kind', 'name', 'engine', 'language', 'started', 'seconds', '_sinks')
+
+    def __init__(self, kind, name, engine, language, sinks):
+        self.kind = kind
+        self.name = name
+        self.engine = engine
+        self.language = language
+        self.started = None
+        self.seconds = None
+        self._sinks = sinks
+
+    def __enter__(self):
+        for sink in self._sinks:
+            sink.start(self)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.seconds = time.perf_counter() - self.started
+        for sink in self._sinks:
+            sink.finish(self)
+        return False
+
+
+class Sink:
+    """Base class for span sinks; override start() and/or finish()."""
+
+    # Span kinds this sink receives when registered globally
+    kinds = KINDS
+
+    def start(self, span):
+        pass
+
+    def finish(self, span):
+        pass
+
+
+class Tracer:
+    """Opens spans labelled with one engine and language."""
+
+    __slots__ = ('engine', 'language', '_local', '_muted')
+
+    def __init__(self, engine, language):
+        self.engine = engine
+        self.language = language
+        self._local = getattr(_local, 'sinks', ())
+        self._muted = getattr(_local, 'muted', False)
+
+    def span(self, kind, name):
+        if self._muted:
+            return _NOOP
+        sinks = _global[kind] + self._local if self._local else _global[kind]
+        if not sinks:
+            return _NOOP
+        return Span(kind, name, self.engine, self.language, sinks)
+
+    def stage(self, name):
+        return self.span('stage', name)
+
+    def normalizer(self, name):
+        return self.span('normalizer', name)
+
+
+def tracer(engine, language):
+    """Return a Tracer for one normalize() call (picks up request sinks)."""
+    return Tracer(engine, language)
+
+
+# ── Sink registration ─────────────────────────────────────────────
+
+def add_sink(sink):
+    """Register a process-wide sink for the span kinds in `sink.kinds`."""
+    with _global_lock:
+        _global_sinks.append(sink)
+        _rebuild()
+    return sink
+
+
+def remove_sink(sink):
+    with _global_lock:
+        if sink in _global_sinks:
+            _global_sinks.remove(sink)
+        _rebuild()
+
+
+def _rebuild():
+    for kind in KINDS:
+        _global[kind] = tuple(s for s in _global_sinks if kind in s.kinds)
+
+
+@contextmanager
+def request_sinks(*sinks):
+    """Send every span opened on this thread to `sinks` while active."""
+    previous = getattr(_local, 'sinks', ())
+    _local.sinks = previous + sinks
+    try:
+        yield sinks
+    finally:
+        _local.sinks = previous
+
+
+@contextmanager
+def muted():
+    """Send spans opened on this thread to no sink at all while active."""
+    previous = getattr(_local, 'muted', False)
+    _local.muted = True
+    try:
+        yield
+    finally:
+        _local.muted = previous
+
+
+def push_request_sinks(*sinks):
+    """Non-context-manager form of request_sinks(); returns a token for pop."""
+    previous = getattr(_local, 'sinks', ())
+    _local.sinks = previous + sinks
+    return previous
+
+
+def pop_request_sinks(token):
+    _local.sinks = token
+
+
+# ── Built-in sinks ────────────────────────────────────────────────
+
+class TimingBreakdown(Sink):
+    """Collects every span of one request, in the order they were opened."""
+
+    def __init__(self):
+        self._spans = []
+
+    def start(self, span):
+        self._spans.append(span)
+
+    def as_dict(self):
+        """Spans (ms) plus per-stage and per-normalizer totals."""
+        spans = [s for s in self._spans if s.seconds is not None]
+        totals = {}
+        for span in spans:
+            if span.kind == 'request':
+                continue
+            key = f'{span.kind}:{span.name}'
+            totals[key] = totals.get(key, 0.0) + span.seconds
+        return {
+            'spans': [
+                {
+                    'kind': s.kind, 'name': s.name,
+                    'engine': s.engine, 'language': s.language,
+                    'ms': round(s.seconds * 1000, 3),
+                }
+                for s in spans if s.kind != 'request'
+            ],
+            'totals_ms': {key: round(value * 1000, 3) for key, value in totals.items()},
+        }
+
+
+class HotspotReport(Sink):
+    """Aggregates count, total and max time per (kind, name, engine, language)."""
+
+    kinds = ('stage', 'normalizer')
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def finish(self, span):
+        key = (span.kind, span.name, span.engine, span.language)
+        with self._lock:
+            entry = self._stats.get(key)
+            if entry is None:
+                self._stats[key] = [1, span.seconds, span.seconds]
+            else:
+                entry[0] += 1
+                entry[1] += span.seconds
+                if span.seconds > entry[2]:
+                    entry[2] = span.seconds
+
+    def report(self, top=20):
+        """Spans with the most total time, slowest first."""
+        with self._lock:
+            items = [(key, list(entry)) for key, entry in self._stats.items()]
+        items.sort(key=lambda item: item[1][1], reverse=True)
+        return [
+            {
+                'kind': kind, 'name': name, 'engine': engine, 'language': language,
+                'count': count,
+                'total_ms': round(total * 1000, 3),
+                'mean_ms': round(total * 1000 / count, 4),
+                'max_ms': round(peak * 1000, 3),
+            }
+            for (kind, name, engine, language), (count, total, peak) in items[:top]
+        ]
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+class CProfileSampler(Sink):
+    """
+    Runs cProfile over a random sample of request spans.
+
+    Only one request is profiled at a time (the interpreter supports a
+    single active profiler). Profiles are written as .prof files to
+    `directory` when given, and the last `keep` summaries are kept in memory.
+
+    Args:
+        rate:      Fraction of requests to profile (0.0 … 1.0)
+        directory: Where to dump pstats files (None: memory only)
+        keep:      Number of recent profile summaries to keep
+        top:       Functions listed per summary (by cumulative time)
+    """
+
+    kinds = ('request',)
+
+    def __init__(self, rate, directory=None, keep=20, top=25):
+        self.rate = rate
+        self.directory = directory
+        self.top = top
+        self._recent = deque(maxlen=keep)
+        self._busy = threading.Lock()
+        self._active = threading.local()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def start(self, span):
+        if random.random() >= self.rate or not self._busy.acquire(blocking=False):
+            return
+        profile = cProfile.Profile()
+        self._active.profile = profile
+        profile.enable()
+
+    def finish(self, span):
+        profile = getattr(self._active, 'profile', None)
+        if profile is None:
+            return
+        profile.disable()
+        self._active.profile = None
+        try:
+            self._store(span, profile)
+        finally:
+            self._busy.release()
+
+    def _store(self, span, profile):
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        path = None
+        if self.directory:
+            safe = span.name.strip('/').replace('/', '_') or 'root'
+            path = os.path.join(
+                self.directory, f'{stamp}-{safe}-{threading.get_ident()}.prof',
+            )
+            profile.dump_stats(path)
+        out = io.StringIO()
+        pstats.Stats(profile, stream=out).sort_stats('cumulative').print_stats(self.top)
+        self._recent.append({
+            'time': stamp,
+            'endpoint': span.name,
+            'language': span.language,
+            'ms': round(span.seconds * 1000, 3),
+            'file': path,
+            'stats': out.getvalue(),
+        })
+
+    def recent(self):
+        """Summaries of recently sampled requests, newest last."""
+        return list(self._recent)
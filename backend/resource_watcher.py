@@ -0,0 +1,139 @@
+"""
+Resource Hot Reload
+
+Polls resources/*.json for changes (modification time and size; no
+external services) and hands each changed language to a reload callback
+on the watcher's background thread. The app's callback validates the
+file, rebuilds the language pack and swaps freshly built engines into
+the registries, so edits to unit, abbreviation or month names go live
+without a restart.
+
+Per language the watcher reports:
+
+    version      first 12 hex digits of the SHA-256 of the resource file
+                 the running engines were built from
+    revision     successful reloads since startup
+    status       current | reloading | failed
+    error        why the last reload failed (the previous version stays live)
+    reloaded_at  Unix time of the last successful reload
+"""
+
+import hashlib
+import threading
+import time
+import traceback
+
+import language_pack
+
+
+def _version(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+
+
+class ResourceWatcher:
+    """
+    Calls `reload(language)` when resources/<language>.json changes.
+
+    Args:
+        reload:    callable(language); raising marks the reload failed
+        interval:  Seconds between polls of the background thread
+        directory: Resource directory (default: language_pack.RESOURCES_DIR)
+    """
+
+    def __init__(self, reload, interval=2.0, directory=None):
+        self.interval = interval
+        self.directory = directory or language_pack.RESOURCES_DIR
+        self._reload = reload
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+        self._seen = self._scan()
+        self._status = {
+            path.stem: {
+                'version': _version(path), 'revision': 0, 'status': 'current',
+                'error': None, 'reloaded_at': None,
+            }
+            for path in (self.directory / f'{language}.json' for language in self._seen)
+        }
+
+    def _scan(self):
+        """{language: (mtime_ns, size)} of every resource file."""
+        seen = {}
+        for path in self.directory.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:  # removed while scanning
+                continue
+            seen[path.stem] = (stat.st_mtime_ns, stat.st_size)
+        return seen
+
+    def poll(self):
+        """
+        Reload every language whose file changed since the last poll.
+
+        Returns:
+            List of changed languages
+        """
+        with self._lock:
+            current = self._scan()
+            changed = sorted(
+                language for language, stamp in current.items()
+                if self._seen.get(language) != stamp
+            )
+            self._seen = current
+            for language in changed:
+                self._reload_one(language)
+        return changed
+
+    def _reload_one(self, language):
+        entry = self._status.setdefault(language, {
+            'version': None, 'revision': 0, 'status': 'current',
+            'error': None, 'reloaded_at': None,
+        })
+        entry['status'] = 'reloading'
+        try:
+            version = _version(self.directory / f'{language}.json')
+            self._reload(language)
+        except Exception as e:
+            print(f"Reloading resources for {language} failed: {str(e)}")
+            entry.update(status='failed', error=str(e))
+            return
+        entry.update(
+            version=version, revision=entry['revision'] + 1, status='current',
+            error=None, reloaded_at=round(time.time(), 3),
+        )
+        print(f"Reloaded resources for {language} (version {version})")
+
+    def status(self):
+        """{language: version / revision / status / error / reloaded_at}."""
+        return {language: dict(entry) for language, entry in sorted(self._status.items())}
+
+    # ── Background thread ─────────────────────────────────────────
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Poll every `interval` seconds on a daemon thread (idempotent)."""
+        with self._lock:
+            if self.running:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='resource-watcher', daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                traceback.print_exc()
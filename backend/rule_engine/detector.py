@@ -5,7 +5,6 @@ Provides a unified interface to run ALL DFAs against a single token
 and return the detected category with confidence.
 """
 
-import json
 from pathlib import Path
 
 import sys
@@ -14,6 +13,7 @@ _BACKEND_DIR = Path(__file__).resolve().parent.parent
 if str(_BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(_BACKEND_DIR))
 
+import language_pack
 from dfa import (
     CurrencyDFA, CardinalDFA,
     UnitDFA, DateDFA, TimeDFA, OrdinalDFA, NamedEntityDFA,
@@ -42,9 +42,7 @@ class RuleBasedDetector:
 
     def _load_resources(self):
         """Load language resources for DFA initialization."""
-        resource_path = _BACKEND_DIR / 'resources' / f'{self.language}.json'
-        with open(resource_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return language_pack.load(self.language)
 
     def _init_dfas(self):
         """Initialize all DFA instances from existing classes."""
@@ -0,0 +1,157 @@
+"""
+JSON Serialization for API responses
+
+Pluggable JSON backends: orjson or ujson when installed, falling back to
+the standard library. Output is UTF-8 with ensure_ascii=False by default,
+so Devanagari/Tamil/Kannada text is not inflated to \\uXXXX escapes.
+Large bodies can be gzip/deflate-compressed according to Accept-Encoding.
+Every backend serializes numpy scalars and arrays (e.g. model scores) as
+plain numbers and lists.
+"""
+
+import gzip
+import json
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # pyrefly: ignore [missing-import]
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # pyrefly: ignore [missing-import]
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _default(obj):
+    """Fallback for types the backends don't know: numpy scalars and arrays."""
+    if np is not None:
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _stdlib_dumps(obj):
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(',', ':'), default=_default,
+    ).encode('utf-8')
+
+
+# backend name → callable(obj) -> UTF-8 bytes
+_BACKENDS = {'json': _stdlib_dumps}
+
+if orjson is not None:
+    _BACKENDS['orjson'] = lambda obj: orjson.dumps(
+        obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+if ujson is not None:
+    _BACKENDS['ujson'] = lambda obj: ujson.dumps(
+        obj, ensure_ascii=False, default=_default,
+    ).encode('utf-8')
+
+# Fastest available backend is the default
+DEFAULT_BACKEND = next(name for name in ('orjson', 'ujson', 'json') if name in _BACKENDS)
+
+# Encodings we can produce, in order of preference
+SUPPORTED_ENCODINGS = ('gzip', 'deflate')
+
+
+def register_backend(name, dumps):
+    """Register a custom backend: `dumps(obj)` must return UTF-8 JSON bytes."""
+    _BACKENDS[name] = dumps
+
+
+def available_backends():
+    """Names of the JSON backends usable in this process."""
+    return sorted(_BACKENDS)
+
+
+def check_backend(name):
+    """
+    Return `name` if it is a usable backend.
+
+    Raises:
+        ValueError: if the backend is not available
+    """
+    if name not in _BACKENDS:
+        raise ValueError(
+            f"JSON backend '{name}' is not available. Choose from: {available_backends()}"
+        )
+    return name
+
+
+def dumps(obj, backend=None, ensure_ascii=False):
+    """
+    Serialize obj to JSON bytes.
+
+    Args:
+        obj:          JSON-compatible object
+        backend:      Backend name (default: DEFAULT_BACKEND)
+        ensure_ascii: Escape non-ASCII characters (always uses the stdlib)
+
+    Raises:
+        ValueError: if the backend is not available
+    """
+    if ensure_ascii:
+        return json.dumps(
+            obj, ensure_ascii=True, separators=(',', ':'), default=_default,
+        ).encode('ascii')
+
+    return _BACKENDS[check_backend(backend or DEFAULT_BACKEND)](obj)
+
+
+def compress(body, accept_encoding, min_bytes=4096, level=6):
+    """
+    Compress a response body if the client accepts it and it is large enough.
+
+    Args:
+        body:            Response bytes
+        accept_encoding: Value of the request's Accept-Encoding header
+        min_bytes:       Smallest body worth compressing (0 disables compression)
+        level:           zlib compression level (1 fastest … 9 smallest)
+
+    Returns:
+        (body, encoding) — encoding is None when the body was left as is
+    """
+    if not min_bytes or len(body) < min_bytes or not accept_encoding:
+        return body, None
+
+    # encoding → q-value; "*" covers encodings not listed explicitly
+    qualities = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.replace(' ', '')
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        qualities[name] = quality
+
+    wildcard = qualities.get('*', 0.0)
+    best, best_quality = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    if best == 'gzip':
+        return gzip.compress(body, compresslevel=level), 'gzip'
+    if best == 'deflate':
+        return zlib.compress(body, level), 'deflate'
+    return body, None
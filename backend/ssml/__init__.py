@@ -2,6 +2,6 @@
 SSML (Speech Synthesis Markup Language) Package
 """
 
-from .generator import SSMLGenerator
+from .generator import SSMLGenerator, SSML_MODES
 
-__all__ = ['SSMLGenerator']
+__all__ = ['SSMLGenerator', 'SSML_MODES']
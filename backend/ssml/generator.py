@@ -10,15 +10,95 @@ Supported category tags:
   time         → <say-as interpret-as="time" format="hms24">
   ordinal      → <say-as interpret-as="ordinal">
   named_entity → <sub alias="...">
+
+Documents can be built in one go (generate), streamed in chunks to a
+generator or file-like object (stream / write), or split into several
+complete <speak> documents under a byte limit (split_documents).
+The compact mode (generate_compact) emits the same document with the
+layout whitespace removed, for bulk callers: a TTS engine speaks it
+exactly like the full document.
 """
 
+import re
+
+
+# Per-category (open, close) wrappers for the pretty-printed document;
+# each token becomes open + normalized + close.
+_BLOCK_TEMPLATES = {
+    'currency': (
+        '  <say-as interpret-as="currency" format="long">\n'
+        '    <emphasis level="moderate">',
+        '</emphasis>\n  </say-as>\n',
+    ),
+    'cardinal': ('  <say-as interpret-as="cardinal">\n    ', '\n  </say-as>\n'),
+    'unit': ('  <say-as interpret-as="unit">\n    ', '\n  </say-as>\n'),
+    'date': ('  <say-as interpret-as="date" format="dmy">\n    ', '\n  </say-as>\n'),
+    'time': ('  <say-as interpret-as="time" format="hms24">\n    ', '\n  </say-as>\n'),
+    'ordinal': ('  <say-as interpret-as="ordinal">\n    ', '\n  </say-as>\n'),
+}
+_PLAIN_BLOCK = ('  ', '\n')
+
+
+def _squeeze(markup):
+    """Drop the layout whitespace around and between tags."""
+    return re.sub(r'>\s+<', '><', markup.strip())
+
+
+# The full document's wrappers without layout whitespace, for compact output
+_COMPACT_TEMPLATES = {
+    category: (_squeeze(opening), _squeeze(closing))
+    for category, (opening, closing) in _BLOCK_TEMPLATES.items()
+}
+
+# Per-category (open, close) wrappers for inline output
+_INLINE_TEMPLATES = {
+    'currency': ('<say-as interpret-as="currency">', '</say-as>'),
+    'cardinal': ('<say-as interpret-as="cardinal">', '</say-as>'),
+    'unit': ('<say-as interpret-as="unit">', '</say-as>'),
+    'date': ('<say-as interpret-as="date" format="dmy">', '</say-as>'),
+    'time': ('<say-as interpret-as="time">', '</say-as>'),
+    'ordinal': ('<say-as interpret-as="ordinal">', '</say-as>'),
+}
+
+_FOOTER = '</speak>'
+
+# Values accepted for the engines' ssml_mode / the API's "ssml" flag
+SSML_MODES = ('full', 'compact', 'none')
+
 
 class SSMLGenerator:
     """Generates SSML markup for normalized text tokens."""
 
+    # Cloud TTS backends reject SSML documents over roughly 5 KB
+    DEFAULT_MAX_BYTES = 5000
+
     def __init__(self, language='hi-IN'):
         self.ssml_version = '1.1'
         self.language = language
+        self._header = '\n'.join([
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            '<speak version="1.1" xmlns="http://www.w3.org/2001/10/synthesis"',
+            '        xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"',
+            '        xsi:schemaLocation="http://www.w3.org/2001/10/synthesis',
+            '                            http://www.w3.org/TR/speech-synthesis11/synthesis.xsd"',
+            f'        xml:lang="{self.language}">',
+        ]) + '\n'
+        self._compact_header = _squeeze(' '.join(self._header.split()))
+
+    def render(self, tokens, mode='full'):
+        """
+        Render tokens in one of SSML_MODES.
+
+        Returns:
+            SSML string, or None for mode 'none'
+        """
+        if mode == 'full':
+            return self.generate(tokens)
+        if mode == 'compact':
+            return self.generate_compact(tokens)
+        if mode == 'none':
+            return None
+        raise ValueError(f"Unsupported SSML mode '{mode}'. Choose from: {SSML_MODES}")
 
     def generate(self, tokens):
         """
@@ -30,75 +110,94 @@ class SSMLGenerator:
         Returns:
             Complete SSML string
         """
-        ssml_parts = [
-            '<?xml version="1.0" encoding="UTF-8"?>',
-            '<speak version="1.1" xmlns="http://www.w3.org/2001/10/synthesis"',
-            '        xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"',
-            '        xsi:schemaLocation="http://www.w3.org/2001/10/synthesis',
-            '                            http://www.w3.org/TR/speech-synthesis11/synthesis.xsd"',
-            f'        xml:lang="{self.language}">',
-        ]
+        return ''.join(self.stream(tokens))
+
+    def stream(self, tokens, chunk_size=8192):
+        """
+        Yield the SSML document incrementally: header, token fragments, footer.
+
+        Fragments are buffered into chunks of roughly `chunk_size` characters,
+        so the full document never has to exist in memory at once.
+
+        Args:
+            tokens:     Iterable of dicts with 'original', 'normalized', 'category'
+            chunk_size: Approximate characters per yielded chunk
+        """
+        buffer = [self._header]
+        size = len(self._header)
+        for token in tokens:
+            fragment = self._fragment(token)
+            buffer.append(fragment)
+            size += len(fragment)
+            if size >= chunk_size:
+                yield ''.join(buffer)
+                buffer = []
+                size = 0
+        buffer.append(_FOOTER)
+        yield ''.join(buffer)
 
+    def write(self, tokens, fp, chunk_size=8192):
+        """Stream the SSML document into a file-like object opened for text."""
+        for chunk in self.stream(tokens, chunk_size=chunk_size):
+            fp.write(chunk)
+
+    def split_documents(self, tokens, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Yield complete <speak> documents, each at most `max_bytes` of UTF-8.
+
+        Splits only between tokens; a single token too large to fit on its
+        own is emitted alone in an oversized document rather than cut.
+
+        Args:
+            tokens:    Iterable of dicts with 'original', 'normalized', 'category'
+            max_bytes: Byte limit per document (header and footer included)
+        """
+        overhead = len(self._header.encode('utf-8')) + len(_FOOTER)
+        buffer = []
+        size = overhead
         for token in tokens:
-            category = token['category']
-            normalized = token['normalized']
-            original = token['original']
-
-            if category == 'currency':
-                ssml_parts.append(f'  <say-as interpret-as="currency" format="long">')
-                ssml_parts.append(f'    <emphasis level="moderate">{normalized}</emphasis>')
-                ssml_parts.append(f'  </say-as>')
-            elif category == 'cardinal':
-                ssml_parts.append(f'  <say-as interpret-as="cardinal">')
-                ssml_parts.append(f'    {normalized}')
-                ssml_parts.append(f'  </say-as>')
-            elif category == 'unit':
-                ssml_parts.append(f'  <say-as interpret-as="unit">')
-                ssml_parts.append(f'    {normalized}')
-                ssml_parts.append(f'  </say-as>')
-            elif category == 'date':
-                ssml_parts.append(f'  <say-as interpret-as="date" format="dmy">')
-                ssml_parts.append(f'    {normalized}')
-                ssml_parts.append(f'  </say-as>')
-            elif category == 'time':
-                ssml_parts.append(f'  <say-as interpret-as="time" format="hms24">')
-                ssml_parts.append(f'    {normalized}')
-                ssml_parts.append(f'  </say-as>')
-            elif category == 'ordinal':
-                ssml_parts.append(f'  <say-as interpret-as="ordinal">')
-                ssml_parts.append(f'    {normalized}')
-                ssml_parts.append(f'  </say-as>')
-            elif category == 'named_entity':
-                ssml_parts.append(f'  <sub alias="{normalized}">{original}</sub>')
-            else:
-                ssml_parts.append(f'  {normalized}')
-
-        ssml_parts.append('</speak>')
-        return '\n'.join(ssml_parts)
+            fragment = self._fragment(token)
+            fragment_size = len(fragment.encode('utf-8'))
+            if buffer and size + fragment_size > max_bytes:
+                yield self._header + ''.join(buffer) + _FOOTER
+                buffer = []
+                size = overhead
+            buffer.append(fragment)
+            size += fragment_size
+        if buffer:
+            yield self._header + ''.join(buffer) + _FOOTER
+
+    def _fragment(self, token):
+        """Render one token (with trailing newline) for the full document."""
+        category = token['category']
+        normalized = token['normalized']
+        if category == 'named_entity':
+            return f'  <sub alias="{normalized}">{token["original"]}</sub>\n'
+        opening, closing = _BLOCK_TEMPLATES.get(category, _PLAIN_BLOCK)
+        return opening + normalized + closing
 
     def generate_inline(self, tokens):
         """Generate inline SSML (no XML declaration), for embedding in larger documents."""
-        parts = []
-        for token in tokens:
-            category = token['category']
-            normalized = token['normalized']
-            original = token['original']
-
-            if category == 'currency':
-                parts.append(f'<say-as interpret-as="currency">{normalized}</say-as>')
-            elif category == 'cardinal':
-                parts.append(f'<say-as interpret-as="cardinal">{normalized}</say-as>')
-            elif category == 'unit':
-                parts.append(f'<say-as interpret-as="unit">{normalized}</say-as>')
-            elif category == 'date':
-                parts.append(f'<say-as interpret-as="date" format="dmy">{normalized}</say-as>')
-            elif category == 'time':
-                parts.append(f'<say-as interpret-as="time">{normalized}</say-as>')
-            elif category == 'ordinal':
-                parts.append(f'<say-as interpret-as="ordinal">{normalized}</say-as>')
-            elif category == 'named_entity':
-                parts.append(f'<sub alias="{normalized}">{original}</sub>')
-            else:
-                parts.append(normalized)
-
-        return ' '.join(parts)
+        return ' '.join(self._inline_fragment(token) for token in tokens)
+
+    def generate_compact(self, tokens):
+        """
+        Generate the full document without indentation or newlines: the
+        same tags and attributes, so it is spoken exactly like generate().
+        """
+        return (
+            self._compact_header
+            + ' '.join(self._inline_fragment(token, _COMPACT_TEMPLATES) for token in tokens)
+            + _FOOTER
+        )
+
+    @staticmethod
+    def _inline_fragment(token, templates=_INLINE_TEMPLATES):
+        category = token['category']
+        normalized = token['normalized']
+        if category == 'named_entity':
+            return f'<sub alias="{normalized}">{token["original"]}</sub>'
+        template = templates.get(category)
+        if template is None:
+            return normalized
+        return template[0] + normalized + template[1]
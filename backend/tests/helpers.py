@@ -2,7 +2,9 @@
 Shared test utilities for all category tests.
 """
 
+import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 # Ensure backend/ is on sys.path so 'from engine import ...' works
@@ -23,6 +25,21 @@ def get_engine(language='hi-IN'):
     return NormalizationEngine(language=language)
 
 
+@contextmanager
+def environ(**values):
+    """Set environment variables for the block, restoring the previous values."""
+    saved = {name: os.environ.get(name) for name in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
 def print_test_result(test_name, input_text, categories, result):
     """Pretty-print a single test result."""
     print(f"\n{'='*70}")
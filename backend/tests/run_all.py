@@ -16,6 +16,7 @@ if _tests_dir not in sys.path:
 
 import test_currency
 import test_cardinal
+import test_number_converter
 import test_unit
 import test_date
 import test_time
@@ -24,6 +25,20 @@ import test_named_entity
 import test_nepali
 import test_kannada
 import test_mixed
+import test_tokenizer
+import test_streaming
+import test_registry
+import test_metrics
+import test_profiling
+import test_benchmarks
+import test_memory_report
+import test_asgi
+import test_parallel
+import test_session
+import test_language_pack
+import test_hot_reload
+import test_classifier
+import test_serialization
 
 
 def main():
@@ -33,6 +48,7 @@ def main():
 
     test_currency.run()
     test_cardinal.run()
+    test_number_converter.run()
     test_unit.run()
     test_date.run()
     test_time.run()
@@ -41,6 +57,20 @@ def main():
     test_nepali.run()
     test_kannada.run()
     test_mixed.run()
+    test_tokenizer.run()
+    test_streaming.run()
+    test_registry.run()
+    test_metrics.run()
+    test_profiling.run()
+    test_benchmarks.run()
+    test_memory_report.run()
+    test_asgi.run()
+    test_parallel.run()
+    test_session.run()
+    test_language_pack.run()
+    test_hot_reload.run()
+    test_classifier.run()
+    test_serialization.run()
 
     print("\n✅ All tests completed successfully!\n")
 
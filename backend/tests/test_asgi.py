@@ -0,0 +1,153 @@
+"""
+ASGI adapter tests: the Flask routes served over ASGI, backpressure,
+timeouts, client disconnects, body limits and lifespan.
+"""
+
+import asyncio
+import json
+import threading
+
+import asgi
+from asgi import WSGIAdapter, create_app
+from helpers import environ
+
+
+async def _request(adapter, method='GET', path='/', body=b'', headers=(), gone=None):
+    """Drive one HTTP request; `gone` is an asyncio.Event that disconnects the client."""
+    sent = []
+    messages = [{'type': 'http.request', 'body': body, 'more_body': False}]
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await (gone.wait() if gone is not None else asyncio.Event().wait())
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        'type': 'http', 'http_version': '1.1', 'method': method, 'path': path,
+        'query_string': b'', 'root_path': '', 'scheme': 'http',
+        'server': ('testserver', 80), 'client': ('127.0.0.1', 5000),
+        'headers': [(k.encode(), v.encode()) for k, v in headers],
+    }
+    await adapter(scope, receive, send)
+    if not sent:
+        return None, {}, b''
+    return (
+        sent[0]['status'],
+        {k.decode(): v.decode() for k, v in sent[0]['headers']},
+        b''.join(m.get('body', b'') for m in sent[1:]),
+    )
+
+
+def _blocking_app(release, calls):
+    def wsgi_app(environ, start_response):
+        calls.append(environ['PATH_INFO'])
+        release.wait(5)
+        start_response('200 OK', [('Content-Type', 'text/plain')])
+        return [b'done']
+    return wsgi_app
+
+
+async def _flask_routes():
+    # The module-level app is only built when a server asks for it
+    adapters = len(asgi._adapters)
+    adapter = create_app()
+    assert 'app' not in vars(asgi) and len(asgi._adapters) == adapters + 1
+    assert asgi.app is asgi.app and len(asgi._adapters) == adapters + 2
+    payload = json.dumps({'text': '₹500 दिया', 'language': 'hi-IN'}).encode('utf-8')
+    status, headers, body = await _request(
+        adapter, 'POST', '/api/normalize', payload,
+        [('content-type', 'application/json')],
+    )
+    assert status == 200, (status, body)
+    assert headers['content-type'] == 'application/json'
+    result = json.loads(body)
+    assert result['success'] and 'पाँच सौ' in result['normalized_text'], result
+
+    status, _, body = await _request(adapter, 'GET', '/metrics')
+    assert status == 200 and b'tn_asgi_pending_requests 1' in body  # itself
+    print(f"Flask routes over ASGI: {result['normalized_text']!r}")
+
+
+async def _backpressure():
+    release, calls = threading.Event(), []
+    adapter = WSGIAdapter(_blocking_app(release, calls), threads=1, max_pending=2)
+    first = asyncio.ensure_future(_request(adapter, path='/a'))
+    second = asyncio.ensure_future(_request(adapter, path='/b'))
+    await asyncio.sleep(0.05)
+    assert adapter.pending == 2
+
+    status, headers, _ = await _request(adapter, path='/c')
+    assert status == 503 and headers['retry-after'] == '1'
+
+    release.set()
+    assert [(await first)[0], (await second)[0]] == [200, 200]
+    assert adapter.pending == 0 and calls == ['/a', '/b']
+    print("Backpressure: third request over max_pending=2 → 503")
+
+
+async def _timeout_and_disconnect():
+    release, calls = threading.Event(), []
+    adapter = WSGIAdapter(_blocking_app(release, calls), threads=1, timeout=0.05)
+    status, _, body = await _request(adapter, path='/slow')
+    assert status == 504 and b'timed out' in body
+
+    # Queued behind /slow; the client leaves before it starts → never runs
+    gone = asyncio.Event()
+    queued = asyncio.ensure_future(_request(adapter, path='/queued', gone=gone))
+    await asyncio.sleep(0.01)
+    gone.set()
+    assert (await queued)[0] is None
+
+    release.set()
+    for _ in range(100):
+        if adapter.pending == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert adapter.pending == 0 and calls == ['/slow'], calls
+    print("Timeout → 504; disconnected queued request dropped")
+
+
+async def _limits_and_lifespan():
+    started = []
+    adapter = WSGIAdapter(
+        _blocking_app(threading.Event(), []), max_body_bytes=10,
+        on_startup=lambda: started.append(True),
+    )
+    status, _, _ = await _request(adapter, 'POST', '/', b'x' * 11)
+    assert status == 413
+
+    events = iter([{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}])
+    sent = []
+
+    async def receive():
+        return next(events)
+
+    async def send(message):
+        sent.append(message['type'])
+
+    await adapter({'type': 'lifespan'}, receive, send)
+    assert started == [True]
+    assert sent == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
+    print("Body limit → 413; lifespan startup hook and shutdown: OK")
+
+
+def run():
+    print("\n" + "─"*70)
+    print("  ASGI ADAPTER TESTS")
+    print("─"*70)
+
+    with environ(TN_WARMUP_LANGUAGES='none'):
+        asyncio.run(_flask_routes())
+        asyncio.run(_backpressure())
+        asyncio.run(_timeout_and_disconnect())
+        asyncio.run(_limits_and_lifespan())
+
+    print("\n✅ ASGI adapter tests passed!")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,84 @@
+"""
+Benchmark suite tests: deterministic corpora, corpus builder labels and
+mixes, percentile / regression logic, and a minimal end-to-end run.
+"""
+
+from collections import Counter
+
+from benchmarks import corpora
+from benchmarks.corpus_builder import CorpusBuilder, parse_mix
+from benchmarks.run import percentile, compare, run_suite
+
+
+def run():
+    print("\n" + "─"*70)
+    print("  BENCHMARK SUITE TESTS")
+    print("─"*70)
+
+    # Same seed → same corpus; different seed → different corpus
+    first = corpora.synthetic('hi-IN', 'short', seed=1)
+    assert first == corpora.synthetic('hi-IN', 'short', seed=1)
+    assert first != corpora.synthetic('hi-IN', 'short', seed=2)
+    assert all(len(text.split()) == corpora.SIZES['short'] for text in first)
+    assert set(corpora.corpora('kn-IN-belgaum')) >= {'synthetic-long', 'training-short'}
+    print("Corpora: deterministic per seed")
+
+    # Every generated detectable token is accepted by its language's DFA
+    for language in corpora.available_languages():
+        builder = CorpusBuilder(language, seed=5)
+        checked = 0
+        for _, (_, labelled) in zip(range(200), builder.iter_sentences()):
+            for token, category in labelled:
+                if category in builder.dfas and token not in ('AM', 'PM'):
+                    assert builder.dfas[category].match(token)['matched'], (language, token)
+                    checked += 1
+        assert checked > 50, (language, checked)
+    print("Corpus builder: generated tokens match their DFAs in every language")
+
+    # A mix controls the category distribution
+    mix = parse_mix('text=0.5,currency=0.25,date=0.25')
+    builder = CorpusBuilder('ne-NP', seed=1, mix=mix)
+    counts = Counter(
+        category for _, (_, labelled) in zip(range(300), builder.iter_sentences())
+        for _, category in labelled
+    )
+    assert set(counts) == {'text', 'currency', 'date'}, counts
+    share = counts['currency'] / sum(counts.values())
+    assert 0.2 < share < 0.3, share
+    assert CorpusBuilder('ne-NP', seed=1, mix=mix).build(500) == \
+        CorpusBuilder('ne-NP', seed=1, mix=mix).build(500)
+    try:
+        parse_mix('text=1,weather=1')
+        raise AssertionError("expected ValueError")
+    except ValueError:
+        pass
+    print(f"Corpus builder mix: currency share {share:.2f}")
+
+    values = sorted(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([7], 99) == 7
+
+    baseline = {'a': {'tokens_per_sec': 1000, 'p95_ms': 1.0}}
+    assert compare({'a': {'tokens_per_sec': 950, 'p95_ms': 1.05}}, baseline, 0.10) == []
+    regressions = compare({'a': {'tokens_per_sec': 800, 'p95_ms': 1.5}}, baseline, 0.10)
+    assert [r['metric'] for r in regressions] == ['tokens_per_sec', 'p95_ms'], regressions
+    assert compare({'new': {'tokens_per_sec': 1, 'p95_ms': 9}}, baseline) == []
+    print("Percentiles and regression threshold: OK")
+
+    results = run_suite(['hi-IN'], ('manual', 'normalizer', 'ssml'), requests=2,
+                        log=lambda line: None)
+    assert 'manual/hi-IN/synthetic-long' in results
+    assert 'normalizer:time/hi-IN/training' in results
+    assert 'ssml:compact/hi-IN/synthetic-medium' in results
+    for measurement in results.values():
+        assert measurement['tokens_per_sec'] > 0
+        assert measurement['p50_ms'] <= measurement['p95_ms'] <= measurement['p99_ms']
+    print(f"Minimal run: {len(results)} cases")
+
+    print("✅ Benchmark suite tests passed!")
+
+
+if __name__ == '__main__':
+    run()
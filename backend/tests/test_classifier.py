@@ -0,0 +1,70 @@
+"""
+ML classifier tests: single-pass predictions, memory-mapped model
+loading and saving over a model file that is still mapped (keeping its
+file mode).
+"""
+
+import os
+import tempfile
+import warnings
+
+import numpy as np
+
+from ml_classifier.model import CategoryClassifier
+from ml_classifier.feature_extractor import FeatureExtractor
+from benchmarks.corpus_builder import CorpusBuilder
+
+
+def _features(language, count=300):
+    tokens = ' '.join(CorpusBuilder(language, seed=5).build(count)).split()
+    return FeatureExtractor(language=language).extract_batch(tokens)
+
+
+def run():
+    print("\n" + "─"*70)
+    print("  ML CLASSIFIER TESTS")
+    print("─"*70)
+
+    features = _features('hi-IN')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for model_type in CategoryClassifier.get_available_models('hi-IN'):
+            mapped = CategoryClassifier(model_type)
+            mapped.load(language='hi-IN')
+            copied = CategoryClassifier(model_type)
+            copied.load(language='hi-IN', mmap_mode=None)
+            arrays = [v for v in vars(mapped.model).values() if isinstance(v, np.ndarray)]
+            assert arrays and all(isinstance(a, np.memmap) for a in arrays), model_type
+            assert mapped.predict(features) == copied.predict(features), model_type
+            print(f"hi-IN {model_type}: {len(arrays)} arrays mapped, same predictions")
+
+        # Label = argmax of the probabilities; scores only built on access
+        prediction = mapped.predict(features[:1])[0]
+        scores = prediction['all_scores']
+        assert prediction['category'] == max(scores, key=scores.get)
+        assert prediction['confidence'] == max(scores.values())
+        assert set(prediction) == {'category', 'confidence', 'all_scores'}
+        assert dict(prediction)['all_scores'] == scores
+        print(f"Prediction: {prediction!r}")
+
+        # Saving replaces the file; processes mapping the old one keep working
+        path = os.path.join(tempfile.mkdtemp(), 'model.pkl')
+        umask = os.umask(0)
+        os.umask(umask)
+        copied.save(path)
+        assert os.stat(path).st_mode & 0o777 == 0o666 & ~umask
+        os.chmod(path, 0o640)
+        reader = CategoryClassifier(model_type)
+        reader.load(path)
+        before = reader.predict(features)
+        copied.save(path)
+        assert reader.predict(features) == before
+        assert os.listdir(os.path.dirname(path)) == ['model.pkl']
+        assert os.stat(path).st_mode & 0o777 == 0o640
+    print("Save over a mapped model: old mapping intact, mode kept, no temp files left")
+
+    print("\n✅ ML classifier tests passed!")
+
+
+if __name__ == '__main__':
+    run()
@@ -1,6 +1,39 @@
-"""Date normalization tests."""
+"""Date normalization tests, including the precomputed day / month / year tables."""
 
+import language_pack
 from helpers import get_engine, print_test_result
+from normalizers import DateNormalizer, NumberToWordsConverter
+
+
+def _tables(language):
+    """Table lookups agree with _compose, inside the tables and at their edges."""
+    resources = language_pack.load(language)
+    normalizer = DateNormalizer(resources, NumberToWordsConverter(resources))
+    first, last = DateNormalizer.DEFAULT_YEAR_WINDOW
+    assert set(normalizer._days) == {str(d) for d in range(1, 32)} | {f'{d:02d}' for d in range(1, 32)}
+    assert str(first) in normalizer._years and str(last) in normalizer._years
+    assert str(first - 1) not in normalizer._years and str(last + 1) not in normalizer._years
+
+    # Every precomputed day and year, and the edges of the year window
+    for day in normalizer._days:
+        assert normalizer.normalize('', day, '08', '2024') == normalizer._compose(day, '08', '2024')
+    for year in list(normalizer._years) + [str(first - 1), str(last + 1), '2150', '999', '5']:
+        assert normalizer.normalize('', '15', '08', year) == normalizer._compose('15', '08', year), year
+
+    # Two-digit years are 20YY, in the table and out of it
+    assert normalizer.normalize('', '1', '1', '00') == normalizer.normalize('', '1', '1', '2000')
+    assert normalizer.normalize('', '1', '1', '99') == normalizer.normalize('', '1', '1', '2099')
+    assert normalizer.normalize('', '1', '1', '5') == normalizer.normalize('', '1', '1', '2005')
+
+    # Values outside the tables fall back to _compose
+    for day, month, year in [('32', '01', '2024'), ('0', '01', '2024'), ('15', '13', '2024'),
+                             ('15', '00', '2150'), ('99', '99', '9999')]:
+        assert None in (normalizer._days.get(day), normalizer._months.get(month),
+                        normalizer._years.get(year))
+        assert normalizer.normalize('', day, month, year) == normalizer._compose(day, month, year)
+    assert normalizer.normalize('32/01/2150') == normalizer._compose('32', '01', '2150')
+    print(f"{language}: {len(normalizer._days)} days, {len(normalizer._years)} years "
+          f"match _compose; {first}–{last} window edges + fallbacks OK")
 
 
 def run():
@@ -20,6 +53,9 @@ def run():
             engine.normalize(text, ['date']),
         )
 
+    for language in language_pack.available_languages():
+        _tables(language)
+
     print("✅ Date tests passed!")
 
 
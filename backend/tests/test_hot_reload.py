@@ -0,0 +1,127 @@
+"""
+Resource hot reload tests: change detection, failed reloads keeping the
+previous version, and engines swapped for the edited language only.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import warnings
+from pathlib import Path
+
+import language_pack
+from helpers import environ
+from resource_watcher import ResourceWatcher
+
+
+def _write(path, resources):
+    path.write_text(json.dumps(resources, ensure_ascii=False), encoding='utf-8')
+    # Same-second rewrites must still look changed
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def _watcher(directory):
+    path = directory / 'hi-IN.json'
+    resources = json.loads(path.read_text(encoding='utf-8'))
+    reloaded = []
+    watcher = ResourceWatcher(reloaded.append, directory=directory)
+    assert watcher.poll() == []
+    initial = watcher.status()['hi-IN']
+    assert initial['revision'] == 0 and initial['status'] == 'current'
+
+    _write(path, {**resources, 'language_name': 'Hindi (edited)'})
+    assert watcher.poll() == ['hi-IN'] and reloaded == ['hi-IN']
+    status = watcher.status()['hi-IN']
+    assert status['revision'] == 1 and status['version'] != initial['version']
+    assert watcher.poll() == []
+
+    def reject(language):
+        raise ValueError('broken')
+
+    watcher._reload = reject
+    _write(path, resources)
+    watcher.poll()
+    failed = watcher.status()['hi-IN']
+    assert failed['status'] == 'failed' and failed['error'] == 'broken'
+    assert failed['version'] == status['version'] and failed['revision'] == 1
+    print(f"Watcher: change → revision 1 ({status['version']}); failed reload keeps it")
+
+
+def _app_reload(directory):
+    import app as app_module
+    from normalizers import NumberToWordsConverter
+
+    path = directory / 'hi-IN.json'
+    resources = json.loads(path.read_text(encoding='utf-8'))
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        manual = app_module.get_engine('hi-IN')
+        hybrid = app_module.get_hybrid_engine('hi-IN')
+        other = app_module.get_engine('ne-NP')
+        converter = NumberToWordsConverter.shared(resources)
+        assert 'किलोग्राम' in manual.normalize('5kg', ['unit'])['normalized_text']
+
+        # Invalid edit: nothing is swapped
+        _write(path, {**resources, 'numbers': {}})
+        try:
+            app_module.reload_language('hi-IN')
+            raise AssertionError("expected ValueError")
+        except ValueError as e:
+            assert 'numbers' in str(e)
+        assert app_module.get_engine('hi-IN') is manual
+
+        edited = json.loads(json.dumps(resources))
+        edited['units']['kg'] = 'केजी'
+        _write(path, edited)
+        app_module.reload_language('hi-IN')
+
+        new_manual = app_module.get_engine('hi-IN')
+        new_hybrid = app_module.get_hybrid_engine('hi-IN')
+        assert new_manual is not manual and new_hybrid is not hybrid
+        assert app_module.get_engine('ne-NP') is other
+        assert NumberToWordsConverter.shared(edited) is not converter
+        assert 'केजी' in new_manual.normalize('5kg', ['unit'])['normalized_text']
+        assert 'केजी' in new_hybrid.normalize('5kg')['normalized_text']
+        # The old engine still works for requests that already hold it
+        assert 'किलोग्राम' in manual.normalize('5kg', ['unit'])['normalized_text']
+
+        client = app_module.app.test_client()
+        body = client.get('/api/resources').get_json()
+        assert body['success'] and 'hi-IN' in body['languages']
+    print("App: edited unit name live in manual + hybrid engines; ne-NP untouched")
+
+
+def run():
+    print("\n" + "─"*70)
+    print("  RESOURCE HOT RELOAD TESTS")
+    print("─"*70)
+
+    directory = Path(tempfile.mkdtemp())
+    shutil.copy(language_pack.source_path('hi-IN'), directory / 'hi-IN.json')
+    _watcher(directory)
+
+    # Engines read resources through language_pack; point it at the copy
+    original = language_pack.RESOURCES_DIR, language_pack.PACKS_DIR
+    language_pack.RESOURCES_DIR = directory
+    language_pack.PACKS_DIR = directory / 'packs'
+    shutil.copy(original[0] / 'ne-NP.json', directory / 'ne-NP.json')
+    try:
+        with environ(TN_WARMUP_LANGUAGES='none'):
+            _app_reload(directory)
+    finally:
+        language_pack.RESOURCES_DIR, language_pack.PACKS_DIR = original
+        import app as app_module
+        from normalizers import NumberToWordsConverter
+        for language in ('hi-IN', 'ne-NP'):
+            app_module._engines.discard(language)
+            app_module._hybrid_engines.discard(language)
+            NumberToWordsConverter.release(language)
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print("\n✅ Resource hot reload tests passed!")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,87 @@
+"""
+Language pack tests: validation, build / staleness checks, and identical
+engine output with and without packs.
+"""
+
+import os
+import tempfile
+import warnings
+from pathlib import Path
+
+import language_pack
+from normalizers import NumberToWordsConverter
+
+CATEGORIES = ['currency', 'cardinal', 'unit', 'date', 'time', 'ordinal', 'named_entity']
+
+
+def _output(language, text):
+    from engine import NormalizationEngine
+    from engine.hybrid_engine import HybridEngine
+    NumberToWordsConverter.release(language)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        manual = NormalizationEngine(language=language).normalize(text, CATEGORIES)
+        hybrid = HybridEngine(language=language).normalize(text)
+    return manual, hybrid
+
+
+def run():
+    print("\n" + "─"*70)
+    print("  LANGUAGE PACK TESTS")
+    print("─"*70)
+
+    resources = language_pack.load('hi-IN')
+    language_pack.validate(resources, 'hi-IN')
+    for broken, message in (
+        ({**resources, 'language': 'ne-NP'}, '"language"'),
+        ({**resources, 'numbers': {'ones': {}, 'tens': {}}}, 'numbers.scales'),
+        ({**resources, 'patterns': {'bad': '(['}}, 'pattern "bad"'),
+    ):
+        try:
+            language_pack.validate(broken, 'hi-IN')
+        except ValueError as e:
+            assert message in str(e) and 'resources/hi-IN.json' in str(e), e
+        else:
+            raise AssertionError(f"validation passed without {message}")
+    print("Validation: errors name the file and the entry")
+
+    original = language_pack.PACKS_DIR
+    language_pack.PACKS_DIR = Path(tempfile.mkdtemp())
+    try:
+        assert not language_pack.is_current('ne-NP')
+        language_pack.build('ne-NP')
+        assert language_pack.is_current('ne-NP')
+
+        # Packs get the usual file mode (not mkstemp's 0600), and keep it on rebuild
+        umask = os.umask(0)
+        os.umask(umask)
+        path = language_pack.pack_path('ne-NP')
+        assert path.stat().st_mode & 0o777 == 0o666 & ~umask
+        path.chmod(0o640)
+        language_pack.build('ne-NP')
+        assert path.stat().st_mode & 0o777 == 0o640
+
+        # A normalizer code change makes the pack stale
+        language_pack._code_hash = 'changed'
+        assert not language_pack.is_current('ne-NP')
+        language_pack._code_hash = None
+        assert language_pack.is_current('ne-NP')
+
+        text = '15/08/2024 को 10:30 बजे ₹500 दिए, तीसरा 5kg'
+        with_packs = _output('ne-NP', text)
+        os.environ['TN_LANGUAGE_PACKS'] = '0'
+        try:
+            without_packs = _output('ne-NP', text)
+        finally:
+            del os.environ['TN_LANGUAGE_PACKS']
+        assert with_packs == without_packs
+    finally:
+        language_pack.PACKS_DIR = original
+        NumberToWordsConverter.release('ne-NP')
+    print(f"ne-NP: same output with and without a pack: {with_packs[1]['normalized_text']!r}")
+
+    print("\n✅ Language pack tests passed!")
+
+
+if __name__ == '__main__':
+    run()
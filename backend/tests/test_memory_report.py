@@ -0,0 +1,48 @@
+"""
+Memory footprint report tests: deep sizeof accounting, per-piece
+measurement of one language pack, and the budget warning.
+"""
+
+import sys
+
+from memory_report import deep_sizeof, measure_language, budget_warning, MB
+
+PIECES = ('resources', 'dfas', 'normalizers', 'rule_detector', 'feature_extractor', 'ml_model')
+
+
+def run():
+    print("\n" + "─"*70)
+    print("  MEMORY REPORT TESTS")
+    print("─"*70)
+
+    shared = ['x' * 1000]
+    a = {'shared': shared}
+    b = {'shared': shared}
+    seen = set()
+    first = deep_sizeof(a, seen)
+    second = deep_sizeof(b, seen)
+    assert first > 1000 and second < 1000, (first, second)
+    assert deep_sizeof([shared, shared]) < 2 * deep_sizeof(shared) + sys.getsizeof([])
+    print("deep_sizeof: shared objects counted once")
+
+    result = measure_language('kn-IN-belgaum')
+    for name in PIECES:
+        entry = result['pieces'][name]
+        assert entry['traced_bytes'] > 0 and entry['retained_bytes'] > 0, (name, entry)
+    assert result['ml']['available'] and result['ml']['model_bytes'] > 0
+    assert result['ml']['mapped_bytes'] > 0  # coefficients are memory-mapped
+    assert result['caches']['converter_tables_bytes'] > 0
+    engines = result['engines']
+    assert engines['total_traced_bytes'] == engines['manual_traced_bytes'] + engines['hybrid_traced_bytes']
+    print(f"kn-IN-belgaum: {engines['total_traced_bytes'] / MB:.2f} MB for manual + hybrid engines")
+
+    assert budget_warning(10 * MB, 20) is None
+    assert budget_warning(10 * MB, None) is None
+    assert '10.0 MB' in budget_warning(10 * MB, 5)
+    print("Budget warning: OK")
+
+    print("✅ Memory report tests passed!")
+
+
+if __name__ == '__main__':
+    run()
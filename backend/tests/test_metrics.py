@@ -0,0 +1,107 @@
+"""
+Metrics tests: Prometheus text rendering and per-stage instrumentation
+of the hybrid pipeline.
+"""
+
+import warnings
+
+import metrics
+from helpers import environ
+from metrics import Counter, Histogram
+
+HYBRID_STAGES = (
+    'tokenize', 'rule_detection', 'feature_extraction', 'ml_predict',
+    'combine', 'normalize', 'ssml',
+)
+
+
+def _render(metric):
+    return '\n'.join(f'{name}{labels} {value}' for name, labels, value in metric.samples())
+
+
+def run():
+    print("\n" + "─"*70)
+    print("  METRICS TESTS")
+    print("─"*70)
+
+    counter = Counter('t_total', 'doc', ('endpoint',))
+    counter.inc('/a')
+    counter.inc('/a', amount=2)
+    counter.inc('/"b"')
+    assert counter.value('/a') == 3
+    assert _render(counter) == 't_total{endpoint="/\\"b\\""} 1\nt_total{endpoint="/a"} 3'
+
+    histogram = Histogram('t_seconds', 'doc', ('stage',), buckets=(0.1, 1))
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value, 'x')
+    lines = _render(histogram).split('\n')
+    assert lines == [
+        't_seconds_bucket{stage="x",le="0.1"} 1',
+        't_seconds_bucket{stage="x",le="1"} 2',
+        't_seconds_bucket{stage="x",le="+Inf"} 3',
+        't_seconds_sum{stage="x"} 5.55',
+        't_seconds_count{stage="x"} 3',
+    ], lines
+    print("Counter / histogram rendering: OK")
+
+    from engine.hybrid_engine import HybridEngine
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        engine = HybridEngine(language='hi-IN')
+        assert engine.ml_available
+        metrics.reset()
+        engine.normalize("₹500 10:30 5kg")
+
+    for stage in HYBRID_STAGES:
+        assert metrics.STAGE_SECONDS.count('hybrid', 'hi-IN', stage) == 1, stage
+    total = sum(
+        metrics.TOKENS.value('hybrid', 'hi-IN', category)
+        for category in ('currency', 'time', 'unit', 'cardinal', 'text')
+    )
+    assert total == 3, total
+    rendered = metrics.render()
+    assert '# TYPE tn_pipeline_stage_duration_seconds histogram' in rendered
+    assert 'stage="ml_predict"' in rendered
+    print(f"Hybrid pipeline: {len(HYBRID_STAGES)} stages timed, {total} tokens counted")
+
+    # Excluded work (warm-up) records nothing; other threads still do
+    import threading
+    import app as app_module
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        metrics.reset()
+        engine.normalize("₹500")
+        recorded = lambda: [list(m.samples()) for m in metrics._METRICS]
+        before = recorded()
+
+        def excluded_work():
+            with metrics.excluded():
+                engine.normalize("₹500 10:30 5kg")
+            app_module.warm_up(['hi-IN'])  # excludes itself
+
+        worker = threading.Thread(target=excluded_work)
+        worker.start()
+        worker.join()
+        assert recorded() == before
+        engine.normalize("₹500")
+    assert metrics.STAGE_SECONDS.count('hybrid', 'hi-IN', 'tokenize') == 2
+    print("Excluded work (warm-up): not recorded; real requests kept")
+
+    # A non-string language is labelled "other" and is a JSON 400, not a 500
+    metrics.reset()
+    client = app_module.app.test_client()
+    with environ(TN_WARMUP_LANGUAGES='none'):
+        for route in ('/api/normalize', '/api/auto-normalize', '/api/sessions'):
+            for language in (['hi-IN'], {'code': 'hi-IN'}):
+                response = client.post(route, json={'text': '5kg', 'language': language})
+                assert response.status_code == 400, (route, language, response.status_code)
+                assert response.get_json()['success'] is False
+            assert metrics.REQUESTS.value(route, 'other', '400') == 2
+    print("Unhashable language: labelled 'other', JSON 400")
+
+    metrics.reset()
+    print("✅ Metrics tests passed!")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,63 @@
+"""
+Shared converter tests: one NumberToWordsConverter (and one set of
+precomputed tables) per language across both engines, and release().
+"""
+
+import warnings
+
+from engine import NormalizationEngine
+from engine.hybrid_engine import HybridEngine
+from normalizers import NumberToWordsConverter
+
+
+def _converters(manual, hybrid):
+    normalizers = [
+        manual.currency_normalizer, manual.cardinal_normalizer, manual.unit_normalizer,
+        manual.date_normalizer, manual.time_normalizer, manual.ordinal_normalizer,
+    ] + [n for n in hybrid.normalizers.values() if hasattr(n, 'converter')]
+    return {id(n.converter): n.converter for n in normalizers}
+
+
+def run():
+    print("\n" + "─"*70)
+    print("  SHARED CONVERTER TESTS")
+    print("─"*70)
+
+    NumberToWordsConverter.release('ne-NP')
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            manual = NormalizationEngine(language='ne-NP')
+            hybrid = HybridEngine(language='ne-NP')
+            other = NormalizationEngine(language='hi-IN')
+
+            converters = _converters(manual, hybrid)
+            assert len(converters) == 1, converters
+            converter = next(iter(converters.values()))
+            assert converter is NumberToWordsConverter.shared(manual.resources)
+            assert manual.time_normalizer._table is hybrid.normalizers['time']._table
+            assert manual.date_normalizer._years is hybrid.normalizers['date']._years
+            assert other.cardinal_normalizer.converter is not converter
+            print("ne-NP: manual + hybrid engines share one converter and its tables")
+
+            # After release() the next engine builds (and shares) a new one
+            NumberToWordsConverter.release('ne-NP')
+            rebuilt = NormalizationEngine(language='ne-NP')
+            fresh = rebuilt.cardinal_normalizer.converter
+            assert fresh is not converter
+            assert fresh is NumberToWordsConverter.shared(rebuilt.resources)
+            assert rebuilt.time_normalizer._table is not manual.time_normalizer._table
+            assert HybridEngine(language='ne-NP').normalizers['cardinal'].converter is fresh
+            assert other.cardinal_normalizer.converter is NumberToWordsConverter.shared(other.resources)
+            # Engines built before the release keep working on the old one
+            assert manual.cardinal_normalizer.converter is converter
+            assert manual.normalize('25', ['cardinal']) == rebuilt.normalize('25', ['cardinal'])
+            print("release('ne-NP'): next engines get a new converter; hi-IN untouched")
+    finally:
+        NumberToWordsConverter.release('ne-NP')
+
+    print("\n✅ Shared converter tests passed!")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,89 @@
+"""
+Intra-request parallelism tests: sentence chunking, identical output to
+serial hybrid normalization, and pool workers picking up a retrained model.
+"""
+
+import shutil
+import tempfile
+import warnings
+from pathlib import Path
+
+from engine.parallel import ParallelNormalizer, split_chunks
+from benchmarks.corpus_builder import CorpusBuilder
+
+
+def _retrained_model(text):
+    """After a model update, pool workers must not keep the old model."""
+    import app as app_module
+    from ml_classifier import model
+
+    original_parallel, original_dir = app_module._parallel, model.MODELS_DIR
+    app_module._parallel = ParallelNormalizer(workers=2, min_chars=1000, chunk_tokens=300)
+    # "Retrain": the SVM's weights take the logistic regression model's place
+    model.MODELS_DIR = Path(tempfile.mkdtemp())
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            before = app_module.get_hybrid_engine('hi-IN')
+            app_module._parallel.normalize(before, text)  # workers load the old model
+            retrained = model.CategoryClassifier('svm')
+            retrained.load(original_dir / 'hi-IN_svm.pkl')
+            retrained.model_type = 'logistic_regression'
+            retrained.save(language='hi-IN')
+
+            app_module.model_updated('hi-IN')
+            after = app_module.get_hybrid_engine('hi-IN')
+            assert after is not before
+            serial = after.normalize(text)
+            assert serial != before.normalize(text)
+            assert app_module._parallel.normalize(after, text) == serial
+    finally:
+        app_module._parallel.shutdown()
+        app_module._parallel = original_parallel
+        shutil.rmtree(model.MODELS_DIR, ignore_errors=True)
+        model.MODELS_DIR = original_dir
+        app_module._hybrid_engines.discard('hi-IN')
+    print("Model update: pool restarted, parallel output matches the new model")
+
+
+def run():
+    print("\n" + "─"*70)
+    print("  INTRA-REQUEST PARALLELISM TESTS")
+    print("─"*70)
+
+    words = 'a b c। d e f g. h i j k l m n o p'.split()
+    chunks = split_chunks(words, 2)
+    # Cut after each sentence end, or at 2 × target without one
+    assert chunks == [(0, 3), (3, 7), (7, 11), (11, 15), (15, 16)], chunks
+    assert split_chunks([], 5) == []
+    print(f"Sentence chunks: {chunks}")
+
+    from engine.hybrid_engine import HybridEngine
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        engine = HybridEngine(language='hi-IN')
+
+        # Feature windows see the same context as the whole token list
+        tokens = CorpusBuilder('hi-IN', seed=3).text_of_length(40).split()
+        full = engine.feature_extractor.extract_batch(tokens)
+        assert engine.feature_extractor.extract_batch(tokens, 10, 20) == full[10:20]
+
+        text = ' '.join(CorpusBuilder('hi-IN', seed=7).build(3000))
+        parallel = ParallelNormalizer(workers=2, min_chars=1000, chunk_tokens=300)
+        assert parallel.applies(text) and not parallel.applies('₹500')
+        try:
+            for ssml_mode, fields in (('full', None), ('none', ['normalized_text'])):
+                serial = engine.normalize(text, ssml_mode, fields)
+                assert parallel.normalize(engine, text, ssml_mode, fields) == serial
+        finally:
+            parallel.shutdown()
+
+    print(f"{len(text)} chars in {len(split_chunks(text.split(), 300))} chunks: "
+          "identical to serial")
+
+    _retrained_model(text)
+    print("\n✅ Intra-request parallelism tests passed!")
+
+
+if __name__ == '__main__':
+    run()
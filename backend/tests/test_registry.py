@@ -0,0 +1,158 @@
+"""
+Engine registry tests.
+
+Fires concurrent first requests for every language at once and checks
+that each engine is built exactly once and shared by all callers, then
+checks LRU and idle-TTL eviction of a bounded registry.
+"""
+
+import threading
+import warnings
+from pathlib import Path
+
+from helpers import ALL_CATEGORIES
+from engine import NormalizationEngine, EngineRegistry
+
+THREADS_PER_LANGUAGE = 8
+
+_RESOURCES_DIR = Path(__file__).resolve().parent.parent / 'resources'
+
+
+def _counting(factory, counts, counts_lock):
+    def build(language):
+        with counts_lock:
+            counts[language] = counts.get(language, 0) + 1
+        return factory(language)
+    return build
+
+
+def _stress(name, factory, languages, call):
+    counts = {}
+    registry = EngineRegistry(_counting(factory, counts, threading.Lock()))
+    barrier = threading.Barrier(len(languages) * THREADS_PER_LANGUAGE)
+    seen = {language: set() for language in languages}
+    errors = []
+
+    def worker(language):
+        try:
+            barrier.wait()
+            engine = registry.get(language)
+            call(engine)
+            seen[language].add(id(engine))
+        except Exception as e:  # surfaced below
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=worker, args=(language,))
+        for language in languages
+        for _ in range(THREADS_PER_LANGUAGE)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors, errors
+    for language in languages:
+        assert counts[language] == 1, (language, counts[language])
+        assert len(seen[language]) == 1, language
+    print(f"{name}: {len(threads)} concurrent first requests → "
+          f"{sum(counts.values())} engines for {len(languages)} languages")
+    return registry
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _eviction():
+    clock = _Clock()
+    evicted = []
+    built = []
+    registry = EngineRegistry(
+        lambda language: object(),
+        max_engines=2, idle_ttl=60, clock=clock,
+        on_evict=lambda language, engine: evicted.append(language),
+        on_build=lambda language, engine: built.append(language),
+    )
+
+    # LRU: touching hi-IN makes ne-NP the least recently used
+    hi = registry.get('hi-IN')
+    clock.now = 1
+    registry.get('ne-NP')
+    clock.now = 2
+    assert registry.get('hi-IN') is hi
+    clock.now = 3
+    registry.get('ta-IN')
+    assert evicted == ['ne-NP'], evicted
+    assert registry.languages() == ['hi-IN', 'ta-IN']
+    assert [e['language'] for e in registry.resident()] == ['ta-IN', 'hi-IN']
+
+    # Idle TTL: hi-IN last used at 2, ta-IN kept alive at 50
+    clock.now = 50
+    registry.get('ta-IN')
+    clock.now = 70
+    registry.get('ta-IN')
+    assert evicted == ['ne-NP', 'hi-IN'], evicted
+    assert registry.languages() == ['ta-IN']
+
+    # Evicted languages are rebuilt on demand
+    assert registry.get('hi-IN') is not hi
+    assert built == ['hi-IN', 'ne-NP', 'ta-IN', 'hi-IN'], built
+    assert registry.peek('ne-NP') is None and registry.peek('hi-IN') is not None
+    stats = registry.stats()
+    assert stats['evictions'] == 2 and stats['max_engines'] == 2
+    print(f"Bounded registry: evicted {evicted}, resident "
+          f"{[e['language'] for e in stats['resident']]}")
+
+
+def run():
+    print("\n" + "─"*70)
+    print("  ENGINE REGISTRY CONCURRENCY TESTS")
+    print("─"*70)
+
+    languages = sorted(f.stem for f in _RESOURCES_DIR.glob('*.json'))
+
+    _stress(
+        "Manual engines",
+        lambda language: NormalizationEngine(language=language),
+        languages,
+        lambda engine: engine.normalize("₹500 10:30 5kg", ALL_CATEGORIES),
+    )
+
+    from engine.hybrid_engine import HybridEngine
+    with warnings.catch_warnings():
+        # sklearn version-mismatch warnings from the bundled pickles
+        warnings.simplefilter('ignore')
+        registry = _stress(
+            "Hybrid engines",
+            lambda language: HybridEngine(language=language),
+            languages,
+            lambda engine: engine.normalize("₹500 10:30 5kg"),
+        )
+
+        # Unknown languages raise and leave nothing behind
+        try:
+            registry.get('xx-XX')
+            raise AssertionError("expected FileNotFoundError")
+        except FileNotFoundError:
+            pass
+        assert 'xx-XX' not in registry
+
+        # Discard forces a rebuild on next access
+        before = registry.get('hi-IN')
+        registry.discard('hi-IN')
+        assert 'hi-IN' not in registry
+        assert registry.get('hi-IN') is not before
+
+    _eviction()
+
+    print("✅ Registry tests passed!")
+
+
+if __name__ == '__main__':
+    run()
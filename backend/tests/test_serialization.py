@@ -0,0 +1,95 @@
+"""
+Response serialization tests: every JSON backend with numpy payloads,
+unknown backends, and Accept-Encoding negotiation.
+"""
+
+import gzip
+import json
+import os
+import subprocess
+import sys
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+import serialization
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _backends():
+    payload = {
+        'text': 'पाँच सौ रुपये',
+        'importance': np.float64(0.12345),
+        'count': np.int64(3),
+        'scores': np.array([0.25, 0.75]),
+    }
+    expected = {'text': 'पाँच सौ रुपये', 'importance': 0.12345, 'count': 3, 'scores': [0.25, 0.75]}
+    for backend in serialization.available_backends():
+        body = serialization.dumps(payload, backend=backend)
+        assert json.loads(body) == expected, (backend, body)
+        assert 'पाँच'.encode('utf-8') in body, backend
+    escaped = serialization.dumps(payload, ensure_ascii=True)
+    assert json.loads(escaped) == expected and b'\\u' in escaped
+    print(f"numpy payloads: {serialization.available_backends()} + ensure_ascii")
+
+    try:
+        serialization.dumps({}, backend='nope')
+        raise AssertionError("expected ValueError")
+    except ValueError as e:
+        assert "'nope'" in str(e)
+    assert serialization.check_backend('json') == 'json'
+
+    # The app refuses to start with an unknown TN_JSON_BACKEND
+    result = subprocess.run(
+        [sys.executable, '-c', 'import app'], cwd=_BACKEND_DIR,
+        env=dict(os.environ, TN_JSON_BACKEND='nope', TN_WARMUP_LANGUAGES='none'),
+        capture_output=True, text=True,
+    )
+    assert result.returncode != 0 and "JSON backend 'nope'" in result.stderr
+    print("Unknown backend: ValueError, app fails at import")
+
+
+def _compression():
+    body = b'x' * 5000
+    cases = [
+        ('gzip', 'gzip'),
+        ('deflate', 'deflate'),
+        ('gzip, deflate', 'gzip'),
+        ('gzip;q=0.5, deflate', 'deflate'),
+        ('gzip;q=0, deflate;q=0', None),
+        ('*', 'gzip'),
+        ('*;q=0.5, gzip;q=0', 'deflate'),
+        ('*;q=0', None),
+        ('br', None),
+        ('identity', None),
+        ('', None),
+    ]
+    for header, expected in cases:
+        compressed, encoding = serialization.compress(body, header, min_bytes=100)
+        assert encoding == expected, (header, encoding)
+        if encoding == 'gzip':
+            assert gzip.decompress(compressed) == body
+        elif encoding == 'deflate':
+            assert zlib.decompress(compressed) == body
+        else:
+            assert compressed is body
+    assert serialization.compress(body, 'gzip', min_bytes=10_000) == (body, None)
+    assert serialization.compress(body, 'gzip', min_bytes=0) == (body, None)
+    print(f"Accept-Encoding: {len(cases)} headers negotiated (q-values, '*')")
+
+
+def run():
+    print("\n" + "─"*70)
+    print("  SERIALIZATION TESTS")
+    print("─"*70)
+
+    _backends()
+    _compression()
+
+    print("\n✅ Serialization tests passed!")
+
+
+if __name__ == '__main__':
+    run()
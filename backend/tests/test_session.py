@@ -0,0 +1,131 @@
+"""
+Incremental editing session tests: edits re-detect only the affected
+tokens and always match a fresh normalization of the edited text.
+"""
+
+import random
+import warnings
+
+from engine.session import EditSession, SessionStore
+from benchmarks.corpus_builder import CorpusBuilder
+from helpers import environ
+
+
+def _without_offsets(details):
+    return [{k: v for k, v in d.items() if k not in ('start', 'end')} for d in details]
+
+
+def _random_edits(engine, steps=80):
+    builder = CorpusBuilder('hi-IN', seed=11)
+    session = EditSession(engine, '  '.join(builder.build(200)) + '\n')
+    rng = random.Random(4)
+    pieces = [token for token, _ in builder.sentence()] + ['', ' ', '\n', 'PM', '₹', '5', '.']
+
+    for step in range(steps):
+        size = len(session.text)
+        start = rng.randint(0, size)
+        end = min(size, start + rng.choice((0, 0, 1, 3, 12)))
+        previous_text = session.normalized_text
+        previous_details = [dict(d) for d in session.details]
+
+        result = session.edit(start, end, rng.choice(pieces))
+        expected = engine.normalize(session.text, ssml_mode='none')
+        assert session.details == expected['token_details'], step
+        assert session.normalized_text == expected['normalized_text'], step
+
+        # The returned splices turn the previous revision into the new one
+        segment, tokens = result['segment'], result['tokens']
+        assert (previous_text[:segment['start']] + segment['text']
+                + previous_text[segment['end']:]) == expected['normalized_text'], step
+        spliced = (previous_details[:tokens['start']] + tokens['details']
+                   + previous_details[tokens['end']:])
+        assert _without_offsets(spliced) == _without_offsets(expected['token_details']), step
+    return session
+
+
+def _store(engine):
+    now = [0.0]
+    store = SessionStore(max_sessions=2, idle_ttl=60, clock=lambda: now[0])
+    ids = []
+    for text in ('a', 'b', 'c'):
+        ids.append(store.create(engine, text)[0])
+        now[0] += 1
+    # Over max_sessions: the least recently used one is dropped
+    assert store.get(ids[0]) is None and store.get(ids[1]).text == 'b'
+    now[0] += 61
+    assert store.get(ids[2]) is None and len(store) == 0
+    assert not store.discard(ids[1])
+
+
+def _endpoints():
+    from app import app
+    client = app.test_client()
+
+    # Non-string field names are a client error, not a crash
+    for route in ('/api/normalize', '/api/auto-normalize', '/api/sessions'):
+        response = client.post(route, json={
+            'text': 'किराया 500 है', 'language': 'hi-IN', 'fields': ['ssml', 1],
+        })
+        assert response.status_code == 400, (route, response.status_code)
+
+    created = client.post('/api/sessions', json={
+        'text': 'किराया 500 है', 'language': 'hi-IN', 'fields': ['normalized_text'],
+    }).get_json()
+    assert created['success'] and created['revision'] == 0
+    session_id = created['session_id']
+
+    prefix = 'किराया '
+    edited = client.post(f'/api/sessions/{session_id}/edits', json={
+        'start': len(prefix), 'end': len(prefix) + 3, 'text': '₹500', 'revision': 0,
+    }).get_json()
+    assert edited['revision'] == 1, edited
+    segment = edited['segment']
+    text = created['normalized_text']
+    text = text[:segment['start']] + segment['text'] + text[segment['end']:]
+
+    current = client.get(f'/api/sessions/{session_id}?fields=normalized_text').get_json()
+    assert current['normalized_text'] == text and 'रुपये' in text, (current, text)
+
+    stale = client.post(f'/api/sessions/{session_id}/edits', json={
+        'start': 0, 'end': 0, 'text': 'x', 'revision': 0,
+    })
+    assert stale.status_code == 409
+    assert client.post(f'/api/sessions/{session_id}/edits', json={
+        'start': 99, 'end': 100, 'text': '',
+    }).status_code == 400
+    assert client.delete(f'/api/sessions/{session_id}').status_code == 200
+    assert client.get(f'/api/sessions/{session_id}').status_code == 404
+    print(f"Endpoints: {created['normalized_text']!r} → {text!r}")
+
+
+def run():
+    print("\n" + "─"*70)
+    print("  INCREMENTAL EDITING SESSION TESTS")
+    print("─"*70)
+
+    from engine.hybrid_engine import HybridEngine
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        engine = HybridEngine(language='hi-IN')
+        session = _random_edits(engine)
+        print(f"80 random edits: session matches a fresh normalize() "
+              f"({len(session.details)} tokens)")
+
+        long_text = '  '.join(CorpusBuilder('hi-IN', seed=2).build(2000))
+        session = EditSession(engine, long_text)
+        middle = len(long_text) // 2
+        result = session.edit(middle, middle, ' 10:30 ')
+        assert result['reanalyzed'] <= 2 * 2 + 3, result['reanalyzed']
+        print(f"Edit in a {len(session.details)}-token text re-analyzed "
+              f"{result['reanalyzed']} tokens")
+
+        _store(engine)
+        print("Session store: LRU bound and idle expiry OK")
+        with environ(TN_WARMUP_LANGUAGES='none'):
+            _endpoints()
+
+    print("\n✅ Incremental editing session tests passed!")
+
+
+if __name__ == '__main__':
+    run()
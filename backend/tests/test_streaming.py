@@ -0,0 +1,98 @@
+"""Incremental (sentence-by-sentence) normalization tests."""
+
+import io
+import re
+import warnings
+import xml.etree.ElementTree as ET
+
+from helpers import get_engine, ALL_CATEGORIES
+from benchmarks.corpus_builder import CorpusBuilder
+from engine.hybrid_engine import HybridEngine
+from ssml import SSMLGenerator
+
+
+def run():
+    engine = get_engine()
+
+    print("\n" + "─"*70)
+    print("  STREAMING / normalize_iter TESTS")
+    print("─"*70)
+
+    text = "ट्रेन 14:45 पर आएगी।\nकिराया ₹500 है।\r\n\nडॉ. शर्मा 5kg लाए"
+    full = engine.normalize(text, ALL_CATEGORIES)
+
+    results = list(engine.normalize_iter(text, ALL_CATEGORIES))
+    for r in results:
+        print(f"Sentence {r['sentence']} (line {r['line']}) @{r['offset']}: "
+              f"{r['normalized_text']!r}")
+        for dfa in r['dfa_info']:
+            assert text[dfa['start']:dfa['end']] == dfa['original']
+
+    assert [r['line'] for r in results] == [0, 1, 2, 3, 3]
+    assert ''.join(r['normalized_text'] for r in results) == full['normalized_text']
+
+    # Any iterable of lines works, consumed lazily
+    lines = iter(text.splitlines(keepends=True))
+    first = next(engine.normalize_iter(lines, ALL_CATEGORIES))
+    assert first['normalized_text'] == results[0]['normalized_text']
+    assert next(lines).startswith('किराया')
+
+    # Hybrid: a single paragraph streams per sentence, with the classifier's
+    # context carried across sentence ends, so the chunks add up to normalize()
+    paragraph = '। '.join(CorpusBuilder('hi-IN', seed=3).build(80)) + '\nकिराया ₹500 है। 5kg'
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        hybrid = HybridEngine(language='hi-IN')
+        whole = hybrid.normalize(paragraph)
+        chunks = list(hybrid.normalize_iter(paragraph))
+    assert [c['line'] for c in chunks].count(0) > 3 and chunks[-1]['line'] == 1
+    assert ''.join(c['normalized_text'] for c in chunks) == whole['normalized_text']
+    assert [d for c in chunks for d in c['token_details']] == whole['token_details']
+    print(f"Hybrid: {len(chunks)} sentences join to normalize() output")
+
+    # Streaming SSML matches the one-shot document
+    generator = SSMLGenerator(language='hi-IN')
+    tokens = [
+        {'original': w, 'normalized': w, 'category': c}
+        for w, c in [('₹500', 'currency'), ('डॉ.', 'named_entity'),
+                     ('10:30', 'time'), ('है', 'text')]
+    ] * 200
+    document = generator.generate(tokens)
+    chunks = list(generator.stream(tokens, chunk_size=1024))
+    assert len(chunks) > 1 and ''.join(chunks) == document
+    buffer = io.StringIO()
+    generator.write(tokens, buffer)
+    assert buffer.getvalue() == document
+
+    # Splitting yields several valid <speak> documents under the byte limit
+    documents = list(generator.split_documents(tokens, max_bytes=5000))
+    for doc in documents:
+        assert len(doc.encode('utf-8')) <= 5000
+        ET.fromstring(doc.encode('utf-8'))
+    print(f"SSML: {len(document.encode('utf-8'))} bytes → "
+          f"{len(chunks)} chunks, {len(documents)} documents ≤ 5000 bytes")
+
+    # Compact mode: the full document minus layout whitespace, on one line;
+    # 'none' skips SSML entirely
+    compact = engine.normalize(text, ALL_CATEGORIES, ssml_mode='compact')['ssml']
+    assert '\n' not in compact and len(compact) < len(full['ssml'])
+    assert re.sub(r'\s+', '', compact) == re.sub(r'\s+', '', full['ssml'])
+    for markup in ('format="long"', '<emphasis level="moderate">', 'format="hms24"'):
+        assert markup in compact, markup
+    ET.fromstring(compact.encode('utf-8'))
+    assert 'ssml' not in engine.normalize(text, ALL_CATEGORIES, ssml_mode='none')
+    only_text = engine.normalize(text, ALL_CATEGORIES, fields=['normalized_text'])
+    assert only_text == {'normalized_text': full['normalized_text']}
+    for fields in (['ssml', 1], [None], 'bogus', 5):
+        try:
+            engine.normalize(text, ALL_CATEGORIES, fields=fields)
+            raise AssertionError(f"fields={fields!r} accepted")
+        except ValueError:
+            pass
+    print(f"Compact SSML: {len(compact)} chars (full: {len(full['ssml'])})")
+
+    print("✅ Streaming tests passed!")
+
+
+if __name__ == '__main__':
+    run()
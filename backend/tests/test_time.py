@@ -1,6 +1,68 @@
-"""Time normalization tests."""
+"""Time normalization tests, including the precomputed HH:MM tables."""
 
+import json
+import re
+
+import language_pack
 from helpers import get_engine, print_test_result
+from normalizers import NumberToWordsConverter, TimeNormalizer
+
+# Spellings the time pattern accepts, by the period they collapse to
+PERIOD_SPELLINGS = {None: ('',), 'AM': ('AM', 'am', 'A.M.'), 'PM': ('PM', 'pm', 'P.M.')}
+
+
+def _tables(language):
+    """Every table entry and its text form agree with composing from scratch."""
+    resources = language_pack.load(language)
+    normalizer = TimeNormalizer(resources, NumberToWordsConverter(resources))
+    pattern = re.compile(normalizer.patterns['time'], re.IGNORECASE)
+    assert len(normalizer._table) == 24 * 60 * 3
+    for hour in range(24):
+        for minute in range(60):
+            for period, spellings in PERIOD_SPELLINGS.items():
+                expected = normalizer._compose(hour, minute, None, period)
+                assert normalizer._table[(hour, minute, period)] == expected
+                for spelling in spellings:
+                    groups = (f'{hour:02d}', f'{minute:02d}', None, spelling)
+                    assert normalizer.normalize('', *groups) == expected, (language, groups)
+                    text = f'{hour}:{minute:02d} {spelling}'.strip()
+                    if pattern.match(text):  # not every language accepts A.M.
+                        assert normalizer.normalize(text) == expected, (language, text)
+
+    # Seconds are composed on top of the table
+    for text, parts in [
+        ('10:30:15', (10, 30, 15, None)),
+        ('9:05:59 p.m.', (9, 5, 59, 'PM')),
+        ('07:00:00 A.M.', (7, 0, 0, 'AM')),
+        ('23:59:01', (23, 59, 1, None)),
+    ]:
+        expected = normalizer._compose(*parts)
+        hour, minute, second = text.split()[0].split(':')
+        period = text.split()[1] if ' ' in text else None
+        assert normalizer.normalize('', hour, minute, second, period) == expected, text
+    print(f"{language}: {len(normalizer._table)} HH:MM forms match _compose")
+
+
+def _release():
+    """Edited resources only show up after the shared converter is released."""
+    resources = language_pack.load('hi-IN')
+    edited = json.loads(json.dumps(resources))
+    edited['time']['hour_marker'] = 'बजे (edited)'
+    NumberToWordsConverter.release('hi-IN')
+    try:
+        original = TimeNormalizer(resources)
+        assert original.normalize('10:00') == 'दस बजे'
+        # Same converter: the cached table still holds the old marker
+        assert TimeNormalizer(edited).normalize('10:00') == 'दस बजे'
+
+        NumberToWordsConverter.release('hi-IN')
+        rebuilt = TimeNormalizer(edited)
+        assert rebuilt.converter is not original.converter
+        assert rebuilt.normalize('10:00') == 'दस बजे (edited)'
+        assert rebuilt.normalize('10:30') == original.normalize('10:30')
+    finally:
+        NumberToWordsConverter.release('hi-IN')
+    print("release(): a rebuilt table picks up the edited hour marker")
 
 
 def run():
@@ -21,6 +83,10 @@ def run():
             engine.normalize(text, ['time']),
         )
 
+    for language in language_pack.available_languages():
+        _tables(language)
+    _release()
+
     print("✅ Time tests passed!")
 
 
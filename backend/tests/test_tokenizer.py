@@ -0,0 +1,45 @@
+"""Offset-preserving tokenizer and rebuild tests."""
+
+from helpers import get_engine, ALL_CATEGORIES
+from engine.tokenizer import iter_spans, tokenize, rebuild
+
+
+def run():
+    engine = get_engine()
+
+    print("\n" + "─"*70)
+    print("  TOKENIZER / OFFSET TESTS")
+    print("─"*70)
+
+    for text in [
+        "मेरे पास ₹500 हैं",
+        "  दो   स्पेस\tऔर\nनई पंक्ति  ",
+        "",
+    ]:
+        words, spans = tokenize(text)
+        assert words == text.split(), (words, text.split())
+        assert spans == list(iter_spans(text))
+        assert all(text[s:e] == w for w, (s, e) in zip(words, spans))
+        print(f"Input: {text!r}")
+        print(f"  Spans: {spans}")
+
+    text = "a  bb\tc"
+    assert rebuild(text, []) == text
+    assert rebuild(text, [(3, 5, 'X')]) == "a  X\tc"
+    assert rebuild(text, [(0, 1, 'Y'), (6, 7, 'Z')]) == "Y  bb\tZ"
+
+    text = "समय:  10:30 PM\n₹500   दिए"
+    result = engine.normalize(text, ALL_CATEGORIES)
+    print(f"\nInput:      {text!r}")
+    print(f"Normalized: {result['normalized_text']!r}")
+    for dfa in result['dfa_info']:
+        print(f"  - {dfa['category'].upper()}: {text[dfa['start']:dfa['end']]!r}"
+              f" [{dfa['start']}:{dfa['end']}]")
+    assert '\n' in result['normalized_text']
+    assert 'PM' not in result['normalized_text']
+
+    print("✅ Tokenizer tests passed!")
+
+
+if __name__ == '__main__':
+    run()